@@ -6,6 +6,9 @@ from enemies import Enemy
 from towers import Tower
 from projectiles import Projectile
 from game_systems import Map, WaveManager, UIManager, TowerManager
+from game_systems.status_effects import get_status_effects
+from game_systems.events import EventBus, DAMAGE, credit_damage
+from game_systems.simulation_context import SimulationContext, set_context
 from game_systems.tower_upgrade_system import TowerUpgradeSystem
 from game_systems.upgrade_ui import UpgradeUI
 
@@ -55,6 +58,11 @@ class Game:
         self.tower_manager.set_current_wave(1)
         self.ui_manager = UIManager(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.tower_manager)
         self.upgrade_system = TowerUpgradeSystem()
+        
+        # Towers report direct damage on the event bus, credited once per frame
+        self.events = EventBus()
+        self.events.subscribe(DAMAGE, credit_damage)
+        set_context(SimulationContext(events=self.events))
         self.upgrade_ui = UpgradeUI(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         
         # UI state
@@ -220,18 +228,12 @@ class Game:
         """Update all enemies"""
         enemies_to_add = []
         
+        # Burn and poison damage
+        get_status_effects().update()
+        
         for enemy in self.enemies[:]:
             enemy.update()
             
-            # Handle poison effects
-            if hasattr(enemy, 'poison_timer') and enemy.poison_timer > 0:
-                enemy.poison_timer -= 1
-                if hasattr(enemy, 'poison_damage_timer'):
-                    enemy.poison_damage_timer += 1
-                    if enemy.poison_damage_timer >= 60:  # Every second
-                        enemy.take_damage(enemy.poison_damage)
-                        enemy.poison_damage_timer = 0
-            
             # Handle boss minion spawning (while boss is alive)
             if hasattr(enemy, 'should_spawn_minions') and enemy.should_spawn_minions():
                 minion_count = enemy.get_minion_count()
@@ -269,16 +271,10 @@ class Game:
     def update_towers(self):
         """Update all towers"""
         for tower in self.towers:
-            # Track damage before update
-            previous_damage = tower.total_damage_dealt
-            
             tower.update(self.enemies, self.projectiles)
-            
-            # Check if tower dealt damage directly (not through projectiles)
-            damage_this_frame = tower.total_damage_dealt - previous_damage
-            if damage_this_frame > 0:
-                # Use centralized currency generation (already includes 5/100 nerf)
-                tower.track_damage_and_generate_currency(damage_this_frame)
+        
+        # Credit the damage towers dealt directly (not through projectiles)
+        self.events.dispatch()
     
     def update_projectiles(self):
         """Update all projectiles"""
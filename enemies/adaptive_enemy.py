@@ -2,15 +2,17 @@ from typing import List, Tuple
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class AdaptiveEnemy(Enemy):
     """Adaptive enemy that changes camouflage - only vulnerable to sniper and ice towers"""
+    __slots__ = ('adaptation_timer', 'adaptation_interval', 'current_adaptation', 'adaptation_particles',
+                 'camouflage_cycle', 'adaptations', 'vulnerable_to')
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 45
         self.health = self.max_health
-        self.speed = 1.1
+        self.set_base_speed(1.1)
         self.reward = 60
         self.size = 16
         self.color = (128, 128, 128)  # Base gray
@@ -56,40 +58,52 @@ class AdaptiveEnemy(Enemy):
     
     def create_adaptation_reflection(self):
         """Create reflection effect when adapted against an attack"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         current_adapt = self.adaptations[self.current_adaptation]
         for _ in range(6):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 6)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(3, 6)
             particle = {
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(15, 25),
+                'life': rng.randint(15, 25),
                 'color': current_adapt['color']
             }
             self.adaptation_particles.append(particle)
     
     def create_damage_particles(self):
         """Create damage effect when successfully hit"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(4):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 4)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 4)
             particle = {
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(10, 20),
+                'life': rng.randint(10, 20),
                 'color': (255, 255, 255)  # White damage particles
             }
             self.adaptation_particles.append(particle)
     
     def create_adaptation_change_effect(self):
         """Create visual effect when changing adaptations"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(12):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(4, 8)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(4, 8)
             old_color = self.adaptations[self.current_adaptation]['color']
             new_color = self.adaptations[(self.current_adaptation + 1) % len(self.adaptations)]['color']
             
@@ -98,8 +112,8 @@ class AdaptiveEnemy(Enemy):
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(20, 35),
-                'color': random.choice([old_color, new_color])
+                'life': rng.randint(20, 35),
+                'color': rng.choice([old_color, new_color])
             }
             self.adaptation_particles.append(particle)
     
@@ -1,22 +1,23 @@
 from typing import List, Tuple
 from .enemy import Enemy
+from .immunities import BASIC
 import pygame
 import math
 
 class ArmoredEnemy(Enemy):
     """Heavily armored enemy immune to basic tower damage"""
+    __slots__ = ('armor_thickness', 'armor_segments')
+    granted_immunities = BASIC  # Always immune to basic towers
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 18
         self.health = self.max_health
-        self.speed = 0.8
+        self.set_base_speed(0.8)
         self.reward = 15
         self.size = 11
         self.color = (120, 120, 120)  # Steel gray
         
-        # Force immunity to basic towers
-        self.immunities['basic_immune'] = True
-        
         # Armor properties
         self.armor_thickness = 3
         self.armor_segments = 6
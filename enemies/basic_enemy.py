@@ -3,11 +3,13 @@ from .enemy import Enemy
 
 class BasicEnemy(Enemy):
     """Basic enemy with standard stats"""
+    __slots__ = ()
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 1
         self.health = self.max_health
-        self.speed = 1.0
+        self.set_base_speed(1.0)
         self.reward = 4
         self.size = 8
         self.color = (255, 100, 100)  # Light red 
\ No newline at end of file
@@ -1,24 +1,23 @@
 from typing import List, Tuple
 from .enemy import Enemy
+from .immunities import EXPLOSIVE, CANNON, MISSILE
 import pygame
 import math
 
 class BlastProofEnemy(Enemy):
     """Heavily reinforced enemy immune to explosive damage"""
+    __slots__ = ('armor_timer', 'armor_plates', 'blast_deflector_angle')
+    granted_immunities = EXPLOSIVE | CANNON | MISSILE  # Always immune to explosive, cannon and missile towers
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 25
         self.health = self.max_health
-        self.speed = 0.7
+        self.set_base_speed(0.7)
         self.reward = 25
         self.size = 13
         self.color = (64, 64, 64)  # Dark gray
         
-        # Force immunity to explosive towers
-        self.immunities['explosive_immune'] = True
-        self.immunities['cannon_immune'] = True  # Also immune to cannon
-        self.immunities['missile_immune'] = True  # Also immune to missiles
-        
         # Blast-proof properties
         self.armor_timer = 0
         self.armor_plates = 8
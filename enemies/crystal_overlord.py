@@ -1,16 +1,18 @@
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class CrystalOverlord(Enemy):
     """Ultra powerful crystalline boss that reflects attacks and creates crystal structures"""
+    __slots__ = ('reflection_chance', 'barrier_timer', 'barrier_cooldown', 'active_barriers',
+                 'shard_timer', 'shard_cooldown', 'active_shards', 'damage_reduction', 'phase',
+                 'max_phases', 'crystal_particles', 'rotation')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 5500
         self.max_health = 5500
-        self.speed = 0.3
+        self.set_base_speed(0.3)
         self.reward = 950
         self.color = (100, 255, 255)  # Cyan crystal
         self.size = 38
@@ -77,7 +79,8 @@ class CrystalOverlord(Enemy):
             return 0
         
         # Reflection chance
-        if random.random() < self.reflection_chance:
+        from game_systems.rng import get_simulation_rng
+        if get_simulation_rng().random() < self.reflection_chance:
             return -damage * 1.5  # Reflect with bonus damage
         
         # Apply damage reduction
@@ -2,15 +2,16 @@ from typing import List, Tuple
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class CrystallineEnemy(Enemy):
     """Crystal enemy that reflects all attacks except laser beams"""
+    __slots__ = ('crystal_faces', 'rotation', 'reflection_particles', 'crystal_immunities')
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 40
         self.health = self.max_health
-        self.speed = 0.9
+        self.set_base_speed(0.9)
         self.reward = 40
         self.size = 13
         self.color = (200, 255, 255)  # Crystal blue
@@ -42,30 +43,38 @@ class CrystallineEnemy(Enemy):
     
     def create_reflection_particles(self):
         """Create reflection effect when attacked by non-laser weapons"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(5):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 6)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(3, 6)
             particle = {
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(15, 25),
+                'life': rng.randint(15, 25),
                 'color': (255, 255, 255)
             }
             self.reflection_particles.append(particle)
     
     def create_shatter_particles(self):
         """Create crystal shatter effect when damaged by laser"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(3):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 4)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 4)
             particle = {
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(10, 20),
+                'life': rng.randint(10, 20),
                 'color': (200, 255, 255)
             }
             self.reflection_particles.append(particle)
@@ -2,20 +2,31 @@ import pygame
 import math
 from typing import List, Tuple
 from config.game_config import get_balance_config
+from .immunities import EFFECT_BITS, FREEZE, WET, POISON, immunity_names, roll_immunities
 
 class Enemy:
     """Base class for all enemies"""
+    __slots__ = ('path', 'path_geometry', 'path_index', 'x', 'y', 'wave_number', 'max_health', 'health',
+                 'base_speed', 'speed', 'reward', 'size', 'color', 'frozen', 'freeze_timer', 'wet',
+                 'wet_timer', 'lightning_damage_multiplier', 'immunity_mask', 'reached_end',
+                 'distance_traveled', 'path_offset_x', 'path_offset_y', 'offset_fade_start',
+                 'offset_fade_end', 'map_reference', 'detected_by_detector')
+    granted_immunities = 0  # Immunity bits every enemy of the class has, on top of the random rolls
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
+        from game_systems.path_geometry import get_path_geometry
+        
         self.path = path
+        self.path_geometry = get_path_geometry(path)
         self.path_index = 0
         self.x = float(path[0][0])
         self.y = float(path[0][1])
         self.wave_number = wave_number
         
-        # Base stats - to be overridden by subclasses
+        # Base stats - to be overridden by subclasses (speed via set_base_speed)
         self.max_health = 1
         self.health = self.max_health
-        self.base_speed = 1.0  # Store original speed for terrain effects
+        self.base_speed = 1.0  # Original speed that terrain effects scale
         self.speed = 1.0
         self.reward = 4
         self.size = 10
@@ -27,69 +38,41 @@ class Enemy:
         self.wet = False
         self.wet_timer = 0
         self.lightning_damage_multiplier = 1.0
+        self.detected_by_detector = False
+        # Burn, poison and counter popups are tracked by game_systems.status_effects
         
-        # Progressive immunity system
-        self.immunities = self._generate_random_immunities()
+        # Progressive immunity system (bitmask of effect bits from enemies.immunities)
+        self.immunity_mask = self._generate_random_immunities() | self.granted_immunities
         
         # State
         self.reached_end = False
-        self.distance_traveled = 0
+        self.distance_traveled = 0  # Exact arc length along the path - position is derived from it
+        
+        # Displacement from the path (spawned minions, splits) that fades out by the next waypoint
+        self.path_offset_x = 0.0
+        self.path_offset_y = 0.0
+        self.offset_fade_start = 0.0
+        self.offset_fade_end = 0.0
         
         # Map reference for terrain effects
         self.map_reference = None
     
-    def _generate_random_immunities(self) -> dict:
-        """Generate random immunities based on wave progression using config values"""
-        import random
-        
-        immunities = {
-            'freeze_immune': False,
-            'slow_immune': False,
-            'poison_immune': False,
-            'burn_immune': False,
-            'wet_immune': False,
-            'stun_immune': False
-        }
-        
-        # Get immunity configuration
-        config = get_balance_config()
-        immunity_config = config['immunity']
-        
-        # Calculate immunity chances based on wave number using config
-        base_chance = min(immunity_config['max_immunity_chance'], 
-                         self.wave_number * immunity_config['base_chance_per_wave'])
-        
-        # Special waves have higher immunity chances using config multipliers
-        if self.wave_number % 10 == 0:  # Boss waves
-            base_chance *= immunity_config['boss_wave_multiplier']
-        elif self.wave_number % 5 == 0:  # Mini-boss waves
-            base_chance *= immunity_config['mini_boss_multiplier']
-        
-        # Randomly assign immunities
-        for immunity_type in immunities:
-            if random.random() < base_chance:
-                immunities[immunity_type] = True
-        
-        # Ensure at least some enemies remain vulnerable early game using config
-        if self.wave_number <= immunity_config['early_game_waves']:
-            # Force at most max_immunities for early waves
-            immune_count = sum(immunities.values())
-            max_immunities = immunity_config['early_game_max_immunities']
-            if immune_count > max_immunities:
-                # Keep only max_immunities random immunities
-                immune_types = [k for k, v in immunities.items() if v]
-                keep_immunities = random.sample(immune_types, max_immunities)
-                immunities = {k: (k in keep_immunities) for k in immunities}
-        
-        return immunities
+    def _generate_random_immunities(self) -> int:
+        """Roll random immunities for this enemy's wave (as an immunity bitmask)"""
+        from game_systems.rng import get_simulation_rng
+        return roll_immunities(self.wave_number, get_simulation_rng())
     
     def is_immune_to(self, effect_type: str) -> bool:
         """Check if enemy is immune to a specific effect"""
-        return self.immunities.get(f"{effect_type}_immune", False)
+        return bool(self.immunity_mask & EFFECT_BITS.get(effect_type, 0))
     
     def has_resistance_to(self, effect_type: str) -> bool:
         """Check if enemy has resistance to a specific effect (same as immunity for now)"""
-        return self.immunities.get(f"{effect_type}_immune", False)
+        return bool(self.immunity_mask & EFFECT_BITS.get(effect_type, 0))
+    
+    def on_spawn(self):
+        """Per-spawn setup for enemies cloned by the enemy factory (constructors run it themselves)"""
+        pass
     
     def set_map_reference(self, map_obj):
         """Set reference to map for terrain effects"""
@@ -100,55 +83,31 @@ class Enemy:
         self.base_speed = speed
         self.speed = speed
     
-    def __setattr__(self, name, value):
-        """Override to automatically update base_speed when speed is set during initialization"""
-        super().__setattr__(name, value)
-        # If setting speed and we don't have terrain effects applied yet, also set base_speed
-        if name == 'speed' and hasattr(self, 'base_speed') and not hasattr(self, '_speed_initialized'):
-            self.base_speed = value
-            self._speed_initialized = True
-    
     def apply_terrain_speed_effects(self):
         """Apply terrain-based speed modifications"""
         if not self.map_reference:
             return
         
-        from game_systems.terrain_types import get_terrain_property, SAND
-        
-        # Get terrain at current position
-        terrain_type = self.map_reference.get_terrain_at_pixel(int(self.x), int(self.y))
-        
-        # Reset speed to base (accounting for other effects like freeze)
-        if not self.frozen:
-            self.speed = self.base_speed
-        
-        # Apply terrain effects
-        if terrain_type == SAND:
-            # Sand increases enemy speed by 50%
-            speed_multiplier = 1.5
-            if self.frozen:
-                # If frozen, apply both freeze and sand effects
-                config = get_balance_config()
-                if self.has_resistance_to('freeze'):
-                    # Resistant enemies get less slow effect
-                    freeze_factor = config['freeze']['resistance_slow_factor']
-                else:
-                    # Normal enemies get full slow effect
-                    freeze_factor = config['freeze']['slow_factor']
-                self.speed = self.base_speed * speed_multiplier * freeze_factor
+        # Terrain under the enemy (sand speeds it up by 50%): looked up from its path progress,
+        # or from its grid cell while it is displaced from the path
+        if self.path_offset_x or self.path_offset_y:
+            speed_multiplier = self.map_reference.terrain_speed_at(self.x, self.y)
+        else:
+            speed_multiplier = self.map_reference.path_terrain(self.path_geometry).multiplier_at(
+                self.distance_traveled, self.path_index)
+        
+        if self.frozen:
+            # If frozen, apply both freeze and terrain effects
+            config = get_balance_config()
+            if self.immunity_mask & FREEZE:
+                # Resistant enemies get less slow effect
+                freeze_factor = config['freeze']['resistance_slow_factor']
             else:
-                self.speed = self.base_speed * speed_multiplier
+                # Normal enemies get full slow effect
+                freeze_factor = config['freeze']['slow_factor']
+            self.speed = self.base_speed * speed_multiplier * freeze_factor
         else:
-            # Handle freeze on non-sand terrain
-            if self.frozen:
-                config = get_balance_config()
-                if self.has_resistance_to('freeze'):
-                    # Resistant enemies get less slow effect
-                    freeze_factor = config['freeze']['resistance_slow_factor']
-                else:
-                    # Normal enemies get full slow effect
-                    freeze_factor = config['freeze']['slow_factor']
-                self.speed = self.base_speed * freeze_factor
+            self.speed = self.base_speed * speed_multiplier
     
     def update(self):
         """Update enemy position and state"""
@@ -159,24 +118,17 @@ class Enemy:
                 self.frozen = False
         
         # Handle wet effect (if not immune)
-        if self.wet and not self.is_immune_to('wet'):
+        if self.wet and not self.immunity_mask & WET:
             self.wet_timer -= 1
             if self.wet_timer <= 0:
                 self.wet = False
                 self.lightning_damage_multiplier = 1.0
-        elif self.is_immune_to('wet'):
+        elif self.immunity_mask & WET:
             # Immune enemies can't be wet
             self.wet = False
             self.wet_timer = 0
             self.lightning_damage_multiplier = 1.0
         
-        # Update counter effects
-        if hasattr(self, 'counter_effects'):
-            for effect in self.counter_effects[:]:
-                effect['timer'] -= 1
-                if effect['timer'] <= 0:
-                    self.counter_effects.remove(effect)
-        
         # Apply terrain-based speed effects (handles freeze interactions)
         self.apply_terrain_speed_effects()
         
@@ -192,24 +144,17 @@ class Enemy:
                 self.frozen = False
         
         # Handle wet effect (if not immune) - adjust timer based on speed
-        if self.wet and not self.is_immune_to('wet'):
+        if self.wet and not self.immunity_mask & WET:
             self.wet_timer -= speed_multiplier
             if self.wet_timer <= 0:
                 self.wet = False
                 self.lightning_damage_multiplier = 1.0
-        elif self.is_immune_to('wet'):
+        elif self.immunity_mask & WET:
             # Immune enemies can't be wet
             self.wet = False
             self.wet_timer = 0
             self.lightning_damage_multiplier = 1.0
         
-        # Update counter effects with speed adjustment
-        if hasattr(self, 'counter_effects'):
-            for effect in self.counter_effects[:]:
-                effect['timer'] -= speed_multiplier
-                if effect['timer'] <= 0:
-                    self.counter_effects.remove(effect)
-        
         # Apply terrain-based speed effects (handles freeze interactions)
         self.apply_terrain_speed_effects()
         
@@ -229,75 +174,53 @@ class Enemy:
             # Restore original speed
             self.speed = original_speed
     
+    def set_path_progress(self, distance: float, offset_x: float = 0.0, offset_y: float = 0.0):
+        """Place the enemy at a distance along the path, optionally displaced by an offset
+        that fades out by the time it reaches the next waypoint"""
+        geometry = self.path_geometry
+        self.distance_traveled = max(0.0, min(distance, geometry.total_length))
+        path_x, path_y, self.path_index = geometry.position_at(self.distance_traveled)
+        
+        self.path_offset_x = offset_x
+        self.path_offset_y = offset_y
+        self.offset_fade_start = self.distance_traveled
+        self.offset_fade_end = geometry.cumulative_lengths[min(self.path_index + 1, geometry.last_index)]
+        
+        self.x = path_x + offset_x
+        self.y = path_y + offset_y
+    
     def move_along_path(self):
         """Move the enemy along the predefined path"""
         if self.path_index >= len(self.path) - 1:
             self.reached_end = True
             return
         
-        # Get next waypoint
-        next_point = self.path[self.path_index + 1]
-        
-        # Calculate direction from current position to next waypoint
-        # This handles enemies that are offset from the path (like split enemies)
-        dx = next_point[0] - self.x
-        dy = next_point[1] - self.y
-        distance_to_next = math.sqrt(dx**2 + dy**2)
-        
-        if distance_to_next == 0:
-            self.path_index += 1
-            return
-        
-        # Check if we've reached or passed the next waypoint (adaptive threshold based on speed)
-        # Use larger threshold for fast enemies to prevent overshooting
-        detection_threshold = max(5, self.speed * 1.5)
-        
-        if distance_to_next < detection_threshold:
-            # Snap to waypoint to ensure exact path following
-            self.x = float(next_point[0])
-            self.y = float(next_point[1])
-            self.path_index += 1
-            return
-        
-        # Normalize direction and apply speed
-        dx = (dx / distance_to_next) * self.speed
-        dy = (dy / distance_to_next) * self.speed
+        # Progress is a single scalar; the position is looked up from the precomputed path
+        geometry = self.path_geometry
+        self.distance_traveled = min(self.distance_traveled + self.speed, geometry.total_length)
+        path_x, path_y, self.path_index = geometry.position_at(self.distance_traveled, self.path_index)
+        
+        if self.path_offset_x or self.path_offset_y:
+            # Blend offset enemies back onto the path by the next waypoint
+            remaining = self.offset_fade_end - self.distance_traveled
+            fade_length = self.offset_fade_end - self.offset_fade_start
+            if remaining > 0 and fade_length > 0:
+                fade = remaining / fade_length
+                path_x += self.path_offset_x * fade
+                path_y += self.path_offset_y * fade
+            else:
+                self.path_offset_x = 0.0
+                self.path_offset_y = 0.0
         
-        # Move towards next waypoint
-        self.x += dx
-        self.y += dy
-        self.distance_traveled += self.speed
+        self.x = path_x
+        self.y = path_y
     
     def take_damage(self, damage: int, tower_type: str = 'basic'):
         """Apply damage to the enemy with counter system multipliers"""
-        # Get counter system configuration
-        config = get_balance_config()
-        counter_config = config.get('counter_system', {})
-        multipliers = counter_config.get('tower_enemy_multipliers', {})
-        default_multiplier = counter_config.get('default_multiplier', 1.0)
-        max_multiplier = counter_config.get('max_multiplier', 3.0)
-        min_multiplier = counter_config.get('min_multiplier', 0.1)
-        
-        # Calculate damage multiplier
-        damage_multiplier = default_multiplier
-        
-        # Get enemy class name
-        enemy_class = self.__class__.__name__
-        
-        # Check for tower-specific multipliers
-        if tower_type in multipliers:
-            tower_multipliers = multipliers[tower_type]
-            
-            # Direct enemy type match
-            if enemy_class in tower_multipliers:
-                damage_multiplier = tower_multipliers[enemy_class]
-            
-            # Special case: Lightning towers do extra damage to wet enemies
-            elif tower_type == 'lightning' and self.wet and 'wet_enemies' in tower_multipliers:
-                damage_multiplier = tower_multipliers['wet_enemies']
-        
-        # Clamp multiplier to acceptable range
-        damage_multiplier = max(min_multiplier, min(max_multiplier, damage_multiplier))
+        from game_systems.damage_table import get_damage_table
+
+        # Clamped counter multiplier (lightning vs wet included) from the compiled table
+        damage_multiplier = get_damage_table().multiplier(tower_type, self.__class__, self.wet)
         
         # Apply multiplier to damage
         modified_damage = int(damage * damage_multiplier)
@@ -318,26 +241,14 @@ class Enemy:
     
     def _show_counter_effect(self, effectiveness_type: str):
         """Show visual feedback for counter effectiveness"""
-        # This creates a temporary visual effect that can be displayed
-        # The actual visual implementation would be handled by the game's effect system
-        import time
-        
-        if not hasattr(self, 'counter_effects'):
-            self.counter_effects = []
-        
-        effect = {
-            'type': effectiveness_type,
-            'timer': 30,  # 0.5 seconds at 60 FPS
-            'created_at': time.time()
-        }
-        
-        self.counter_effects.append(effect)
+        from game_systems.status_effects import get_status_effects
+        get_status_effects().show_counter_effect(self, effectiveness_type)
     
     def apply_freeze(self, duration: int):
         """Apply freeze effect to the enemy with resistance reducing duration and effectiveness"""
         config = get_balance_config()
         
-        if self.has_resistance_to('freeze'):
+        if self.immunity_mask & FREEZE:
             # Resistant enemies get reduced duration
             reduced_duration = int(duration * config['freeze']['resistance_duration_multiplier'])
             self.frozen = True
@@ -350,7 +261,7 @@ class Enemy:
     
     def apply_wet_status(self, duration: int, lightning_multiplier: float):
         """Apply wet status to the enemy (if not immune)"""
-        if not self.is_immune_to('wet'):
+        if not self.immunity_mask & WET:
             self.wet = True
             self.wet_timer = max(self.wet_timer, duration)
             self.lightning_damage_multiplier = lightning_multiplier
@@ -376,6 +287,9 @@ class Enemy:
     
     def draw(self, screen: pygame.Surface):
         """Draw the enemy on the screen"""
+        from game_systems.status_effects import get_status_effects
+        poisoned = get_status_effects().is_active(self, POISON)
+
         # Draw main enemy circle with status effects
         color = self.color
         if self.frozen:
@@ -383,14 +297,14 @@ class Enemy:
         elif self.wet:
             # Slightly darker and more saturated when wet
             color = tuple(max(0, min(255, int(c * 0.8))) for c in self.color)
-        elif hasattr(self, 'poison_timer') and self.poison_timer > 0:
+        elif poisoned:
             # Green tint when poisoned
             color = tuple(max(0, min(255, int(c * 0.7) + 40 if i == 1 else int(c * 0.7))) for i, c in enumerate(self.color))
         
         pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
         
         # Draw poison effect overlay
-        if hasattr(self, 'poison_timer') and self.poison_timer > 0:
+        if poisoned:
             # Draw poison bubbles around enemy
             bubble_count = 4
             for i in range(bubble_count):
@@ -422,7 +336,7 @@ class Enemy:
     
     def _draw_immunity_indicators(self, screen: pygame.Surface):
         """Draw small indicators for resistances (formerly immunities)"""
-        resistant_effects = [k.replace('_immune', '') for k, v in self.immunities.items() if v]
+        resistant_effects = immunity_names(self.immunity_mask)
         
         if not resistant_effects:
             return
@@ -451,12 +365,14 @@ class Enemy:
     
     def _draw_counter_effects(self, screen: pygame.Surface):
         """Draw visual feedback for counter effectiveness"""
-        if not hasattr(self, 'counter_effects') or not self.counter_effects:
+        from game_systems.status_effects import get_status_effects
+        counter_effects = get_status_effects().counter_effects_of(self)
+        if not counter_effects:
             return
         
         font = pygame.font.Font(None, 16)
         
-        for i, effect in enumerate(self.counter_effects):
+        for i, effect in enumerate(counter_effects):
             # Calculate position (stack multiple effects)
             effect_x = int(self.x)
             effect_y = int(self.y - self.size - 20 - (i * 15))
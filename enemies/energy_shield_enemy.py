@@ -1,22 +1,23 @@
 from typing import List, Tuple
 from .enemy import Enemy
+from .immunities import LASER
 import pygame
 import math
 
 class EnergyShieldEnemy(Enemy):
     """Enemy with energy shields immune to laser damage"""
+    __slots__ = ('shield_pulse_timer', 'shield_radius')
+    granted_immunities = LASER  # Always immune to laser towers
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 15
         self.health = self.max_health
-        self.speed = 1.2
+        self.set_base_speed(1.2)
         self.reward = 18
         self.size = 10
         self.color = (0, 255, 255)  # Cyan
         
-        # Force immunity to laser towers
-        self.immunities['laser_immune'] = True
-        
         # Shield properties
         self.shield_pulse_timer = 0
         self.shield_radius = 15
@@ -3,11 +3,13 @@ from .enemy import Enemy
 
 class FastEnemy(Enemy):
     """Fast enemy with high speed but low health"""
+    __slots__ = ()
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 1.5
         self.health = self.max_health
-        self.speed = 2.5
+        self.set_base_speed(2.5)
         self.reward = 6
         self.size = 6
         self.color = (255, 255, 0)  # Yellow
@@ -1,23 +1,23 @@
 from typing import List, Tuple
 from .enemy import Enemy
+from .immunities import FLAME
 import pygame
 import math
-import random
 
 class FireElementalEnemy(Enemy):
     """Fire elemental enemy immune to flame damage"""
+    __slots__ = ('flame_timer', 'flame_particles', 'heat_intensity')
+    granted_immunities = FLAME  # Always immune to flame towers
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 25
         self.health = self.max_health
-        self.speed = 1.3
+        self.set_base_speed(1.3)
         self.reward = 20
         self.size = 10
         self.color = (255, 100, 0)  # Orange-red
         
-        # Force immunity to flame towers
-        self.immunities['flame_immune'] = True
-        
         # Fire properties
         self.flame_timer = 0
         self.flame_particles = []
@@ -44,15 +44,20 @@ class FireElementalEnemy(Enemy):
         super().update()
         self.flame_timer += 0.3
         
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Generate flame particles
         if len(self.flame_particles) < 15:
             for _ in range(2):
                 particle = {
-                    'x': self.x + random.uniform(-5, 5),
-                    'y': self.y + random.uniform(-5, 5),
-                    'life': random.uniform(10, 20),
+                    'x': self.x + rng.uniform(-5, 5),
+                    'y': self.y + rng.uniform(-5, 5),
+                    'life': rng.uniform(10, 20),
                     'max_life': 20,
-                    'size': random.uniform(2, 4)
+                    'size': rng.uniform(2, 4)
                 }
                 self.flame_particles.append(particle)
         
@@ -60,7 +65,7 @@ class FireElementalEnemy(Enemy):
         for particle in self.flame_particles[:]:
             particle['life'] -= 1
             particle['y'] -= 1  # Rise up
-            particle['x'] += random.uniform(-0.5, 0.5)  # Flicker
+            particle['x'] += rng.uniform(-0.5, 0.5)  # Flicker
             
             if particle['life'] <= 0:
                 self.flame_particles.remove(particle)
@@ -4,12 +4,13 @@ import math
 
 class FlyingEnemy(Enemy):
     """Enemy that flies and can only be hit by anti-air towers"""
+    __slots__ = ('flying', 'hover_offset')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 10
         self.max_health = 10
-        self.speed = 2.0
+        self.set_base_speed(2.0)
         self.reward = 10
         self.color = (255, 165, 0)  # Orange
         self.flying = True
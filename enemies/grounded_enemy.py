@@ -1,22 +1,23 @@
 from typing import List, Tuple
 from .enemy import Enemy
+from .immunities import LIGHTNING
 import pygame
 import math
 
 class GroundedEnemy(Enemy):
     """Electrically grounded enemy immune to lightning damage"""
+    __slots__ = ('spark_timer', 'ground_spikes')
+    granted_immunities = LIGHTNING  # Always immune to lightning towers
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 20
         self.health = self.max_health
-        self.speed = 0.9
+        self.set_base_speed(0.9)
         self.reward = 16
         self.size = 12
         self.color = (139, 69, 19)  # Brown/earthy
         
-        # Force immunity to lightning towers
-        self.immunities['lightning_immune'] = True
-        
         # Grounding properties
         self.spark_timer = 0
         self.ground_spikes = 8
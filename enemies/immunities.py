@@ -0,0 +1,92 @@
+"""Enemy immunities as an integer bitmask.
+
+Each effect an enemy can be immune to has a bit; an enemy's immunities are
+the OR of its bits, so checks are a single AND instead of formatting a
+'<effect>_immune' key and probing a dict.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from config.game_config import get_balance_config
+
+# Effects rolled randomly per wave (order matters - it fixes the RNG draws)
+FREEZE = 1 << 0
+SLOW = 1 << 1
+POISON = 1 << 2
+BURN = 1 << 3
+WET = 1 << 4
+STUN = 1 << 5
+
+# Tower immunities granted by specific enemy types
+EXPLOSIVE = 1 << 6
+CANNON = 1 << 7
+MISSILE = 1 << 8
+LASER = 1 << 9
+LIGHTNING = 1 << 10
+BASIC = 1 << 11
+FLAME = 1 << 12
+SNIPER = 1 << 13
+
+EFFECT_BITS: Dict[str, int] = {
+    'freeze': FREEZE, 'slow': SLOW, 'poison': POISON, 'burn': BURN, 'wet': WET, 'stun': STUN,
+    'explosive': EXPLOSIVE, 'cannon': CANNON, 'missile': MISSILE, 'laser': LASER,
+    'lightning': LIGHTNING, 'basic': BASIC, 'flame': FLAME, 'sniper': SNIPER,
+}
+
+RANDOM_IMMUNITIES: Tuple[int, ...] = (FREEZE, SLOW, POISON, BURN, WET, STUN)
+
+
+def effect_bit(effect_type: str) -> int:
+    """Get the bit for an effect name (0 for effects nothing can be immune to)"""
+    return EFFECT_BITS.get(effect_type, 0)
+
+
+def immunity_names(mask: int) -> List[str]:
+    """Get the effect names set in a mask"""
+    return [name for name, bit in EFFECT_BITS.items() if mask & bit]
+
+
+# (chance per effect, max immunities or None) per wave, for the current config
+_wave_chances: Dict[int, Tuple[float, Optional[int]]] = {}
+_wave_chances_source = None
+
+
+def wave_immunity_chance(wave_number: int) -> Tuple[float, Optional[int]]:
+    """Get the (cached) per-effect immunity chance and immunity cap for a wave"""
+    global _wave_chances_source
+    immunity_config = get_balance_config()['immunity']
+    if immunity_config is not _wave_chances_source:
+        _wave_chances.clear()
+        _wave_chances_source = immunity_config
+
+    chances = _wave_chances.get(wave_number)
+    if chances is None:
+        chance = min(immunity_config['max_immunity_chance'],
+                     wave_number * immunity_config['base_chance_per_wave'])
+
+        # Special waves have higher immunity chances
+        if wave_number % 10 == 0:  # Boss waves
+            chance *= immunity_config['boss_wave_multiplier']
+        elif wave_number % 5 == 0:  # Mini-boss waves
+            chance *= immunity_config['mini_boss_multiplier']
+
+        # Keep enemies vulnerable early game
+        max_immunities = None
+        if wave_number <= immunity_config['early_game_waves']:
+            max_immunities = immunity_config['early_game_max_immunities']
+
+        chances = (chance, max_immunities)
+        _wave_chances[wave_number] = chances
+    return chances
+
+
+def roll_immunities(wave_number: int, rng) -> int:
+    """Roll a spawning enemy's random immunities for a wave"""
+    chance, max_immunities = wave_immunity_chance(wave_number)
+    rolled = [bit for bit in RANDOM_IMMUNITIES if rng.random() < chance]
+    if max_immunities is not None and len(rolled) > max_immunities:
+        rolled = rng.sample(rolled, max_immunities)
+
+    mask = 0
+    for bit in rolled:
+        mask |= bit
+    return mask
@@ -3,12 +3,13 @@ import pygame
 
 class InvisibleEnemy(Enemy):
     """Enemy that is invisible to most towers"""
+    __slots__ = ('invisible', 'detection_radius')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 60
         self.max_health = 60
-        self.speed = 1.5
+        self.set_base_speed(1.5)
         self.reward = 12
         self.color = (128, 128, 128, 100)  # Semi-transparent gray
         self.invisible = True
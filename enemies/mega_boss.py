@@ -5,12 +5,14 @@ import random
 
 class MegaBoss(Enemy):
     """Massive boss enemy with multiple phases and abilities"""
+    __slots__ = ('phase', 'max_phases', 'damage_reduction', 'ability_timer', 'ability_cooldown',
+                 'minion_spawn_timer', 'minion_spawn_cooldown', 'pulse_timer', 'aura_radius')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 2000
         self.max_health = 2000
-        self.speed = 0.5
+        self.set_base_speed(0.5)
         self.reward = 400
         self.color = (128, 0, 128)  # Purple
         self.size = 25
@@ -1,16 +1,21 @@
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class NecromancerBoss(Enemy):
     """Ultra powerful boss that manipulates death and undeath"""
+    __slots__ = ('resurrection_timer', 'resurrection_cooldown', 'resurrection_range', 'dead_enemies_list',
+                 'life_drain_timer', 'life_drain_cooldown', 'life_drain_range', 'life_drain_active',
+                 'life_drain_duration', 'death_aura_timer', 'death_aura_interval', 'death_aura_radius',
+                 'summon_timer', 'summon_cooldown', 'max_undead_minions', 'current_undead_count',
+                 'damage_reduction', 'poison_immunity', 'life_steal', 'phase', 'max_phases',
+                 'dark_particles', 'soul_orbs', 'aura_pulse', 'floating_offset')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 3500
         self.max_health = 3500
-        self.speed = 0.6
+        self.set_base_speed(0.6)
         self.reward = 750
         self.color = (139, 69, 19)  # Dark brown/black
         self.size = 32
@@ -148,11 +153,16 @@ class NecromancerBoss(Enemy):
         self.life_drain_duration = 120
         self.life_drain_timer = 0
         
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Create life drain effect
         for _ in range(15):
             particle = {
-                'x': self.x + random.uniform(-self.life_drain_range, self.life_drain_range),
-                'y': self.y + random.uniform(-self.life_drain_range, self.life_drain_range),
+                'x': self.x + rng.uniform(-self.life_drain_range, self.life_drain_range),
+                'y': self.y + rng.uniform(-self.life_drain_range, self.life_drain_range),
                 'vx': 0,
                 'vy': 0,
                 'life': 60,
@@ -187,16 +197,21 @@ class NecromancerBoss(Enemy):
         self.current_undead_count += 1
         self.summon_timer = 0
         
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Create summoning effect
-        summon_x = self.x + random.uniform(-50, 50)
-        summon_y = self.y + random.uniform(-50, 50)
+        summon_x = self.x + rng.uniform(-50, 50)
+        summon_y = self.y + rng.uniform(-50, 50)
         
         for _ in range(12):
             particle = {
                 'x': summon_x,
                 'y': summon_y,
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-3, 3),
+                'vx': rng.uniform(-3, 3),
+                'vy': rng.uniform(-3, 3),
                 'life': 45,
                 'max_life': 45,
                 'color': (75, 0, 130),  # Dark purple
@@ -239,15 +254,19 @@ class NecromancerBoss(Enemy):
     
     def update_soul_orbs(self):
         """Update floating soul orbs around boss"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         # Maintain 3-6 soul orbs based on phase
         target_orbs = 3 + self.phase
         
         while len(self.soul_orbs) < target_orbs:
             orb = {
-                'angle': random.uniform(0, 360),
-                'radius': self.size + random.uniform(20, 40),
-                'speed': random.uniform(0.5, 1.5),
-                'size': random.randint(3, 8),
+                'angle': rng.uniform(0, 360),
+                'radius': self.size + rng.uniform(20, 40),
+                'speed': rng.uniform(0.5, 1.5),
+                'size': rng.randint(3, 8),
                 'color': (100, 0, 100)
             }
             self.soul_orbs.append(orb)
@@ -260,12 +279,16 @@ class NecromancerBoss(Enemy):
     
     def create_resurrection_effect(self, x, y):
         """Create visual effect for resurrection"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(20):
             particle = {
-                'x': x + random.uniform(-20, 20),
-                'y': y + random.uniform(-20, 20),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-4, -1),  # Float upward
+                'x': x + rng.uniform(-20, 20),
+                'y': y + rng.uniform(-20, 20),
+                'vx': rng.uniform(-2, 2),
+                'vy': rng.uniform(-4, -1),  # Float upward
                 'life': 60,
                 'max_life': 60,
                 'color': (255, 255, 255),  # White for resurrection
@@ -1,22 +1,23 @@
 from typing import List, Tuple
 from .enemy import Enemy
+from .immunities import SNIPER
 import pygame
 import math
 
 class PhaseShiftEnemy(Enemy):
     """Phasing enemy immune to sniper tower precision shots"""
+    __slots__ = ('phase_timer', 'phase_state', 'phase_cycle_duration', 'phase_duration')
+    granted_immunities = SNIPER  # Always immune to sniper towers
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 20
         self.health = self.max_health
-        self.speed = 1.4
+        self.set_base_speed(1.4)
         self.reward = 22
         self.size = 9
         self.color = (128, 0, 128)  # Purple
         
-        # Force immunity to sniper towers
-        self.immunities['sniper_immune'] = True
-        
         # Phase properties
         self.phase_timer = 0
         self.phase_state = 0  # 0 = solid, 1 = phasing
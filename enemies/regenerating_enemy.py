@@ -3,39 +3,43 @@ import pygame
 
 class RegeneratingEnemy(Enemy):
     """Enemy that regenerates health over time"""
+    __slots__ = ('regen_rate', 'regen_timer', 'last_damage_time', 'regen_delay')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 30
         self.max_health = 80
-        self.speed = 1.0
+        self.set_base_speed(1.0)
         self.reward = 16
         self.color = (0, 255, 100)  # Light green
         self.regen_rate = 0.5  # Health per second
-        self.regen_timer = 0
-        self.last_damage_time = 0
+        self.regen_timer = 60  # Ticks between regeneration pulses
         self.regen_delay = 180  # 3 seconds before regen starts (60 FPS)
-        
-    def update(self):
-        """Update with regeneration logic"""
-        super().update()
-        
-        # Increment timers
-        self.regen_timer += 1
-        self.last_damage_time += 1
-        
-        # Regenerate health if not damaged recently
-        if (self.last_damage_time > self.regen_delay and 
-            self.health < self.max_health and 
-            self.regen_timer >= 60):  # Regen every second
-            
+        self.on_spawn()
+    
+    def on_spawn(self):
+        """Start the regeneration pulses, which run on the status-effect timing wheel"""
+        from game_systems.status_effects import get_status_effects
+        status_effects = get_status_effects()
+        self.last_damage_time = status_effects.now  # Wheel time of the last hit taken
+        status_effects.every(self, self.regen_timer, RegeneratingEnemy.regenerate)
+    
+    def is_regenerating(self) -> bool:
+        """Check if the enemy is hurt and has not been damaged recently"""
+        from game_systems.status_effects import get_status_effects
+        return (get_status_effects().now - self.last_damage_time > self.regen_delay and
+                self.health < self.max_health)
+    
+    def regenerate(self):
+        """Regeneration pulse (once per second)"""
+        if self.is_regenerating():
             self.health = min(self.max_health, self.health + self.regen_rate)
-            self.regen_timer = 0
     
     def take_damage(self, damage, tower_type: str = 'basic'):
         """Take damage and reset regeneration timer"""
+        from game_systems.status_effects import get_status_effects
         actual_damage = super().take_damage(damage)
-        self.last_damage_time = 0  # Reset damage timer
+        self.last_damage_time = get_status_effects().now  # Reset damage timer
         return actual_damage
         
     def draw(self, screen):
@@ -45,8 +49,7 @@ class RegeneratingEnemy(Enemy):
         pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), 10, 2)
         
         # Draw regeneration aura if regenerating
-        if (self.last_damage_time > self.regen_delay and 
-            self.health < self.max_health):
+        if self.is_regenerating():
             aura_color = (0, 255, 0, 50)
             pygame.draw.circle(screen, aura_color, (int(self.x), int(self.y)), 15, 3)
         
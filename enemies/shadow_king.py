@@ -1,16 +1,20 @@
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class ShadowKing(Enemy):
     """Ultra powerful boss that manipulates shadows and dimensions"""
+    __slots__ = ('phase_shift_timer', 'phase_shift_cooldown', 'phase_shift_active', 'phase_shift_duration',
+                 'duplicate_timer', 'duplicate_cooldown', 'active_duplicates', 'max_duplicates',
+                 'darkness_aura_radius', 'darkness_timer', 'darkness_interval', 'damage_reduction',
+                 'projectile_dodge_chance', 'phase', 'max_phases', 'shadow_particles', 'transparency',
+                 'shadow_tendrils')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 4500
         self.max_health = 4500
-        self.speed = 0.7
+        self.set_base_speed(0.7)
         self.reward = 850
         self.color = (30, 30, 30)  # Very dark gray
         self.size = 33
@@ -97,13 +101,18 @@ class ShadowKing(Enemy):
         self.phase_shift_duration = 180
         self.phase_shift_timer = 0
         
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Create phase shift effect
         for _ in range(25):
             particle = {
-                'x': self.x + random.uniform(-self.size, self.size),
-                'y': self.y + random.uniform(-self.size, self.size),
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-3, 3),
+                'x': self.x + rng.uniform(-self.size, self.size),
+                'y': self.y + rng.uniform(-self.size, self.size),
+                'vx': rng.uniform(-3, 3),
+                'vy': rng.uniform(-3, 3),
                 'life': 50,
                 'max_life': 50,
                 'color': (100, 0, 200),  # Purple shadow
@@ -113,8 +122,10 @@ class ShadowKing(Enemy):
     
     def create_shadow_duplicate(self):
         """Create a shadow duplicate"""
-        duplicate_x = self.x + random.uniform(-80, 80)
-        duplicate_y = self.y + random.uniform(-80, 80)
+        from game_systems.rng import get_cosmetic_rng
+        rng = get_cosmetic_rng()
+        duplicate_x = self.x + rng.uniform(-80, 80)
+        duplicate_y = self.y + rng.uniform(-80, 80)
         
         duplicate = {
             'x': duplicate_x,
@@ -178,7 +189,8 @@ class ShadowKing(Enemy):
         if self.phase_shift_active:
             dodge_chance = 0.7  # 70% dodge when phased
         
-        if random.random() < dodge_chance:
+        from game_systems.rng import get_simulation_rng
+        if get_simulation_rng().random() < dodge_chance:
             return 0  # Dodged the attack
         
         # Apply damage reduction
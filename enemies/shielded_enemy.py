@@ -4,6 +4,8 @@ from .enemy import Enemy
 
 class ShieldedEnemy(Enemy):
     """Enemy with regenerating shields"""
+    __slots__ = ('max_shield', 'shield', 'shield_regen_timer', 'shield_regen_delay')
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 15
@@ -12,7 +14,7 @@ class ShieldedEnemy(Enemy):
         self.shield = self.max_shield
         self.shield_regen_timer = 0
         self.shield_regen_delay = 180  # 3 seconds at 60 FPS
-        self.speed = 1.2
+        self.set_base_speed(1.2)
         self.reward = 10
         self.size = 10
         self.color = (0, 255, 255)  # Cyan
@@ -2,15 +2,16 @@ from typing import List, Tuple
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class SpectralEnemy(Enemy):
     """Ghostly enemy that phases through physical attacks - only vulnerable to lightning and requires detection"""
+    __slots__ = ('invisible', 'phase_timer', 'phase_particles', 'spectral_immunities')
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 25
         self.health = self.max_health
-        self.speed = 1.5
+        self.set_base_speed(1.5)
         self.reward = 30
         self.size = 12
         self.color = (150, 150, 255, 128)  # Semi-transparent blue
@@ -45,12 +46,17 @@ class SpectralEnemy(Enemy):
         # Update phase timer for visual effects
         self.phase_timer += 0.1
         
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Create phase particles
-        if random.random() < 0.3:
+        if rng.random() < 0.3:
             particle = {
-                'x': self.x + random.uniform(-self.size, self.size),
-                'y': self.y + random.uniform(-self.size, self.size),
-                'life': random.randint(20, 40),
+                'x': self.x + rng.uniform(-self.size, self.size),
+                'y': self.y + rng.uniform(-self.size, self.size),
+                'life': rng.randint(20, 40),
                 'color': (100, 100, 255)
             }
             self.phase_particles.append(particle)
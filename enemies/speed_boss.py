@@ -4,13 +4,14 @@ import math
 
 class SpeedBoss(Enemy):
     """Boss that becomes faster as it takes damage"""
+    __slots__ = ('speed_multiplier', 'max_speed_multiplier', 'trail_positions', 'dash_timer',
+                 'dash_cooldown', 'is_dashing', 'dash_duration')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 800
         self.max_health = 800
-        self.base_speed = 1.0
-        self.speed = self.base_speed
+        self.set_base_speed(1.0)
         self.reward = 160
         self.color = (255, 255, 0)  # Yellow
         self.size = 18
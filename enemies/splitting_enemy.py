@@ -4,6 +4,7 @@ import pygame
 
 class SplittingEnemy(Enemy):
     """Enemy that splits into smaller enemies when destroyed"""
+    __slots__ = ('generation', 'split_count')
     
     def __init__(self, path, split_count=2, generation=1, wave_number=1):
         super().__init__(path, wave_number)
@@ -17,7 +18,7 @@ class SplittingEnemy(Enemy):
         
         self.health = int(base_health / generation)
         self.max_health = self.health
-        self.speed = base_speed + (generation - 1) * 0.3
+        self.set_base_speed(base_speed + (generation - 1) * 0.3)
         self.reward = int(base_reward / generation)
         
         # Visual properties
@@ -76,21 +77,21 @@ class SplittingEnemy(Enemy):
                 break
         
         # Spawn 2 random enemies from the available pool
-        import random
+        from game_systems.enemy_factory import get_enemy_factory
+        from game_systems.rng import get_simulation_rng
+        rng = get_simulation_rng()
         for i in range(2):
-            enemy_class = random.choice(available_enemies)
-            new_enemy = enemy_class(self.path, self.wave_number)
-            
-            # CRITICAL: Properly inherit path position and state
-            new_enemy.path_index = self.path_index
-            new_enemy.distance_traveled = self.distance_traveled
+            enemy_class = rng.choice(available_enemies)
+            new_enemy = get_enemy_factory().create(enemy_class, self.path, self.wave_number)
             
             # Position them at the actual death location with very small offsets
             # This ensures they continue from where the splitting enemy died
-            offset_x = random.uniform(-8, 8)   # Very small random horizontal offset
-            offset_y = random.uniform(-8, 8)   # Very small random vertical offset
-            new_enemy.x = self.x + offset_x
-            new_enemy.y = self.y + offset_y
+            offset_x = rng.uniform(-8, 8)   # Very small random horizontal offset
+            offset_y = rng.uniform(-8, 8)   # Very small random vertical offset
+            path_x, path_y, _ = self.path_geometry.position_at(self.distance_traveled, self.path_index)
+            new_enemy.set_path_progress(self.distance_traveled,
+                                        self.x - path_x + offset_x,
+                                        self.y - path_y + offset_y)
             
             # Make spawned enemies slightly weaker (75% health, minimum 1)
             new_enemy.health = max(1, int(new_enemy.health * 0.75))
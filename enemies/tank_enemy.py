@@ -3,11 +3,13 @@ from .enemy import Enemy
 
 class TankEnemy(Enemy):
     """Tank enemy with high health but slow speed"""
+    __slots__ = ()
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 5
         self.health = self.max_health
-        self.speed = 0.5
+        self.set_base_speed(0.5)
         self.reward = 12
         self.size = 12
         self.color = (100, 50, 50)  # Dark red
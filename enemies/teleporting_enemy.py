@@ -1,16 +1,17 @@
 from .enemy import Enemy
 import pygame
-import random
 import math
 
 class TeleportingEnemy(Enemy):
     """Enemy that can teleport to avoid damage"""
+    __slots__ = ('teleport_chance', 'teleport_distance', 'teleport_cooldown', 'teleport_timer',
+                 'is_teleporting', 'teleport_animation_timer', 'teleport_animation_duration', 'particles')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 50
         self.max_health = 50
-        self.speed = 1.2
+        self.set_base_speed(1.2)
         self.reward = 14
         self.color = (138, 43, 226)  # Blue violet
         
@@ -73,8 +74,9 @@ class TeleportingEnemy(Enemy):
     def take_damage(self, damage, tower_type: str = 'basic'):
         """Take damage with chance to teleport"""
         # Check if can teleport
+        from game_systems.rng import get_simulation_rng
         if (self.teleport_timer >= self.teleport_cooldown and 
-            random.random() < self.teleport_chance):
+            get_simulation_rng().random() < self.teleport_chance):
             self.attempt_teleport()
             # Show "TELEPORT!" message briefly
             print(f"Teleporting Enemy avoided {damage} damage by teleporting!")  # Debug message
@@ -103,17 +105,8 @@ class TeleportingEnemy(Enemy):
             old_x, old_y = self.x, self.y
             self.create_teleport_particles(old_x, old_y)
             
-            # Update position and path progress
-            self.path_index = new_index
-            self.x = float(self.path[self.path_index][0])
-            self.y = float(self.path[self.path_index][1])
-            
-            # Update distance traveled appropriately
-            if hasattr(self, 'distance_traveled'):
-                # Calculate actual distance jumped
-                segments_jumped = new_index - current_index
-                avg_segment_length = 25  # Rough estimate
-                self.distance_traveled += segments_jumped * avg_segment_length
+            # Jump to the waypoint with its exact distance along the path
+            self.set_path_progress(self.path_geometry.cumulative_lengths[new_index])
             
             # Create teleport particles at new position
             self.create_teleport_particles(self.x, self.y)
@@ -129,12 +122,16 @@ class TeleportingEnemy(Enemy):
             
     def create_teleport_particles(self, x, y):
         """Create particle effects for teleportation"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(12):  # More particles for better visibility
             particle = {
-                'x': x + random.randint(-15, 15),
-                'y': y + random.randint(-15, 15),
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-3, 3),
+                'x': x + rng.randint(-15, 15),
+                'y': y + rng.randint(-15, 15),
+                'vx': rng.uniform(-3, 3),
+                'vy': rng.uniform(-3, 3),
                 'life': 40,  # Longer lasting
                 'color': (138, 43, 226)
             }
@@ -143,10 +140,10 @@ class TeleportingEnemy(Enemy):
         # Add some bright flash particles
         for _ in range(6):
             particle = {
-                'x': x + random.randint(-8, 8),
-                'y': y + random.randint(-8, 8),
-                'vx': random.uniform(-1, 1),
-                'vy': random.uniform(-1, 1),
+                'x': x + rng.randint(-8, 8),
+                'y': y + rng.randint(-8, 8),
+                'vx': rng.uniform(-1, 1),
+                'vy': rng.uniform(-1, 1),
                 'life': 20,
                 'color': (255, 255, 255)  # Bright white flash
             }
@@ -1,16 +1,20 @@
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class TimeLordBoss(Enemy):
     """Ultra powerful boss that manipulates time and space"""
+    __slots__ = ('time_distortion_active', 'time_distortion_timer', 'time_distortion_duration',
+                 'time_distortion_cooldown', 'time_distortion_radius', 'damage_history', 'rewind_timer',
+                 'rewind_cooldown', 'rewind_amount', 'rift_timer', 'rift_cooldown', 'active_rifts',
+                 'damage_reduction', 'magic_immunity_timer', 'phase', 'max_phases', 'time_particles',
+                 'aura_rotation', 'pulse_timer')
     
     def __init__(self, path, wave_number=1):
         super().__init__(path, wave_number)
         self.health = 4000
         self.max_health = 4000
-        self.speed = 0.8
+        self.set_base_speed(0.8)
         self.reward = 800
         self.color = (75, 0, 130)  # Indigo
         self.size = 30
@@ -108,13 +112,18 @@ class TimeLordBoss(Enemy):
         self.time_distortion_active = True
         self.time_distortion_timer = 0
         
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Create time distortion particles
         for _ in range(20):
             particle = {
-                'x': self.x + random.uniform(-self.time_distortion_radius, self.time_distortion_radius),
-                'y': self.y + random.uniform(-self.time_distortion_radius, self.time_distortion_radius),
-                'vx': random.uniform(-1, 1),
-                'vy': random.uniform(-1, 1),
+                'x': self.x + rng.uniform(-self.time_distortion_radius, self.time_distortion_radius),
+                'y': self.y + rng.uniform(-self.time_distortion_radius, self.time_distortion_radius),
+                'vx': rng.uniform(-1, 1),
+                'vy': rng.uniform(-1, 1),
                 'life': 60,
                 'max_life': 60,
                 'color': (150, 0, 255)
@@ -146,8 +155,10 @@ class TimeLordBoss(Enemy):
     def create_temporal_rift(self):
         """Create a temporal rift that spawns echo enemies"""
         # Create rift at random location near boss
-        rift_x = self.x + random.uniform(-100, 100)
-        rift_y = self.y + random.uniform(-100, 100)
+        from game_systems.rng import get_simulation_rng
+        rng = get_simulation_rng()
+        rift_x = self.x + rng.uniform(-100, 100)
+        rift_y = self.y + rng.uniform(-100, 100)
         
         rift = {
             'x': rift_x,
@@ -202,12 +213,16 @@ class TimeLordBoss(Enemy):
     
     def create_rewind_effect(self):
         """Create visual effect for damage rewind"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(15):
             particle = {
-                'x': self.x + random.uniform(-self.size, self.size),
-                'y': self.y + random.uniform(-self.size, self.size),
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-3, 3),
+                'x': self.x + rng.uniform(-self.size, self.size),
+                'y': self.y + rng.uniform(-self.size, self.size),
+                'vx': rng.uniform(-3, 3),
+                'vy': rng.uniform(-3, 3),
                 'life': 40,
                 'max_life': 40,
                 'color': (0, 255, 255)  # Cyan for rewind
@@ -1,23 +1,23 @@
 from typing import List, Tuple
 from .enemy import Enemy
+from .immunities import POISON
 import pygame
 import math
-import random
 
 class ToxicEnemy(Enemy):
     """Toxic enemy immune to poison damage"""
+    __slots__ = ('toxic_timer', 'toxic_bubbles', 'poison_aura_radius')
+    granted_immunities = POISON  # Always immune to poison towers
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 30
         self.health = self.max_health
-        self.speed = 1.1
+        self.set_base_speed(1.1)
         self.reward = 17
         self.size = 11
         self.color = (76, 175, 80)  # Toxic green
         
-        # Force immunity to poison towers
-        self.immunities['poison_immune'] = True
-        
         # Toxic properties
         self.toxic_timer = 0
         self.toxic_bubbles = []
@@ -39,16 +39,21 @@ class ToxicEnemy(Enemy):
         super().update()
         self.toxic_timer += 0.2
         
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Generate toxic bubbles
         if len(self.toxic_bubbles) < 10:
-            if random.random() < 0.3:  # 30% chance each frame
+            if rng.random() < 0.3:  # 30% chance each frame
                 bubble = {
-                    'x': self.x + random.uniform(-8, 8),
-                    'y': self.y + random.uniform(-8, 8),
-                    'life': random.uniform(15, 30),
+                    'x': self.x + rng.uniform(-8, 8),
+                    'y': self.y + rng.uniform(-8, 8),
+                    'life': rng.uniform(15, 30),
                     'max_life': 30,
-                    'size': random.uniform(1, 3),
-                    'float_speed': random.uniform(0.5, 1.5)
+                    'size': rng.uniform(1, 3),
+                    'float_speed': rng.uniform(0.5, 1.5)
                 }
                 self.toxic_bubbles.append(bubble)
         
@@ -56,7 +61,7 @@ class ToxicEnemy(Enemy):
         for bubble in self.toxic_bubbles[:]:
             bubble['life'] -= 1
             bubble['y'] -= bubble['float_speed']  # Float up
-            bubble['x'] += random.uniform(-0.3, 0.3)  # Drift
+            bubble['x'] += rng.uniform(-0.3, 0.3)  # Drift
             
             if bubble['life'] <= 0:
                 self.toxic_bubbles.remove(bubble)
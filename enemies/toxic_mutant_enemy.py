@@ -2,15 +2,16 @@ from typing import List, Tuple
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class ToxicMutantEnemy(Enemy):
     """Toxic mutant enemy immune to physical damage - only vulnerable to poison and flame"""
+    __slots__ = ('mutation_timer', 'toxic_bubbles', 'pulsation', 'physical_immunities')
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 30
         self.health = self.max_health
-        self.speed = 1.3
+        self.set_base_speed(1.3)
         self.reward = 35
         self.size = 14
         self.color = (100, 255, 50)  # Toxic green
@@ -46,30 +47,38 @@ class ToxicMutantEnemy(Enemy):
     
     def create_toxic_splash(self):
         """Create toxic splash effect when attacked by immune weapons"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 5)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 5)
             particle = {
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(20, 35),
+                'life': rng.randint(20, 35),
                 'color': (50, 200, 50)
             }
             self.toxic_bubbles.append(particle)
     
     def create_mutation_particles(self):
         """Create mutation effect when damaged by effective weapons"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(4):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(1, 3)
             particle = {
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(15, 25),
+                'life': rng.randint(15, 25),
                 'color': (200, 100, 50)  # Orange for flame/poison reaction
             }
             self.toxic_bubbles.append(particle)
@@ -82,15 +91,20 @@ class ToxicMutantEnemy(Enemy):
         self.mutation_timer += 0.15
         self.pulsation += 0.2
         
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Create random toxic bubbles
-        if random.random() < 0.2:
+        if rng.random() < 0.2:
             bubble = {
-                'x': self.x + random.uniform(-self.size/2, self.size/2),
-                'y': self.y + random.uniform(-self.size/2, self.size/2),
-                'dx': random.uniform(-1, 1),
-                'dy': random.uniform(-2, 0),
-                'life': random.randint(30, 50),
-                'color': (random.randint(50, 150), random.randint(200, 255), random.randint(50, 100))
+                'x': self.x + rng.uniform(-self.size/2, self.size/2),
+                'y': self.y + rng.uniform(-self.size/2, self.size/2),
+                'dx': rng.uniform(-1, 1),
+                'dy': rng.uniform(-2, 0),
+                'life': rng.randint(30, 50),
+                'color': (rng.randint(50, 150), rng.randint(200, 255), rng.randint(50, 100))
             }
             self.toxic_bubbles.append(bubble)
         
@@ -2,15 +2,16 @@ from typing import List, Tuple
 from .enemy import Enemy
 import pygame
 import math
-import random
 
 class VoidEnemy(Enemy):
     """Void enemy that absorbs energy attacks - only vulnerable to explosives and missiles"""
+    __slots__ = ('void_rotation', 'absorption_particles', 'void_distortion', 'absorbed_types')
+
     def __init__(self, path: List[Tuple[int, int]], wave_number: int = 1):
         super().__init__(path, wave_number)
         self.max_health = 40
         self.health = self.max_health
-        self.speed = 0.8
+        self.set_base_speed(0.8)
         self.reward = 50
         self.size = 15
         self.color = (50, 0, 100)  # Dark purple
@@ -46,30 +47,38 @@ class VoidEnemy(Enemy):
     
     def create_absorption_effect(self):
         """Create absorption effect when attacked by absorbed weapons"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(6):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(20, 40)
+            angle = rng.uniform(0, 2 * math.pi)
+            distance = rng.uniform(20, 40)
             particle = {
                 'x': self.x + math.cos(angle) * distance,
                 'y': self.y + math.sin(angle) * distance,
                 'target_x': self.x,
                 'target_y': self.y,
-                'life': random.randint(25, 40),
-                'color': (random.randint(100, 200), random.randint(50, 150), random.randint(150, 255))
+                'life': rng.randint(25, 40),
+                'color': (rng.randint(100, 200), rng.randint(50, 150), rng.randint(150, 255))
             }
             self.absorption_particles.append(particle)
     
     def create_void_disruption(self):
         """Create void disruption when damaged by effective weapons"""
+        from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(10):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 8)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(3, 8)
             particle = {
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(15, 30),
+                'life': rng.randint(15, 30),
                 'color': (255, 100, 0)  # Orange explosion effect
             }
             self.absorption_particles.append({
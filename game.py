@@ -1,25 +1,15 @@
 import pygame
 import sys
-from typing import List
-import random
 
-from enemies import Enemy
-from towers import Tower
-from projectiles import Projectile
-from game_systems import Map, WaveManager, UIManager, TowerManager
-from game_systems.tower_upgrade_system import TowerUpgradeSystem
+from game_systems import Map, UIManager, SimulationCore
 from game_systems.upgrade_ui import UpgradeUI
 
 class Game:
-    """Main game controller - coordinates between all game systems"""
+    """Main game controller - input handling and rendering around a SimulationCore"""
     
     def __init__(self):
         pygame.init()
         
-        # Load game configuration
-        from config.game_config import get_game_config
-        self.game_config = get_game_config()
-
         # Screen setup with fullscreen support
         self.fullscreen = False
         self.SCREEN_WIDTH = 1200
@@ -35,16 +25,11 @@ class Game:
         self.clock = pygame.time.Clock()
         self.FPS = 60
         
-        # Game state using config values
+        # Shell state
         self.running = True
         self.paused = False
-        self.game_over = False
-        self.victory = False
-        self.money = self.game_config.get('starting_money', 20)
-        self.lives = self.game_config.get('starting_lives', 20)
         
         # Speed control
-        self.game_speed = 1  # 1 = normal speed, 2 = double speed
         self.speed_options = [1, 2]  # Available speed options
         self.current_speed_index = 0  # Index in speed_options
         
@@ -53,9 +38,6 @@ class Game:
         self.show_game_over_screen = False
         self.restart_requested = False
         
-        # Wave completion tracking
-        self.completed_wave_number = 0  # Track which wave was just completed
-        
         # Performance monitoring
         self.fps_counter = 0
         self.fps_timer = 0
@@ -63,25 +45,35 @@ class Game:
         self.frame_time_samples = []
         self.max_frame_time_samples = 60  # Track last 60 frames
         
-        # Game objects
-        self.enemies: List[Enemy] = []
-        self.towers: List[Tower] = []
-        self.projectiles: List[Projectile] = []
-        
-        # Initialize game systems
-        self.map = Map(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-        self.wave_manager = WaveManager(self.map.get_path())
-        self.tower_manager = TowerManager()
-        # Initialize tower costs for wave 1
-        self.tower_manager.set_current_wave(1)
+        # Headless simulation owns all gameplay state (entities, managers, money, lives)
+        self.core = SimulationCore(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        
+        # Initialize UI systems
         self.ui_manager = UIManager(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.tower_manager)
-        self.upgrade_system = TowerUpgradeSystem()
         self.upgrade_ui = UpgradeUI(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         
         # UI state
         self.show_wave_complete = False
         self.wave_complete_timer = 0
-        self.wave_bonus = 0
+    
+    # Gameplay state lives in the simulation core; these keep the shell's public attributes working
+    money = property(lambda self: self.core.money,
+                     lambda self, value: setattr(self.core, 'money', value))
+    lives = property(lambda self: self.core.lives,
+                     lambda self, value: setattr(self.core, 'lives', value))
+    game_speed = property(lambda self: self.core.game_speed,
+                          lambda self, value: setattr(self.core, 'game_speed', value))
+    game_over = property(lambda self: self.core.game_over)
+    victory = property(lambda self: self.core.victory)
+    completed_wave_number = property(lambda self: self.core.completed_wave_number)
+    wave_bonus = property(lambda self: self.core.wave_bonus)
+    enemies = property(lambda self: self.core.enemies)
+    towers = property(lambda self: self.core.towers)
+    projectiles = property(lambda self: self.core.projectiles)
+    map = property(lambda self: self.core.map)
+    wave_manager = property(lambda self: self.core.wave_manager)
+    tower_manager = property(lambda self: self.core.tower_manager)
+    upgrade_system = property(lambda self: self.core.upgrade_system)
     
     def handle_events(self):
         """Handle all game events"""
@@ -148,13 +140,10 @@ class Game:
             self.SCREEN_WIDTH = 1200
             self.SCREEN_HEIGHT = 800
         
-        # Reinitialize systems with new screen dimensions
-        self.map = Map(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        # Reinitialize systems with new screen dimensions (also resets the wave manager to the new path)
+        self.core.set_map(Map(self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         self.ui_manager = UIManager(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.tower_manager)
         self.upgrade_ui = UpgradeUI(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-        
-        # Update wave manager with new path
-        self.wave_manager = WaveManager(self.map.get_path())
     
     def toggle_game_speed(self):
         """Toggle between different game speeds"""
@@ -237,273 +226,18 @@ class Game:
     
     def attempt_tower_placement(self, pos):
         """Try to place a tower at the given position"""
-        success, tower, cost = self.tower_manager.attempt_tower_placement(
-            pos, self.money, self.towers, self.map
-        )
-        
-        if success and tower:
-            # Set upgrade system reference for currency generation
-            tower.set_upgrade_system_reference(self.upgrade_system)
-            self.towers.append(tower)
-            self.money -= cost
+        self.core.attempt_tower_placement(pos)
     
     def remove_tower(self, tower):
         """Remove a tower and refund 50% of its cost"""
         if tower not in self.towers:
             return
         
-        # Calculate refund (50% of current tower cost)
-        tower_type = tower.tower_type
-        current_cost = self.tower_manager.get_tower_cost(tower_type)
-        refund = int(current_cost * 0.5)
-        
-        # Remove tower from list
-        self.towers.remove(tower)
-        
-        # Give refund to player
-        self.money += refund
-        
-        # Decrease tower count for dynamic pricing
-        if tower_type in self.tower_manager.towers_built_count:
-            self.tower_manager.towers_built_count[tower_type] = max(0, 
-                self.tower_manager.towers_built_count[tower_type] - 1)
+        self.core.remove_tower(tower)
         
         # Clear upgrade UI selection
         self.upgrade_ui.clear_selection()
     
-    def update_enemies(self):
-        """Update all enemies"""
-        enemies_to_add = []
-        
-        for enemy in self.enemies[:]:
-            # Pass game speed to enemy update for faster movement
-            if hasattr(enemy, 'update_with_speed'):
-                enemy.update_with_speed(self.game_speed)
-            else:
-                enemy.update()
-            
-            # Handle poison effects (adjust timer based on speed)
-            if hasattr(enemy, 'poison_timer') and enemy.poison_timer > 0:
-                enemy.poison_timer -= self.game_speed
-                if hasattr(enemy, 'poison_damage_timer'):
-                    enemy.poison_damage_timer += self.game_speed
-                    if enemy.poison_damage_timer >= 60:  # Every second
-                        enemy.take_damage(enemy.poison_damage)
-                        enemy.poison_damage_timer = 0
-            
-            # Handle boss minion spawning (while boss is alive)
-            if hasattr(enemy, 'should_spawn_minions') and enemy.should_spawn_minions():
-                minion_count = enemy.get_minion_count()
-                for i in range(minion_count):
-                    from enemies import BasicEnemy
-                    minion = BasicEnemy(self.map.get_path())
-                    minion.x = enemy.x + (i - minion_count/2) * 30
-                    minion.y = enemy.y
-                    # Set map reference for terrain effects
-                    minion.set_map_reference(self.map)
-                    enemies_to_add.append(minion)
-            
-            # Handle TimeLord Boss echo spawning
-            if hasattr(enemy, 'should_spawn_echoes'):
-                spawnable_rifts = enemy.should_spawn_echoes()
-                for rift in spawnable_rifts:
-                    from enemies import BasicEnemy
-                    echo = BasicEnemy(self.map.get_path())
-                    echo.x = rift['x']
-                    echo.y = rift['y']
-                    echo.health = echo.health * 0.5  # Echo enemies are weaker
-                    echo.color = (150, 0, 255)  # Purple tint for echoes
-                    echo.set_map_reference(self.map)
-                    enemies_to_add.append(echo)
-            
-            # Handle Necromancer Boss undead summoning
-            if hasattr(enemy, 'should_summon_undead') and enemy.should_summon_undead():
-                from enemies import BasicEnemy
-                undead = BasicEnemy(self.map.get_path())
-                undead.x = enemy.x + random.uniform(-60, 60)
-                undead.y = enemy.y + random.uniform(-60, 60)
-                undead.color = (100, 100, 50)  # Sickly green for undead
-                undead.health = undead.health * 0.7  # Undead are somewhat weaker
-                undead.set_map_reference(self.map)
-                enemies_to_add.append(undead)
-            
-            # Handle enemy death and removal
-            if enemy.health <= 0:
-                # Register dead enemy with Necromancer bosses for resurrection
-                for boss in self.enemies:
-                    if hasattr(boss, 'register_dead_enemy'):
-                        boss.register_dead_enemy(type(enemy).__name__, enemy.x, enemy.y)
-                
-                # Check if enemy reached end or was killed
-                if not enemy.reached_end:
-                    # Enemy was killed - award money
-                    self.money += enemy.reward
-                    
-                    # Handle splitting enemies or other on_death mechanics
-                    if hasattr(enemy, 'on_death'):
-                        spawned_enemies = enemy.on_death()
-                        if spawned_enemies:
-                            for spawned_enemy in spawned_enemies:
-                                # Set map reference for terrain effects
-                                spawned_enemy.set_map_reference(self.map)
-                                enemies_to_add.append(spawned_enemy)
-                else:
-                    # Enemy reached end - lose lives
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.game_over = True
-                        self.show_game_over_screen = True
-                
-                self.enemies.remove(enemy)
-            elif enemy.reached_end:
-                # Enemy reached the end
-                self.lives -= 1
-                if self.lives <= 0:
-                    self.game_over = True
-                    self.show_game_over_screen = True
-                self.enemies.remove(enemy)
-        
-        # Add any spawned enemies
-        self.enemies.extend(enemies_to_add)
-    
-    def update_towers(self):
-        """Update all towers"""
-        # First, clear all detection flags before detector towers update them
-        for enemy in self.enemies:
-            if hasattr(enemy, 'detected_by_detector'):
-                enemy.detected_by_detector = False
-        
-        # Separate towers by type to ensure detector towers update first
-        detector_towers = [tower for tower in self.towers if tower.tower_type == 'detector']
-        other_towers = [tower for tower in self.towers if tower.tower_type != 'detector']
-        
-
-        # Update detector towers first
-        for tower in detector_towers:
-            # Track damage before update
-            previous_damage = tower.total_damage_dealt
-            
-            # Pass game speed to tower update for faster firing with optimizations
-            if hasattr(tower, 'update_with_speed_optimized'):
-                tower.update_with_speed_optimized(self.enemies, self.projectiles, self.game_speed)
-            elif hasattr(tower, 'update_with_speed'):
-                tower.update_with_speed(self.enemies, self.projectiles, self.game_speed)
-            else:
-                tower.update(self.enemies, self.projectiles)
-            
-            # Check if tower dealt damage directly (not through projectiles)
-            damage_this_frame = tower.total_damage_dealt - previous_damage
-            if damage_this_frame > 0:
-                # Use centralized currency generation (already includes 5/100 nerf)
-                tower.track_damage_and_generate_currency(damage_this_frame)
-        
-        # Then update other towers (they can now see detected enemies)
-        for tower in other_towers:
-            # Track damage before update
-            previous_damage = tower.total_damage_dealt
-            
-            # Pass game speed to tower update for faster firing with optimizations
-            if hasattr(tower, 'update_with_speed_optimized'):
-                tower.update_with_speed_optimized(self.enemies, self.projectiles, self.game_speed)
-            elif hasattr(tower, 'update_with_speed'):
-                tower.update_with_speed(self.enemies, self.projectiles, self.game_speed)
-            else:
-                tower.update(self.enemies, self.projectiles)
-            
-            # Check if tower dealt damage directly (not through projectiles)
-            damage_this_frame = tower.total_damage_dealt - previous_damage
-            if damage_this_frame > 0:
-                # Use centralized currency generation (already includes 5/100 nerf)
-                tower.track_damage_and_generate_currency(damage_this_frame)
-    
-    def update_projectiles(self):
-        """Update all projectiles"""
-        for projectile in self.projectiles[:]:
-            # Handle different projectile update methods with speed
-            if hasattr(projectile, 'update') and callable(getattr(projectile, 'update')):
-                if hasattr(projectile, 'update_homing'):
-                    if hasattr(projectile, 'update_homing_with_speed'):
-                        projectile.update_homing_with_speed(self.enemies, self.game_speed)
-                    else:
-                        projectile.update_homing(self.enemies)
-                elif hasattr(projectile.__class__, 'update') and len(projectile.update.__code__.co_varnames) > 1:
-                    # Missile projectiles need enemies parameter
-                    if hasattr(projectile, 'update_with_speed'):
-                        projectile.update_with_speed(self.enemies, self.game_speed)
-                    else:
-                        projectile.update(self.enemies)
-                else:
-                    if hasattr(projectile, 'update_with_speed'):
-                        projectile.update_with_speed(self.game_speed)
-                    else:
-                        projectile.update()
-            
-            # Check projectile collisions with enemies
-            if hasattr(projectile, 'check_collision'):
-                collision_result = projectile.check_collision(self.enemies)
-                
-                # Handle damage tracking for currency generation
-                if isinstance(collision_result, dict) and collision_result.get('hit'):
-                    damage_dealt = collision_result.get('damage', 0)
-                    tower_id = collision_result.get('tower_id')
-                    
-                    # Ensure damage_dealt is not None and is a number
-                    if damage_dealt is None:
-                        damage_dealt = 0
-                    
-                    if tower_id:
-                        # Find the tower and use centralized currency generation
-                        tower = self._find_tower_by_id(tower_id)
-                        if tower:
-                            if damage_dealt > 0:
-                                # Use centralized damage tracking and currency generation
-                                tower.track_damage_and_generate_currency(damage_dealt)
-                            else:
-                                # Support towers get minimal currency for successful hits
-                                tower.track_utility_hit()
-            
-            if hasattr(projectile, 'should_remove') and projectile.should_remove:
-                self.projectiles.remove(projectile)
-    
-    def _find_tower_by_id(self, tower_id: str):
-        """Find a tower by its unique ID"""
-        for tower in self.towers:
-            if hasattr(tower, 'tower_id') and tower.tower_id == tower_id:
-                return tower
-        return None
-    
-    def update_waves(self):
-        """Update wave management"""
-        # Spawn new enemies (adjusted for speed)
-        new_enemy = self.wave_manager.spawn_enemy(self.game_speed)
-        if new_enemy:
-            # Set map reference for terrain effects
-            new_enemy.set_map_reference(self.map)
-            self.enemies.append(new_enemy)
-        
-        # Check for wave completion
-        wave_info = self.wave_manager.update(self.enemies)
-        if wave_info:
-            if wave_info.get('game_completed', False):
-                # Player has beaten the final wave!
-                self.victory = True
-                self.show_victory_screen = True
-            elif wave_info.get('wave_completed', False):
-                # Normal wave completion - store the completed wave number BEFORE incrementing
-                self.completed_wave_number = wave_info['wave_number']
-                self.money += wave_info['money_bonus']
-                self.wave_bonus = wave_info['money_bonus']
-                self.show_wave_complete = True
-                self.wave_complete_timer = 180  # Show for 3 seconds
-                
-                # Start next wave after a delay
-                if not wave_info.get('is_final_wave', False):
-                    next_wave_info = self.wave_manager.start_next_wave()
-                    if next_wave_info:
-                        # Update tower costs for the new wave
-                        current_wave = next_wave_info.get('wave_number', 1)
-                        self.tower_manager.set_current_wave(current_wave)
-    
     def update_ui_state(self):
         """Update UI-related timers and state"""
         if self.show_wave_complete:
@@ -522,11 +256,16 @@ class Game:
         if self.paused or self.game_over or self.victory:
             return
         
-        # Single update pass - entities handle speed internally
-        self.update_enemies()
-        self.update_towers()
-        self.update_projectiles()
-        self.update_waves()
+        # Advance the simulation by exactly one tick per frame
+        wave_info = self.core.tick()
+        if wave_info:
+            if wave_info.get('game_completed', False):
+                self.show_victory_screen = True
+            elif wave_info.get('wave_completed', False):
+                self.show_wave_complete = True
+                self.wave_complete_timer = 180  # Show for 3 seconds
+        if self.game_over:
+            self.show_game_over_screen = True
         self.update_ui_state()
     
     def draw_game_objects(self):
@@ -643,42 +382,20 @@ class Game:
     def restart_game(self):
         """Restart the game to initial state - COMPLETE RESET"""
         
-        # Reset core game state
-        self.game_over = False
-        self.victory = False
+        # Reset core game state, entities and all gameplay managers
         self.paused = False
-        self.money = self.game_config.get('starting_money', 20)  # Reset to config amount
-        self.lives = self.game_config.get('starting_lives', 20)  # Reset to config amount
-        
-        # Reset game speed to normal
-        self.game_speed = 1
+        self.core.reset()
         self.current_speed_index = 0
+        self.wave_manager.reset_introductions()  # Reset enemy introductions
+        self.tower_manager.reset_ui_state()     # Reset tower placement UI state
         
         # Reset UI state completely
         self.show_victory_screen = False
         self.show_game_over_screen = False
         self.show_wave_complete = False
         self.restart_requested = False
-        self.completed_wave_number = 0
-        self.wave_bonus = 0
         self.wave_complete_timer = 0
         
-        # Clear all game objects
-        self.enemies.clear()
-        self.towers.clear()
-        self.projectiles.clear()
-        
-        # Reset all managers to initial state
-        self.wave_manager = WaveManager(self.map.get_path())
-        self.wave_manager.reset_introductions()  # Reset enemy introductions
-        
-        self.tower_manager = TowerManager()
-        self.tower_manager.set_current_wave(1)  # Reset to wave 1 costs
-        self.tower_manager.reset_ui_state()     # Reset tower placement UI state
-        
-        # Reset upgrade system
-        self.upgrade_system = TowerUpgradeSystem()
-        
         # Recreate UI manager with new tower manager reference
         self.ui_manager = UIManager(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.tower_manager)
         self.upgrade_ui.reset_ui_state()        # Reset upgrade panel completely
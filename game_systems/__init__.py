@@ -2,5 +2,6 @@ from .map import Map
 from .wave_manager import WaveManager
 from .ui_manager import UIManager
 from .tower_manager import TowerManager
+from .simulation_core import SimulationCore
 
-__all__ = ['Map', 'WaveManager', 'UIManager', 'TowerManager'] 
\ No newline at end of file
+__all__ = ['Map', 'WaveManager', 'UIManager', 'TowerManager', 'SimulationCore'] 
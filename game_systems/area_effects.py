@@ -0,0 +1,132 @@
+"""Area-of-effect resolution for explosions, splashes and area freezes.
+
+Cannonballs, rockets, homing missiles and splash, ice and water projectiles
+used to scan every enemy when they went off (ice even rescanned all of them
+for each enemy it touched). They now describe the blast - centre, radius,
+damage profile, status effects and source tower - and hand it to the
+area-effect service.
+
+SimulationCore's service queues the tick's blasts and resolves them
+together at the end of the projectile phase: enemy positions are indexed
+once in a spatial grid, each blast only looks at the cells its radius
+overlaps, and the damage each blast deals is credited to its source tower
+through the event bus, the one place AoE damage is attributed. Outside a
+SimulationCore (legacy runners, tests) the fallback service resolves each
+blast immediately with a linear scan and the projectile reports the damage
+itself, as before. Projectiles reach the running simulation's service
+through get_area_effects() (see simulation_context).
+"""
+import math
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from .events import get_event_bus
+from .simulation_context import get_context
+from .spatial_grid import SpatialGrid
+from .status_effects import get_status_effects
+
+
+class DamageProfile(NamedTuple):
+    """Damage a blast deals to an enemy at a given distance from its centre"""
+    damage: int  # Full damage (0 for effect-only blasts)
+    damage_type: str = 'basic'  # Tower type passed to take_damage
+    inner_radius: float = 0.0  # Enemies this close take full damage when outer_damage is set
+    outer_damage: Optional[int] = None  # Damage beyond inner_radius
+    falloff: float = 0.0  # Fraction of the damage lost at the edge (linear, at least 1 damage)
+
+    def amount(self, distance: float, radius: float) -> int:
+        """Damage dealt at a distance from the centre of a blast of the given radius"""
+        if self.falloff:
+            return max(1, int(self.damage * (1.0 - (distance / radius) * self.falloff)))
+        if self.outer_damage is not None and distance >= self.inner_radius:
+            return self.outer_damage
+        return self.damage
+
+
+class Blast(NamedTuple):
+    """One area effect waiting to be resolved"""
+    x: float
+    y: float
+    radius: float
+    profile: DamageProfile
+    effects: Tuple[Tuple[int, float, float], ...]  # (effect bit, duration, strength) applied before damage
+    tower_id: Optional[int]
+
+
+class AreaEffects:
+    """Resolves blasts against enemies, immediately or batched once per tick"""
+
+    def __init__(self, tower_lookup: Optional[Callable] = None, deferred: bool = False):
+        self.tower_lookup = tower_lookup  # tower_id -> tower, used to credit deferred blasts
+        self.deferred = deferred
+        self.queue: List[Blast] = []
+        self.grid = SpatialGrid()
+
+    def explode(self, enemies: List, x: float, y: float, radius: float, profile: DamageProfile,
+                effects: Tuple[Tuple[int, float, float], ...] = (),
+                tower_id: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """Set off a blast, returns (enemies hit, damage dealt) or None if it was queued"""
+        blast = Blast(x, y, radius, profile, effects, tower_id)
+        if self.deferred:
+            self.queue.append(blast)
+            return None
+
+        radius_squared = radius * radius
+        hits = []
+        for enemy in enemies:
+            dx = enemy.x - x
+            dy = enemy.y - y
+            distance_squared = dx * dx + dy * dy
+            if distance_squared <= radius_squared:
+                hits.append((enemy, distance_squared))
+        enemies_hit, total_damage, _ = self._apply(blast, hits)
+        return enemies_hit, total_damage
+
+    def resolve(self, enemies: List):
+        """Resolve every queued blast in the order they went off and credit their towers"""
+        if not self.queue:
+            return
+        blasts = self.queue
+        self.queue = []
+        events = get_event_bus()
+
+        self.grid.rebuild(enemies)
+        for blast in blasts:
+            enemies_hit, total_damage, moved = self._apply(
+                blast, self.grid.query_radius(blast.x, blast.y, blast.radius))
+            if moved:
+                # A hit enemy moved (teleporters), re-index for the blasts after this one
+                self.grid.rebuild(enemies)
+
+            # A blast that touched anything counts as a hit for its tower, damage or not
+            if enemies_hit and blast.tower_id is not None and self.tower_lookup is not None:
+                tower = self.tower_lookup(blast.tower_id)
+                if tower is not None:
+                    events.damage(tower, total_damage)
+        self.grid.clear()
+
+    def clear(self):
+        """Drop queued blasts"""
+        self.queue.clear()
+
+    @staticmethod
+    def _apply(blast: Blast, hits: List[Tuple[object, float]]) -> Tuple[int, int, bool]:
+        """Apply a blast to its (enemy, squared distance) hits, returns (hits, damage, whether any moved)"""
+        profile = blast.profile
+        status_effects = get_status_effects() if blast.effects else None
+        total_damage = 0
+        moved = False
+        for enemy, distance_squared in hits:
+            for effect, duration, strength in blast.effects:
+                status_effects.apply(enemy, effect, duration, strength)
+            damage = profile.amount(math.sqrt(distance_squared), blast.radius)
+            if damage > 0:
+                x = enemy.x
+                y = enemy.y
+                total_damage += enemy.take_damage(damage, profile.damage_type)
+                moved = moved or enemy.x != x or enemy.y != y
+        return len(hits), total_damage, moved
+
+
+def get_area_effects() -> AreaEffects:
+    """Get the area-effect service of the running simulation"""
+    return get_context().area_effects
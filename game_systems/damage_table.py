@@ -0,0 +1,84 @@
+from typing import Dict, List
+
+from config.game_config import get_balance_config
+
+
+class DamageTable:
+    """Counter system compiled into a dense tower type x enemy type table.
+
+    Enemy.take_damage used to walk the nested counter_system dicts and clamp
+    the result on every hit. Here each tower type and each enemy class named
+    in the config gets a small integer ID, and every cell already holds the
+    clamped multiplier, so a hit is one row/column lookup. Enemy classes the
+    config does not mention share a final default column. Lightning's bonus
+    against wet enemies is compiled into a second set of rows used while the
+    enemy is wet (a named enemy entry still takes precedence, as before).
+    """
+
+    def __init__(self, counter_config: dict):
+        multipliers = counter_config.get('tower_enemy_multipliers', {})
+        max_multiplier = counter_config.get('max_multiplier', 3.0)
+        min_multiplier = counter_config.get('min_multiplier', 0.1)
+
+        def clamp(multiplier: float) -> float:
+            return max(min_multiplier, min(max_multiplier, multiplier))
+
+        self.tower_ids: Dict[str, int] = {tower_type: i for i, tower_type in enumerate(multipliers)}
+        enemy_names = []
+        for tower_multipliers in multipliers.values():
+            enemy_names.extend(name for name in tower_multipliers
+                               if name != 'wet_enemies' and name not in enemy_names)
+        self.enemy_ids: Dict[str, int] = {name: i for i, name in enumerate(enemy_names)}
+        self.default_column = len(enemy_names)
+        self.default_row = len(multipliers)
+
+        default = clamp(counter_config.get('default_multiplier', 1.0))
+        self.rows: List[List[float]] = []
+        self.wet_rows: List[List[float]] = []
+        for tower_type, tower_multipliers in multipliers.items():
+            row = [clamp(tower_multipliers[name]) if name in tower_multipliers else default
+                   for name in enemy_names] + [default]
+            wet_row = row
+            if tower_type == 'lightning' and 'wet_enemies' in tower_multipliers:
+                wet = clamp(tower_multipliers['wet_enemies'])
+                wet_row = [row[i] if name in tower_multipliers else wet
+                           for i, name in enumerate(enemy_names)] + [wet]
+            self.rows.append(row)
+            self.wet_rows.append(wet_row)
+
+        # Unknown tower types deal default damage to everything
+        self.rows.append([default] * (self.default_column + 1))
+        self.wet_rows.append(self.rows[-1])
+
+        self._class_columns: Dict[type, int] = {}
+
+    def tower_id(self, tower_type: str) -> int:
+        """Get the row for a tower type"""
+        return self.tower_ids.get(tower_type, self.default_row)
+
+    def enemy_column(self, enemy_type: type) -> int:
+        """Get the (cached) column for an enemy class"""
+        column = self._class_columns.get(enemy_type)
+        if column is None:
+            column = self.enemy_ids.get(enemy_type.__name__, self.default_column)
+            self._class_columns[enemy_type] = column
+        return column
+
+    def multiplier(self, tower_type: str, enemy_type: type, wet: bool = False) -> float:
+        """Get the clamped damage multiplier of a tower type against an enemy class"""
+        rows = self.wet_rows if wet else self.rows
+        return rows[self.tower_ids.get(tower_type, self.default_row)][self.enemy_column(enemy_type)]
+
+
+_table = None
+_table_source = None
+
+
+def get_damage_table() -> DamageTable:
+    """Get the damage table compiled from the current balance config"""
+    global _table, _table_source
+    counter_config = get_balance_config().get('counter_system', {})
+    if counter_config is not _table_source:
+        _table = DamageTable(counter_config)
+        _table_source = counter_config
+    return _table
@@ -0,0 +1,119 @@
+"""Per-class update protocols for the simulation loop.
+
+Instead of probing every entity with hasattr (or reading a method's
+__code__) on every tick, SimulationCore looks up a dispatch record once per
+class and calls the handlers stored in it. Enemies declare their optional
+hooks by defining the hook methods (should_spawn_minions, should_spawn_echoes,
+should_summon_undead, register_dead_enemy, on_death); projectiles declare how
+they are advanced with an update_protocol class attribute:
+
+    'speed'   - update_with_speed(speed_multiplier)
+    'homing'  - update_homing_with_speed(enemies, speed_multiplier)
+    'enemies' - update_with_speed(enemies, speed_multiplier)
+    'plain'   - update() (ignores game speed)
+"""
+from typing import Callable, Dict, NamedTuple, Optional
+
+
+class EnemyDispatch(NamedTuple):
+    """How the simulation loop drives one enemy class"""
+    update: Callable  # update(enemy, speed_multiplier)
+    spawns_minions: bool
+    spawns_echoes: bool
+    summons_undead: bool
+    tracks_dead_enemies: bool
+    on_death: Optional[Callable]  # on_death(enemy) -> spawned enemies
+
+
+class TowerDispatch(NamedTuple):
+    """How the simulation loop drives one tower class"""
+    update: Callable  # update(tower, enemies, projectiles, speed_multiplier)
+
+
+class ProjectileDispatch(NamedTuple):
+    """How the simulation loop drives one projectile class"""
+    update: Callable  # update(projectile, enemies, speed_multiplier)
+    check_collision: Optional[Callable]  # check_collision(projectile, enemies) -> result
+
+
+_enemy_table: Dict[type, EnemyDispatch] = {}
+_tower_table: Dict[type, TowerDispatch] = {}
+_projectile_table: Dict[type, ProjectileDispatch] = {}
+
+
+def enemy_dispatch(enemy_type: type) -> EnemyDispatch:
+    """Get the (cached) dispatch record for an enemy class"""
+    dispatch = _enemy_table.get(enemy_type)
+    if dispatch is None:
+        update_with_speed = getattr(enemy_type, 'update_with_speed', None)
+        if update_with_speed is not None:
+            update = update_with_speed
+        else:
+            plain_update = enemy_type.update
+            update = lambda enemy, speed_multiplier: plain_update(enemy)
+        dispatch = EnemyDispatch(
+            update=update,
+            spawns_minions=hasattr(enemy_type, 'should_spawn_minions'),
+            spawns_echoes=hasattr(enemy_type, 'should_spawn_echoes'),
+            summons_undead=hasattr(enemy_type, 'should_summon_undead'),
+            tracks_dead_enemies=hasattr(enemy_type, 'register_dead_enemy'),
+            on_death=getattr(enemy_type, 'on_death', None),
+        )
+        _enemy_table[enemy_type] = dispatch
+    return dispatch
+
+
+def tower_dispatch(tower_type: type) -> TowerDispatch:
+    """Get the (cached) dispatch record for a tower class"""
+    dispatch = _tower_table.get(tower_type)
+    if dispatch is None:
+        if hasattr(tower_type, 'update_with_speed_optimized'):
+            update = tower_type.update_with_speed_optimized
+        elif hasattr(tower_type, 'update_with_speed'):
+            update = tower_type.update_with_speed
+        else:
+            plain_update = tower_type.update
+            update = lambda tower, enemies, projectiles, speed_multiplier: plain_update(tower, enemies, projectiles)
+        dispatch = TowerDispatch(update=update)
+        _tower_table[tower_type] = dispatch
+    return dispatch
+
+
+def _projectile_protocol(projectile_type: type) -> str:
+    """Get a projectile class's declared update protocol (inferred for undeclared classes)"""
+    protocol = getattr(projectile_type, 'update_protocol', None)
+    if protocol is not None:
+        return protocol
+    # Legacy classes: infer once from what the class defines
+    if hasattr(projectile_type, 'update_homing_with_speed'):
+        return 'homing'
+    if hasattr(projectile_type, 'update_with_speed'):
+        update = getattr(projectile_type, 'update', None)
+        takes_enemies = update is not None and update.__code__.co_argcount > 1
+        return 'enemies' if takes_enemies else 'speed'
+    return 'plain'
+
+
+def projectile_dispatch(projectile_type: type) -> ProjectileDispatch:
+    """Get the (cached) dispatch record for a projectile class"""
+    dispatch = _projectile_table.get(projectile_type)
+    if dispatch is None:
+        protocol = _projectile_protocol(projectile_type)
+        if protocol == 'speed':
+            advance = projectile_type.update_with_speed
+            update = lambda projectile, enemies, speed_multiplier: advance(projectile, speed_multiplier)
+        elif protocol == 'homing':
+            update = projectile_type.update_homing_with_speed
+        elif protocol == 'enemies':
+            update = projectile_type.update_with_speed
+        elif protocol == 'plain':
+            plain_update = projectile_type.update
+            update = lambda projectile, enemies, speed_multiplier: plain_update(projectile)
+        else:
+            raise ValueError(f"Unknown projectile update protocol '{protocol}' on {projectile_type.__name__}")
+        dispatch = ProjectileDispatch(
+            update=update,
+            check_collision=getattr(projectile_type, 'check_collision', None),
+        )
+        _projectile_table[projectile_type] = dispatch
+    return dispatch
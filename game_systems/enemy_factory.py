@@ -0,0 +1,128 @@
+"""Enemy spawning from cached prototypes, with recycling of dead enemies.
+
+Running a full enemy constructor for every spawn (base setup, config reads,
+subclass particle lists) and then WaveManager.apply_enemy_scaling's run of
+hasattr checks made spawn bursts expensive. EnemyFactory builds the first
+enemy of each (class, path, wave, scaled) combination normally and keeps a
+snapshot of its slots as a prototype; later spawns copy the snapshot into a
+new or recycled object, roll their own random immunities and run
+Enemy.on_spawn(). Mutable slot values (particle lists, trails) are deep
+copied, the path and its geometry are shared.
+
+Killed and leaked enemies are released back to the factory, but only
+become reusable once a whole wave has started and ended since, so a
+projectile or tower still holding one never sees it come back as a new
+enemy. Enemies that spawn others reach the running simulation's factory
+through get_enemy_factory() (see simulation_context).
+"""
+import copy
+from typing import Callable, Dict, List, Optional, Tuple
+
+from enemies.immunities import roll_immunities
+from .rng import get_simulation_rng
+from .simulation_context import get_context
+from .status_effects import get_status_effects
+
+# Slots pointing at shared, read-only data that prototypes never copy
+_SHARED_SLOTS = frozenset(('path', 'path_geometry', 'map_reference'))
+
+_slot_names_cache: Dict[type, Tuple[str, ...]] = {}
+
+
+def slot_names(enemy_type: type) -> Tuple[str, ...]:
+    """Get every slot an enemy class declares, base classes first"""
+    names = _slot_names_cache.get(enemy_type)
+    if names is None:
+        ordered = []
+        for klass in reversed(enemy_type.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if name not in ordered:
+                    ordered.append(name)
+        names = tuple(ordered)
+        _slot_names_cache[enemy_type] = names
+    return names
+
+
+class EnemyPrototype:
+    """Snapshot of a freshly built (and wave-scaled) enemy, stamped onto new spawns"""
+    __slots__ = ('enemy_type', 'values', 'mutable_values', 'unset_slots')
+
+    def __init__(self, enemy):
+        self.enemy_type = type(enemy)
+        self.values: List[Tuple[str, object]] = []
+        self.mutable_values: List[Tuple[str, object]] = []
+        self.unset_slots: List[str] = []
+        for name in slot_names(self.enemy_type):
+            try:
+                value = getattr(enemy, name)
+            except AttributeError:
+                self.unset_slots.append(name)
+                continue
+            if name not in _SHARED_SLOTS and isinstance(value, (list, dict, set)):
+                self.mutable_values.append((name, copy.deepcopy(value)))
+            else:
+                self.values.append((name, value))
+
+    def stamp(self, enemy):
+        """Reset an enemy of the prototype's class to the prototype's state"""
+        for name, value in self.values:
+            setattr(enemy, name, value)
+        for name, value in self.mutable_values:
+            setattr(enemy, name, copy.deepcopy(value))
+        for name in self.unset_slots:
+            if hasattr(enemy, name):
+                delattr(enemy, name)
+
+
+class EnemyFactory:
+    """Creates enemies from cached prototypes and recycles the ones that left play"""
+
+    def __init__(self):
+        self._prototypes: Dict[tuple, EnemyPrototype] = {}
+        self._free: Dict[type, List] = {}  # Recycled enemies ready for reuse, per class
+        self._released: List = []  # Left play during the current wave
+        self._retired: List = []  # Left play during the previous wave
+
+    def create(self, enemy_class: type, path: List[Tuple[int, int]], wave_number: int = 1,
+               scale: Optional[Callable] = None):
+        """Spawn an enemy, scale(enemy) is applied once per prototype (e.g. wave scaling)"""
+        key = (enemy_class, id(path), wave_number, scale is not None)
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            # First of its kind: build it normally and remember its state
+            enemy = enemy_class(path, wave_number)
+            if scale is not None:
+                scale(enemy)
+            self._prototypes[key] = EnemyPrototype(enemy)
+            return enemy
+
+        free = self._free.get(enemy_class)
+        enemy = free.pop() if free else object.__new__(enemy_class)
+        prototype.stamp(enemy)
+        # Every spawn rolls its own immunities (the same draws the constructor makes)
+        enemy.immunity_mask = (roll_immunities(enemy.wave_number, get_simulation_rng()) |
+                               enemy_class.granted_immunities)
+        enemy.on_spawn()
+        return enemy
+
+    def release(self, enemies: List):
+        """Hand back enemies that were killed or leaked (usable as a KILL/LEAK subscriber)"""
+        status_effects = get_status_effects()
+        for enemy in enemies:
+            status_effects.release(enemy)
+            self._released.append(enemy)
+
+    def recycle_released(self):
+        """Start a new wave: enemies released two waves ago become reusable"""
+        for enemy in self._retired:
+            self._free.setdefault(type(enemy), []).append(enemy)
+        self._retired, self._released = self._released, []
+
+    def pooled(self, enemy_class: type) -> int:
+        """Number of recycled enemies of a class ready for reuse"""
+        return len(self._free.get(enemy_class, ()))
+
+
+def get_enemy_factory() -> EnemyFactory:
+    """Get the enemy factory of the running simulation"""
+    return get_context().enemy_factory
@@ -0,0 +1,32 @@
+from typing import Iterable, Set
+
+
+class EntityList(list):
+    """List of game entities with deferred removal.
+
+    The simulation loop iterates the list directly (no per-tick copy) and
+    marks entities that died, leaked or expired with mark_removed(). A
+    single compact() at the end of the phase drops them all in one O(n)
+    pass, keeping the survivors in their original order so seeded runs stay
+    deterministic. Being a plain list otherwise, it works everywhere the old
+    lists did (UI drawing, len, membership, indexing).
+    """
+
+    def __init__(self, entities: Iterable = ()):
+        super().__init__(entities)
+        self._removed: Set[int] = set()
+
+    def mark_removed(self, entity):
+        """Schedule an entity for removal at the next compact()"""
+        self._removed.add(id(entity))
+
+    def is_removed(self, entity) -> bool:
+        """Check if an entity is scheduled for removal"""
+        return id(entity) in self._removed
+
+    def compact(self):
+        """Drop every marked entity in one pass, in place and order-preserving"""
+        if self._removed:
+            removed = self._removed
+            self[:] = [entity for entity in self if id(entity) not in removed]
+            removed.clear()
@@ -0,0 +1,112 @@
+"""Gameplay event bus.
+
+Damage, kills, spawns and leaks are published here as they happen during a
+tick and handed to subscribers in one batch per kind when the tick ends, so
+currency crediting, necromancer bookkeeping and any telemetry each run once
+per tick over a list instead of being woven through the update loops.
+
+Publishing to a kind nobody subscribed to is a no-op, and the per-kind queues
+are reused from tick to tick, so an idle bus costs almost nothing. Towers
+reach the running simulation's bus through get_event_bus() (see simulation_context).
+"""
+from typing import Callable, List, NamedTuple, Optional
+
+from .simulation_context import get_context
+
+# Event kinds, in the order they are dispatched
+SPAWN = 0
+DAMAGE = 1
+KILL = 2
+LEAK = 3
+EVENT_KINDS = (SPAWN, DAMAGE, KILL, LEAK)
+
+
+class DamageEvent(NamedTuple):
+    """A tower dealt damage (amount 0 is a utility hit, e.g. a slow or soak)"""
+    tower: object
+    amount: int
+
+
+class SpawnEvent(NamedTuple):
+    """An enemy entered play (parent is the enemy that spawned it, None for wave spawns)"""
+    enemy: object
+    parent: Optional[object]
+
+
+class EventBus:
+    """Per-tick queues of gameplay events and the handlers subscribed to them.
+
+    Handlers receive the whole batch of a kind: DAMAGE handlers get a list of
+    DamageEvent, SPAWN handlers a list of SpawnEvent, and KILL and LEAK
+    handlers a list of enemies.
+    """
+
+    def __init__(self):
+        self._handlers: List[List[Callable]] = [[] for _ in EVENT_KINDS]
+        self._queues: List[list] = [[] for _ in EVENT_KINDS]
+        self._spare: List[list] = [[] for _ in EVENT_KINDS]
+
+    def subscribe(self, kind: int, handler: Callable):
+        """Call handler(events) with each tick's batch of one event kind"""
+        self._handlers[kind].append(handler)
+
+    def unsubscribe(self, kind: int, handler: Callable):
+        """Stop calling a handler"""
+        self._handlers[kind].remove(handler)
+
+    def damage(self, tower, amount: int):
+        """Publish damage dealt by a tower"""
+        if self._handlers[DAMAGE]:
+            self._queues[DAMAGE].append(DamageEvent(tower, amount))
+
+    def kill(self, enemy):
+        """Publish an enemy killed by the towers"""
+        if self._handlers[KILL]:
+            self._queues[KILL].append(enemy)
+
+    def spawn(self, enemy, parent=None):
+        """Publish an enemy entering play"""
+        if self._handlers[SPAWN]:
+            self._queues[SPAWN].append(SpawnEvent(enemy, parent))
+
+    def leak(self, enemy):
+        """Publish an enemy that reached the end of the path"""
+        if self._handlers[LEAK]:
+            self._queues[LEAK].append(enemy)
+
+    def pending(self, kind: int) -> int:
+        """Number of events of a kind waiting for the next dispatch"""
+        return len(self._queues[kind])
+
+    def dispatch(self):
+        """Hand every queued batch to its subscribers and empty the queues"""
+        for kind in EVENT_KINDS:
+            events = self._queues[kind]
+            if not events:
+                continue
+            # Events published while handling go to the next dispatch
+            self._queues[kind] = self._spare[kind]
+            for handler in self._handlers[kind]:
+                handler(events)
+            events.clear()
+            self._spare[kind] = events
+
+    def clear(self):
+        """Drop every queued event (subscriptions are kept)"""
+        for events in self._queues:
+            events.clear()
+
+
+def credit_damage(events: List[DamageEvent]):
+    """DAMAGE subscriber that records tower damage and pays out upgrade currency"""
+    for tower, amount in events:
+        if amount > 0:
+            tower.track_damage_and_generate_currency(amount)
+        else:
+            # Support towers get minimal currency for successful hits
+            tower.track_utility_hit()
+
+
+def get_event_bus() -> EventBus:
+    """Get the event bus of the running simulation"""
+    return get_context().events
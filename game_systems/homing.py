@@ -0,0 +1,62 @@
+"""Target locking for homing projectiles.
+
+Homing projectiles and missiles used to search every enemy on every tick
+for the nearest one. They now keep a locked target and only re-acquire it
+when the target dies or leaks, drifts out of a cone around their heading,
+or their retarget interval runs out. Re-acquisition is a nearest-neighbour
+query on SimulationCore's enemy grid, rebuilt for the projectile phase
+and reached through get_enemy_grid(); outside a SimulationCore it falls
+back to a linear scan.
+"""
+import math
+from typing import List
+
+from .spatial_grid import get_enemy_grid
+
+RETARGET_INTERVAL = 10  # Ticks a target stays locked before checking for a closer one
+LOCK_CONE_COS = math.cos(math.radians(60))  # Targets more than 60 degrees off the heading are dropped
+
+
+def _alive(enemy) -> bool:
+    return enemy.health > 0
+
+
+def nearest_enemy(enemies: List, x: float, y: float):
+    """Get the living enemy closest to a point (first in list order on ties), None if there is none"""
+    enemy_grid = get_enemy_grid()
+    if enemy_grid.covers(enemies):
+        return enemy_grid.nearest(x, y, _alive)
+
+    nearest = None
+    best_distance_squared = 0.0
+    for enemy in enemies:
+        dx = enemy.x - x
+        dy = enemy.y - y
+        distance_squared = dx * dx + dy * dy
+        if (nearest is None or distance_squared < best_distance_squared) and enemy.health > 0:
+            nearest = enemy
+            best_distance_squared = distance_squared
+    return nearest
+
+
+def locked_target(projectile, enemies: List, heading_x: float, heading_y: float, elapsed: float):
+    """Get a projectile's target, re-acquiring it when the lock is lost or its interval has run out.
+
+    The projectile needs x, y, target_enemy, retarget_timer and
+    retarget_interval; elapsed is the ticks (speed multiplier) since its
+    last update.
+    """
+    target = projectile.target_enemy
+    projectile.retarget_timer -= elapsed
+    if target is not None and target.health > 0 and not target.reached_end and projectile.retarget_timer > 0:
+        dx = target.x - projectile.x
+        dy = target.y - projectile.y
+        # Keep it while it stays inside the cone ahead of the projectile
+        if dx * heading_x + dy * heading_y >= math.sqrt(
+                (dx * dx + dy * dy) * (heading_x * heading_x + heading_y * heading_y)) * LOCK_CONE_COS:
+            return target
+
+    target = nearest_enemy(enemies, projectile.x, projectile.y)
+    projectile.target_enemy = target
+    projectile.retarget_timer = projectile.retarget_interval
+    return target
@@ -4,6 +4,8 @@ from typing import List, Tuple, Optional
 from config.game_config import get_map_config
 from .terrain_types import *
 from .tower_sizes import *
+from .path_geometry import get_path_geometry
+from .path_terrain import PathTerrain
 
 class Map:
     """Handles grid-based map layout, terrain types, and tower placement validation"""
@@ -46,6 +48,12 @@ class Map:
         
         # Convert grid waypoints to pixel coordinates
         self.path = self._convert_waypoints_to_pixels()
+        self.path_geometry = get_path_geometry(self.path)
+        
+        # Enemy terrain speed lookups, built on first use: a flat per-cell multiplier
+        # grid and arc-length intervals along each path walked on this map
+        self._enemy_speed_grid = None
+        self._path_terrain = {}
         
         # Colors for placement preview
         self.GREEN = (0, 255, 0)
@@ -91,6 +99,30 @@ class Map:
             return self.grid_layout[grid_y][grid_x]
         return GRASS  # Default to grass if out of bounds
     
+    @property
+    def enemy_speed_grid(self) -> List[float]:
+        """Enemy speed multiplier of every cell, row by row"""
+        if self._enemy_speed_grid is None:
+            self._enemy_speed_grid = [get_enemy_speed_multiplier(terrain_type)
+                                      for row in self.grid_layout for terrain_type in row]
+        return self._enemy_speed_grid
+    
+    def terrain_speed_at(self, pixel_x: float, pixel_y: float) -> float:
+        """Get the enemy speed multiplier of the terrain at pixel coordinates (same cells as get_terrain_at_pixel)"""
+        grid_x = (int(pixel_x) - self.map_offset_x) // self.cell_size
+        grid_y = (int(pixel_y) - self.map_offset_y) // self.cell_size
+        if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
+            return self.enemy_speed_grid[grid_y * self.grid_width + grid_x]
+        return 1.0
+    
+    def path_terrain(self, geometry) -> PathTerrain:
+        """Get the (cached) terrain speed intervals along a path"""
+        path_terrain = self._path_terrain.get(id(geometry))
+        if path_terrain is None or path_terrain.geometry is not geometry:
+            path_terrain = PathTerrain(self, geometry)
+            self._path_terrain[id(geometry)] = path_terrain
+        return path_terrain
+    
     def is_valid_tower_position(self, pixel_x: int, pixel_y: int, existing_towers: List, 
                               tower_type: str = None) -> bool:
         """Check if a position is valid for tower placement"""
@@ -0,0 +1,67 @@
+import math
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+
+class PathGeometry:
+    """Arc-length parameterization of a waypoint path.
+
+    Segment lengths and unit directions are computed once, so turning a
+    distance along the path into an (x, y) position is a lookup plus a
+    multiply-add instead of a sqrt per enemy per tick.
+    """
+
+    def __init__(self, waypoints: List[Tuple[float, float]]):
+        self.waypoints = [(float(x), float(y)) for x, y in waypoints]
+        self.cumulative_lengths = [0.0]  # Distance from start to each waypoint
+        self.directions = []  # Unit vector of each segment
+
+        for (x1, y1), (x2, y2) in zip(self.waypoints, self.waypoints[1:]):
+            length = math.hypot(x2 - x1, y2 - y1)
+            self.cumulative_lengths.append(self.cumulative_lengths[-1] + length)
+            if length > 0:
+                self.directions.append(((x2 - x1) / length, (y2 - y1) / length))
+            else:
+                self.directions.append((0.0, 0.0))
+
+        self.total_length = self.cumulative_lengths[-1]
+        self.last_index = len(self.waypoints) - 1
+
+    def segment_index_at(self, distance: float, hint: int = 0) -> int:
+        """Get the index of the last waypoint at or before a distance along the path.
+
+        Enemies only move forward, so a valid hint (their previous index) is
+        advanced with a cursor; otherwise falls back to a binary search.
+        """
+        cumulative = self.cumulative_lengths
+        if 0 <= hint <= self.last_index and cumulative[hint] <= distance:
+            index = hint
+            while index < self.last_index and cumulative[index + 1] <= distance:
+                index += 1
+            return index
+        return max(0, min(bisect_right(cumulative, distance) - 1, self.last_index))
+
+    def position_at(self, distance: float, hint: int = 0) -> Tuple[float, float, int]:
+        """Get (x, y, waypoint index) for a distance along the path"""
+        index = self.segment_index_at(distance, hint)
+        x, y = self.waypoints[index]
+        if index == self.last_index:
+            return x, y, index
+
+        along = distance - self.cumulative_lengths[index]
+        direction_x, direction_y = self.directions[index]
+        return x + direction_x * along, y + direction_y * along, index
+
+
+# Geometry is shared by every enemy walking the same path
+_geometry_cache: Dict[Tuple[Tuple[float, float], ...], PathGeometry] = {}
+
+
+def get_path_geometry(path: List[Tuple[float, float]]) -> PathGeometry:
+    """Get the (cached) arc-length geometry for a path"""
+    key = tuple((point[0], point[1]) for point in path)
+    geometry = _geometry_cache.get(key)
+    if geometry is None:
+        geometry = PathGeometry(path)
+        _geometry_cache[key] = geometry
+    return geometry
@@ -0,0 +1,92 @@
+import math
+from bisect import bisect_right
+from typing import List
+
+
+class PathTerrain:
+    """Terrain speed multipliers along a path, as arc-length intervals.
+
+    Each segment of the path is cut where the pixel it passes over enters a
+    new map cell, and consecutive pieces with the same multiplier are merged,
+    so the result is a short sorted list of (start distance, multiplier)
+    intervals. An enemy on the path finds its terrain from its path progress
+    with a cursor that starts at its current segment, instead of converting
+    its position to grid coordinates every tick. Cells are judged exactly as
+    Map.get_terrain_at_pixel judges int(x), int(y).
+    """
+
+    def __init__(self, game_map, geometry):
+        self.geometry = geometry
+        self.starts: List[float] = []  # Distance along the path where each interval begins
+        self.multipliers: List[float] = []
+        self.segment_intervals: List[int] = []  # Interval holding each waypoint (cursor start per segment)
+
+        cell_size = game_map.cell_size
+        for index in range(geometry.last_index):
+            segment_start = geometry.cumulative_lengths[index]
+            length = geometry.cumulative_lengths[index + 1] - segment_start
+            start_x, start_y = geometry.waypoints[index]
+            direction_x, direction_y = geometry.directions[index]
+
+            # Distances along the path where int(x) or int(y) reaches a cell edge
+            cuts = {segment_start}
+            for start, direction, offset in ((start_x, direction_x, game_map.map_offset_x),
+                                             (start_y, direction_y, game_map.map_offset_y)):
+                if direction == 0 or length <= 0:
+                    continue
+                end = start + direction * length
+                first_edge = math.ceil((min(start, end) - offset) / cell_size)
+                last_edge = math.floor((max(start, end) - offset) / cell_size)
+                for edge in range(first_edge, last_edge + 1):
+                    along = (offset + edge * cell_size - start) / direction
+                    if 0 <= along < length:
+                        cut = segment_start + along
+                        if direction < 0:
+                            # Leaving a cell downwards: the edge pixel itself still belongs to the old cell
+                            cut = math.nextafter(cut, math.inf)
+                        cuts.add(cut)
+
+            # Judge each piece by its middle (its start if it is too short to have one)
+            cuts = sorted(cuts)
+            for cut, next_cut in zip(cuts, cuts[1:] + [segment_start + length]):
+                sample = (cut + next_cut) / 2 if next_cut - cut > 1e-6 else cut
+                along = sample - segment_start
+                self._add(cut, game_map.terrain_speed_at(start_x + direction_x * along,
+                                                         start_y + direction_y * along))
+
+        # The final waypoint, where finished enemies stand
+        end_x, end_y = geometry.waypoints[-1]
+        self._add(geometry.total_length, game_map.terrain_speed_at(end_x, end_y))
+        self.segment_intervals = [self._interval_at_or_before(distance) for distance in geometry.cumulative_lengths]
+
+    def _add(self, start: float, multiplier: float):
+        """Append an interval, merging it with the previous one if the terrain is the same"""
+        if self.starts and self.starts[-1] >= start:
+            # Zero-length piece (a cut on a waypoint) - the later terrain wins
+            self.starts.pop()
+            self.multipliers.pop()
+        if self.multipliers and self.multipliers[-1] == multiplier:
+            return
+        self.starts.append(start)
+        self.multipliers.append(multiplier)
+
+    def _interval_at_or_before(self, distance: float) -> int:
+        """Index of the interval holding a distance"""
+        return max(0, bisect_right(self.starts, distance) - 1)
+
+    def multiplier_at(self, distance: float, path_index: int = 0) -> float:
+        """Get the terrain speed multiplier at a distance along the path.
+
+        The enemy's waypoint index picks the first interval of its segment and
+        a cursor walks forward from there; an unusable hint falls back to a
+        binary search.
+        """
+        starts = self.starts
+        if 0 <= path_index < len(self.segment_intervals):
+            interval = self.segment_intervals[path_index]
+            if starts[interval] <= distance:
+                last = len(starts) - 1
+                while interval < last and starts[interval + 1] <= distance:
+                    interval += 1
+                return self.multipliers[interval]
+        return self.multipliers[self._interval_at_or_before(distance)]
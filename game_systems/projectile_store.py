@@ -0,0 +1,148 @@
+from typing import Dict, List
+
+from projectiles.projectile import Projectile, NO_HIT, SCREEN_BOUNDS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - projectiles fall back to per-object updates
+    np = None
+
+
+# Methods a batched projectile must inherit unchanged from Projectile
+_BATCHED_METHODS = ('update_with_speed', 'has_reached_target', 'is_off_screen', 'check_collision',
+                    'touching', 'reached_trigger_point')
+
+
+class ProjectileStore:
+    """Struct-of-arrays backend for straight-flying projectiles.
+
+    SimulationCore calls advance() at the start of the projectile phase:
+    every batchable projectile (one with the base Projectile flight and
+    collision check, and its own resolve_hits) is moved in one vectorized
+    step, and a single projectiles x enemies overlap matrix replaces each
+    projectile's Python scan over all enemies. Hits are then resolved in the
+    original projectile order through the projectiles' own resolve_hits, so
+    damage order is unchanged.
+    Enemies that can move when damaged (teleporters) are re-read after every
+    hit so later projectiles see where they went.
+    """
+
+    def __init__(self, min_batch_size: int = 8):
+        self.min_batch_size = min_batch_size
+        self.clear()
+
+    @property
+    def available(self) -> bool:
+        """Whether vectorized updates can run in this environment"""
+        return np is not None
+
+    def clear(self):
+        """Drop per-tick state"""
+        self.rows: Dict[int, int] = {}  # id(projectile) -> row
+        self.enemies = None
+        self.overlaps = None
+        self.reached_target = None
+        self.projectile_x = None
+        self.projectile_y = None
+        self.reach = None
+        self.enemy_x = None
+        self.enemy_y = None
+        self.enemy_size = None
+        self.movable_enemies: List[int] = []
+
+    def handles(self, projectile) -> bool:
+        """Check if a projectile was advanced by this tick's batch"""
+        return id(projectile) in self.rows
+
+    def advance(self, projectiles: List, enemies: List, speed_multiplier: float):
+        """Move every batchable projectile and compute which enemies each one overlaps"""
+        self.clear()
+        if np is None:
+            return
+
+        batch = [projectile for projectile in projectiles if self._is_batchable(projectile)]
+        if len(batch) < self.min_batch_size:
+            return
+
+        # Flight: same arithmetic as Projectile.update_with_speed
+        x = np.array([projectile.x for projectile in batch], dtype=float)
+        y = np.array([projectile.y for projectile in batch], dtype=float)
+        x += np.array([projectile.velocity_x for projectile in batch], dtype=float) * speed_multiplier
+        y += np.array([projectile.velocity_y for projectile in batch], dtype=float) * speed_multiplier
+        distance = np.array([projectile.distance_traveled for projectile in batch], dtype=float)
+        distance += np.array([projectile.speed for projectile in batch], dtype=float) * speed_multiplier
+        max_distance = np.array([projectile.max_distance for projectile in batch], dtype=float)
+        min_x, max_x, min_y, max_y = SCREEN_BOUNDS
+        expired = (distance >= max_distance) | (x < min_x) | (x > max_x) | (y < min_y) | (y > max_y)
+
+        target_dx = x - np.array([projectile.target_x for projectile in batch], dtype=float)
+        target_dy = y - np.array([projectile.target_y for projectile in batch], dtype=float)
+        target_distance = np.sqrt(target_dx * target_dx + target_dy * target_dy)
+        impacted = target_distance < np.array([projectile.target_radius for projectile in batch], dtype=float)
+
+        for projectile, new_x, new_y, new_distance, is_expired, has_impacted in zip(
+                batch, x.tolist(), y.tolist(), distance.tolist(), expired.tolist(), impacted.tolist()):
+            projectile.x = new_x
+            projectile.y = new_y
+            projectile.distance_traveled = new_distance
+            if is_expired:
+                projectile.should_remove = True
+            if has_impacted:
+                projectile.on_impact()
+
+        # Kinds that also go off at their target point without touching an enemy (water, splash)
+        self.reached_target = target_distance < np.array(
+            [projectile.trigger_radius for projectile in batch], dtype=float)
+        self.rows = {id(projectile): row for row, projectile in enumerate(batch)}
+        self.projectile_x = x
+        self.projectile_y = y
+        self.reach = np.array([projectile.size for projectile in batch], dtype=float)
+
+        # Collision: one overlap matrix instead of a scan per projectile
+        self.enemies = enemies
+        self.enemy_x = np.array([enemy.x for enemy in enemies], dtype=float)
+        self.enemy_y = np.array([enemy.y for enemy in enemies], dtype=float)
+        self.enemy_size = np.array([enemy.size for enemy in enemies], dtype=float)
+        self.overlaps = self._overlap(slice(None))
+
+        from enemies.enemy import Enemy
+        self.movable_enemies = [index for index, enemy in enumerate(enemies)
+                                if type(enemy).take_damage is not Enemy.take_damage]
+
+    def resolve_hits(self, projectile) -> dict:
+        """Resolve an advanced projectile's collision through its own resolve_hits"""
+        row = self.rows[id(projectile)]
+        hits = np.flatnonzero(self.overlaps[row]).tolist()
+
+        if hits or self.reached_target[row]:
+            result = projectile.resolve_hits(self.enemies, hits)
+            self.refresh_enemy_positions()
+            return result
+        return dict(NO_HIT)
+
+    def refresh_enemy_positions(self):
+        """Re-read enemies that may have moved when hit and update their overlap columns"""
+        if self.enemies is None:
+            return
+        for index in self.movable_enemies:
+            enemy = self.enemies[index]
+            if enemy.x != self.enemy_x[index] or enemy.y != self.enemy_y[index]:
+                self.enemy_x[index] = enemy.x
+                self.enemy_y[index] = enemy.y
+                self.overlaps[:, index] = self._overlap(index)
+
+    def _overlap(self, columns):
+        """Overlap test between every projectile and the selected enemy columns"""
+        dx = self.projectile_x[:, np.newaxis] - np.atleast_1d(self.enemy_x[columns])[np.newaxis, :]
+        dy = self.projectile_y[:, np.newaxis] - np.atleast_1d(self.enemy_y[columns])[np.newaxis, :]
+        reach = self.reach[:, np.newaxis] + np.atleast_1d(self.enemy_size[columns])[np.newaxis, :]
+        overlap = np.sqrt(dx * dx + dy * dy) < reach
+        return overlap if isinstance(columns, slice) else overlap[:, 0]
+
+    @staticmethod
+    def _is_batchable(projectile) -> bool:
+        """Check if a projectile flies straight and resolves its hits through resolve_hits"""
+        projectile_type = type(projectile)
+        return (isinstance(projectile, Projectile)
+                and projectile_type.resolve_hits is not Projectile.resolve_hits
+                and all(getattr(projectile_type, name) is getattr(Projectile, name) for name in _BATCHED_METHODS))
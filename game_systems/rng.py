@@ -0,0 +1,35 @@
+"""Random number streams for the simulation.
+
+Everything that can change the outcome of a game (immunity rolls, wave enemy
+picks, splits, teleports, dodges, summon positions) must draw from
+get_simulation_rng() instead of the global random module. SimulationCore owns
+a random.Random seeded from its constructor and puts it in the simulation
+context it installs before each tick (see simulation_context), so two cores
+created with the same seed and fed the same inputs produce identical state.
+
+Particles and other visual-only effects use the separate cosmetic stream and
+are skipped entirely when cosmetics are disabled.
+"""
+import random
+
+from .simulation_context import get_context
+
+
+def get_simulation_rng() -> random.Random:
+    """Get the random stream used for gameplay decisions"""
+    return get_context().rng
+
+
+# Visual-only effects (particles, sparks, flicker) draw from their own stream so
+# that rendering, or skipping it, never shifts the gameplay stream above
+_cosmetic_rng = random.Random()
+
+
+def get_cosmetic_rng() -> random.Random:
+    """Get the random stream used for visual-only effects"""
+    return _cosmetic_rng
+
+
+def cosmetics_enabled() -> bool:
+    """Check whether visual-only effects should be generated (headless runs turn them off)"""
+    return get_context().cosmetics
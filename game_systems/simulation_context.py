@@ -0,0 +1,55 @@
+"""Services of the running simulation.
+
+Entities deep inside an update (an enemy rolling immunities, a projectile
+setting off a blast, a tower publishing damage) need the services of the
+simulation they belong to. SimulationCore bundles its services into one
+SimulationContext and installs it with set_context() at the start of each
+tick. Entities reach the services through get_context(), or through the
+accessor each service module keeps (get_simulation_rng(),
+get_status_effects(), ...). Outside a SimulationCore (tests, tools, legacy
+runners) a fallback context with fresh services is used.
+"""
+import random
+from typing import Optional
+
+
+class SimulationContext:
+    """The per-simulation services entities use while a simulation runs"""
+    __slots__ = ('rng', 'cosmetics', 'status_effects', 'events', 'enemy_factory', 'area_effects',
+                 'enemy_grid', 'visibility')
+
+    def __init__(self, rng: Optional[random.Random] = None, cosmetics: bool = True, status_effects=None,
+                 events=None, enemy_factory=None, area_effects=None, enemy_grid=None, visibility=None):
+        # Imported here: the service modules read the context through this module
+        from .status_effects import StatusEffects
+        from .events import EventBus
+        from .enemy_factory import EnemyFactory
+        from .area_effects import AreaEffects
+        from .spatial_grid import SpatialGrid
+        from .visibility import Visibility
+
+        self.rng = rng if rng is not None else random.Random()  # Gameplay random stream
+        self.cosmetics = cosmetics  # Whether visual-only effects are generated
+        self.status_effects = status_effects if status_effects is not None else StatusEffects()
+        self.events = events if events is not None else EventBus()
+        self.enemy_factory = enemy_factory if enemy_factory is not None else EnemyFactory()
+        self.area_effects = area_effects if area_effects is not None else AreaEffects()
+        self.enemy_grid = enemy_grid if enemy_grid is not None else SpatialGrid()
+        self.visibility = visibility if visibility is not None else Visibility()
+
+
+_context: Optional[SimulationContext] = None
+
+
+def get_context() -> SimulationContext:
+    """Get the context of the running simulation (a fallback one outside a SimulationCore)"""
+    global _context
+    if _context is None:
+        _context = SimulationContext()
+    return _context
+
+
+def set_context(context: SimulationContext):
+    """Install the context of the running simulation"""
+    global _context
+    _context = context
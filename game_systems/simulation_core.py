@@ -0,0 +1,454 @@
+import random
+from typing import List, Optional, Tuple
+
+from config.game_config import get_game_config
+from .map import Map
+from .wave_manager import WaveManager
+from .tower_manager import TowerManager
+from .tower_upgrade_system import TowerUpgradeSystem
+from .simulation_context import SimulationContext, set_context
+from .spatial_grid import SpatialGrid
+from .targeting_matrix import TargetingMatrix
+from .projectile_store import ProjectileStore
+from .tower_registry import TowerRegistry
+from .status_effects import StatusEffects
+from .area_effects import AreaEffects
+from .visibility import Visibility
+from .enemy_factory import EnemyFactory
+from .events import EventBus, DAMAGE, KILL, SPAWN, LEAK, credit_damage
+from .entity_list import EntityList
+from .dispatch import enemy_dispatch, tower_dispatch, projectile_dispatch
+
+
+class SimulationCore:
+    """Headless game simulation - owns all gameplay state and advances it tick by tick.
+
+    Nothing in here touches the display, the event queue or the frame clock, so
+    balance runs can call step() as fast as the CPU allows. Game wraps this class
+    and only adds input handling and rendering on top.
+
+    All gameplay randomness comes from self.rng. Passing a seed makes the run
+    deterministic: the same seed and the same inputs give identical state.
+    With cosmetics=False particle effects are skipped; they use their own random
+    stream, so this does not change gameplay.
+    """
+
+    def __init__(self, screen_width: int = 1200, screen_height: int = 800, map_name: str = 'default_map',
+                 seed: Optional[int] = None, cosmetics: bool = True):
+        self.game_config = get_game_config()
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.map_name = map_name
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.cosmetics = cosmetics
+
+        self.map = Map(screen_width, screen_height, map_name)
+        self.reset()
+
+    def reset(self):
+        """Reset all gameplay state to the start of a new game"""
+        # Restart the random stream so a seeded game replays identically
+        self.rng.seed(self.seed)
+
+        self.money = self.game_config.get('starting_money', 20)
+        self.lives = self.game_config.get('starting_lives', 20)
+        self.game_speed = 1
+        self.game_over = False
+        self.victory = False
+        self.tick_count = 0
+
+        # Wave completion tracking
+        self.completed_wave_number = 0
+        self.wave_bonus = 0
+
+        # Game objects
+        self.enemies = EntityList()
+        self.towers = EntityList()
+        self.projectiles = EntityList()
+
+        # Gameplay systems
+        self.wave_manager = WaveManager(self.map.get_path())
+        self.tower_manager = TowerManager()
+        self.tower_manager.set_current_wave(1)
+        self.upgrade_system = TowerUpgradeSystem()
+        self.enemy_grid = SpatialGrid()
+        self.targeting_matrix = TargetingMatrix()
+        self.projectile_store = ProjectileStore()
+        self.tower_registry = TowerRegistry()
+        self.status_effects = StatusEffects()
+        self.enemy_factory = EnemyFactory()
+        # Explosions and splashes are queued and resolved once at the end of the projectile phase
+        self.area_effects = AreaEffects(self.find_tower_by_id, deferred=True)
+        # Invisible enemies and what detectors reveal, kept current from spawn/kill/leak events
+        self.visibility = Visibility(tracking=True)
+
+        # Gameplay events, handed to subscribers once at the end of each tick
+        self.events = EventBus()
+        self.dead_enemy_trackers: List = []  # Necromancer bosses in play
+        self.events.subscribe(DAMAGE, credit_damage)
+        self.events.subscribe(KILL, self._reward_kills)
+        self.events.subscribe(KILL, self._register_deaths)
+        self.events.subscribe(SPAWN, self._track_spawns)
+        self.events.subscribe(KILL, self._untrack_enemies)
+        self.events.subscribe(LEAK, self._untrack_enemies)
+        self.events.subscribe(SPAWN, self.visibility.track)
+        self.events.subscribe(KILL, self.visibility.untrack)
+        self.events.subscribe(LEAK, self.visibility.untrack)
+        # Released last, after every other subscriber has seen the enemies
+        self.events.subscribe(KILL, self.enemy_factory.release)
+        self.events.subscribe(LEAK, self.enemy_factory.release)
+
+        # The services entities reach while this simulation runs (see simulation_context)
+        self.context = SimulationContext(self.rng, self.cosmetics, self.status_effects, self.events,
+                                         self.enemy_factory, self.area_effects, self.enemy_grid, self.visibility)
+        set_context(self.context)
+
+    def set_map(self, game_map: Map):
+        """Swap in a new map (e.g. after a resolution change) and restart wave spawning on its path"""
+        self.map = game_map
+        self.screen_width = game_map.screen_width
+        self.screen_height = game_map.screen_height
+        self.wave_manager = WaveManager(self.map.get_path())
+
+    @property
+    def is_finished(self) -> bool:
+        """True once the game has been won or lost"""
+        return self.game_over or self.victory
+
+    def attempt_tower_placement(self, pos: Tuple[int, int]):
+        """Place the tower currently selected in the tower manager, returns the tower or None"""
+        success, tower, cost = self.tower_manager.attempt_tower_placement(
+            pos, self.money, self.towers, self.map
+        )
+
+        if success and tower:
+            # Compact ID for O(1) damage attribution
+            self.tower_registry.register(tower)
+            # Set upgrade system reference for currency generation
+            tower.set_upgrade_system_reference(self.upgrade_system)
+            tower.set_spatial_index_reference(self.enemy_grid)
+            tower.set_targeting_matrix_reference(self.targeting_matrix)
+            self.towers.append(tower)
+            self.money -= cost
+            return tower
+        return None
+
+    def place_tower(self, tower_type: str, pos: Tuple[int, int]):
+        """Select and place a tower in one call (for scripted/headless play)"""
+        self.tower_manager.select_tower_type(tower_type)
+        tower = self.attempt_tower_placement(pos)
+        if tower is None:
+            self.tower_manager.cancel_placement()
+        return tower
+
+    def remove_tower(self, tower) -> int:
+        """Remove a tower and refund 50% of its cost, returns the refund"""
+        if tower not in self.towers:
+            return 0
+
+        # Calculate refund (50% of current tower cost)
+        tower_type = tower.tower_type
+        current_cost = self.tower_manager.get_tower_cost(tower_type)
+        refund = int(current_cost * 0.5)
+
+        self.towers.mark_removed(tower)
+        self.towers.compact()
+        self.tower_registry.unregister(tower)
+        self._release_tower_ids()
+        self.status_effects.forget_source(tower)
+        self.upgrade_system.clear_tower_currency(tower.tower_id)
+        self.money += refund
+
+        # Decrease tower count for dynamic pricing
+        if tower_type in self.tower_manager.towers_built_count:
+            self.tower_manager.towers_built_count[tower_type] = max(0,
+                self.tower_manager.towers_built_count[tower_type] - 1)
+
+        return refund
+
+    def step(self, n_ticks: int = 1) -> int:
+        """Advance the simulation by up to n_ticks, returns the number of ticks actually run"""
+        ticks_run = 0
+        for _ in range(n_ticks):
+            if self.is_finished:
+                break
+            self.tick()
+            ticks_run += 1
+        return ticks_run
+
+    def tick(self) -> Optional[dict]:
+        """Run a single simulation tick, returns wave completion info if a wave ended"""
+        # Make sure entities use this simulation's random stream and services
+        set_context(self.context)
+
+        # Single update pass - entities handle speed internally
+        self.update_enemies()
+        self.update_towers()
+        self.update_projectiles()
+        wave_info = self.update_waves()
+        self.events.dispatch()
+        self.tick_count += 1
+        return wave_info
+
+    def _lose_life(self):
+        """An enemy leaked through - lose a life and check for game over"""
+        self.lives -= 1
+        if self.lives <= 0:
+            self.game_over = True
+
+    def _place_spawn_near(self, spawned, parent, x: float, y: float):
+        """Start a spawned enemy at its parent's path progress, displaced to (x, y)"""
+        path_x, path_y, _ = parent.path_geometry.position_at(parent.distance_traveled, parent.path_index)
+        spawned.set_path_progress(parent.distance_traveled, x - path_x, y - path_y)
+
+    def update_enemies(self):
+        """Update all enemies"""
+        enemies_to_add = []
+
+        # Burn and poison hits, once per tick however many towers applied them
+        self.status_effects.update(self.game_speed)
+
+        for enemy in self.enemies:
+            dispatch = enemy_dispatch(type(enemy))
+
+            # Pass game speed to enemy update for faster movement
+            dispatch.update(enemy, self.game_speed)
+
+            # Handle boss minion spawning (while boss is alive)
+            if dispatch.spawns_minions and enemy.should_spawn_minions():
+                minion_count = enemy.get_minion_count()
+                for i in range(minion_count):
+                    from enemies import BasicEnemy
+                    minion = self.enemy_factory.create(BasicEnemy, self.map.get_path())
+                    self._place_spawn_near(minion, enemy, enemy.x + (i - minion_count/2) * 30, enemy.y)
+                    # Set map reference for terrain effects
+                    minion.set_map_reference(self.map)
+                    enemies_to_add.append(minion)
+                    self.events.spawn(minion, enemy)
+
+            # Handle TimeLord Boss echo spawning
+            if dispatch.spawns_echoes:
+                spawnable_rifts = enemy.should_spawn_echoes()
+                for rift in spawnable_rifts:
+                    from enemies import BasicEnemy
+                    echo = self.enemy_factory.create(BasicEnemy, self.map.get_path())
+                    self._place_spawn_near(echo, enemy, rift['x'], rift['y'])
+                    echo.health = echo.health * 0.5  # Echo enemies are weaker
+                    echo.color = (150, 0, 255)  # Purple tint for echoes
+                    echo.set_map_reference(self.map)
+                    enemies_to_add.append(echo)
+                    self.events.spawn(echo, enemy)
+
+            # Handle Necromancer Boss undead summoning
+            if dispatch.summons_undead and enemy.should_summon_undead():
+                from enemies import BasicEnemy
+                undead = self.enemy_factory.create(BasicEnemy, self.map.get_path())
+                undead_x = enemy.x + self.rng.uniform(-60, 60)
+                undead_y = enemy.y + self.rng.uniform(-60, 60)
+                self._place_spawn_near(undead, enemy, undead_x, undead_y)
+                undead.color = (100, 100, 50)  # Sickly green for undead
+                undead.health = undead.health * 0.7  # Undead are somewhat weaker
+                undead.set_map_reference(self.map)
+                enemies_to_add.append(undead)
+                self.events.spawn(undead, enemy)
+
+            # Handle enemy death and removal
+            if enemy.health <= 0:
+                # Check if enemy reached end or was killed
+                if not enemy.reached_end:
+                    # Enemy was killed - reward and necromancer bookkeeping run on dispatch
+                    self.events.kill(enemy)
+
+                    # Handle splitting enemies or other on_death mechanics
+                    if dispatch.on_death is not None:
+                        spawned_enemies = dispatch.on_death(enemy)
+                        if spawned_enemies:
+                            for spawned_enemy in spawned_enemies:
+                                # Set map reference for terrain effects
+                                spawned_enemy.set_map_reference(self.map)
+                                enemies_to_add.append(spawned_enemy)
+                                self.events.spawn(spawned_enemy, enemy)
+                else:
+                    # Enemy reached end - lose lives
+                    self._lose_life()
+                    self.events.leak(enemy)
+
+                self.enemies.mark_removed(enemy)
+            elif enemy.reached_end:
+                # Enemy reached the end
+                self._lose_life()
+                self.events.leak(enemy)
+                self.enemies.mark_removed(enemy)
+
+        # Drop dead and leaked enemies in one pass, then add any spawned enemies
+        self.enemies.compact()
+        self.enemies.extend(enemies_to_add)
+        # Spawned enemies must be detectable by this tick's detectors, before SPAWN is dispatched
+        for spawned_enemy in enemies_to_add:
+            self.visibility.add(spawned_enemy)
+
+    def _reward_kills(self, killed: List):
+        """KILL subscriber - award the bounty for every enemy killed this tick"""
+        for enemy in killed:
+            self.money += enemy.reward
+
+    def _register_deaths(self, killed: List):
+        """KILL subscriber - let Necromancer bosses know what died for resurrection"""
+        for boss in self.dead_enemy_trackers:
+            for enemy in killed:
+                boss.register_dead_enemy(type(enemy).__name__, enemy.x, enemy.y)
+
+    def _track_spawns(self, spawns: List):
+        """SPAWN subscriber - remember Necromancer bosses as they enter play"""
+        for enemy, _ in spawns:
+            if enemy_dispatch(type(enemy)).tracks_dead_enemies:
+                self.dead_enemy_trackers.append(enemy)
+
+    def _untrack_enemies(self, enemies: List):
+        """KILL/LEAK subscriber - forget Necromancer bosses that left play"""
+        if self.dead_enemy_trackers:
+            for enemy in enemies:
+                if enemy in self.dead_enemy_trackers:
+                    self.dead_enemy_trackers.remove(enemy)
+
+    def _update_tower(self, tower):
+        """Update a single tower (direct damage is reported through the event bus)"""
+        # Pass game speed to tower update for faster firing with optimizations
+        tower_dispatch(type(tower)).update(tower, self.enemies, self.projectiles, self.game_speed)
+
+    def update_towers(self):
+        """Update all towers"""
+        # Index enemy positions once for every tower's range queries this tick
+        self.enemy_grid.rebuild(self.enemies)
+
+        # Update detector towers first so other towers can see detected enemies
+        detectors = [tower for tower in self.towers if tower.tower_type == 'detector']
+        self.visibility.update(detectors, self.enemies)
+        for tower in detectors:
+            self._update_tower(tower)
+        self.visibility.publish()
+
+        # Detection is settled now - compute every tower's range and eligibility in one batch
+        self.targeting_matrix.rebuild(self.towers, self.enemies)
+
+        for tower in self.towers:
+            if tower.tower_type != 'detector':
+                self._update_tower(tower)
+
+        self.enemy_grid.clear()
+        self.targeting_matrix.clear()
+
+    def update_projectiles(self):
+        """Update all projectiles"""
+        # Homing projectiles re-acquire targets with nearest-enemy queries on a fresh index
+        if self.projectiles:
+            self.enemy_grid.rebuild(self.enemies)
+
+        # Straight-flying projectiles are moved and collision-tested in one batch
+        self.projectile_store.advance(self.projectiles, self.enemies, self.game_speed)
+
+        for projectile in self.projectiles:
+            if self.projectile_store.handles(projectile):
+                collision_result = self.projectile_store.resolve_hits(projectile)
+            else:
+                dispatch = projectile_dispatch(type(projectile))
+                dispatch.update(projectile, self.enemies, self.game_speed)
+
+                # Check projectile collisions with enemies
+                collision_result = None
+                if dispatch.check_collision is not None:
+                    collision_result = dispatch.check_collision(projectile, self.enemies)
+                    # Later batched projectiles must see enemies this hit moved
+                    self.projectile_store.refresh_enemy_positions()
+
+            self._credit_projectile_hit(collision_result)
+
+            if projectile.should_remove:
+                self.projectiles.mark_removed(projectile)
+
+        # Every blast set off this tick, resolved in one pass over a fresh spatial index
+        self.area_effects.resolve(self.enemies)
+
+        self.projectiles.compact()
+        self.projectile_store.clear()
+        self.enemy_grid.clear()
+
+        if self.tower_registry.retired:
+            self._release_tower_ids()
+
+    def _credit_projectile_hit(self, collision_result):
+        """Handle damage tracking for currency generation"""
+        if isinstance(collision_result, dict) and collision_result.get('hit'):
+            damage_dealt = collision_result.get('damage', 0)
+            tower_id = collision_result.get('tower_id')
+
+            # Ensure damage_dealt is not None and is a number
+            if damage_dealt is None:
+                damage_dealt = 0
+
+            if tower_id is not None:
+                # Find the tower - currency is credited when the tick's events are dispatched
+                tower = self.find_tower_by_id(tower_id)
+                if tower:
+                    self.events.damage(tower, damage_dealt)
+
+    def _release_tower_ids(self):
+        """Free the IDs of removed towers once no projectile in flight or queued blast carries them"""
+        in_use = [getattr(projectile, 'source_tower_id', None) for projectile in self.projectiles]
+        in_use.extend(blast.tower_id for blast in self.area_effects.queue)
+        self.tower_registry.release(in_use)
+
+    def find_tower_by_id(self, tower_id: int):
+        """Find a placed tower by its registry ID"""
+        return self.tower_registry.get(tower_id)
+
+    def update_waves(self) -> Optional[dict]:
+        """Update wave management, returns wave completion info when a wave ends"""
+        # Spawn every enemy due this tick (more than one at high game speeds)
+        for new_enemy in self.wave_manager.spawn_enemies(self.game_speed):
+            # Set map reference for terrain effects
+            new_enemy.set_map_reference(self.map)
+            self.enemies.append(new_enemy)
+            self.events.spawn(new_enemy)
+
+        # Check for wave completion
+        wave_info = self.wave_manager.update(self.enemies)
+        if wave_info:
+            if wave_info.get('game_completed', False):
+                # Player has beaten the final wave!
+                self.victory = True
+            elif wave_info.get('wave_completed', False):
+                # Normal wave completion - store the completed wave number BEFORE incrementing
+                self.completed_wave_number = wave_info['wave_number']
+                self.money += wave_info['money_bonus']
+                self.wave_bonus = wave_info['money_bonus']
+
+                # Start next wave
+                if not wave_info.get('is_final_wave', False):
+                    next_wave_info = self.wave_manager.start_next_wave()
+                    self.enemy_factory.recycle_released()
+                    if next_wave_info:
+                        # Update tower costs for the new wave
+                        current_wave = next_wave_info.get('wave_number', 1)
+                        self.tower_manager.set_current_wave(current_wave)
+        return wave_info
+
+    def get_state(self) -> dict:
+        """Get a snapshot of the gameplay state"""
+        return {
+            'tick': self.tick_count,
+            'money': self.money,
+            'lives': self.lives,
+            'wave_info': self.wave_manager.get_wave_info(),
+            'game_over': self.game_over,
+            'victory': self.victory,
+            'completed_wave_number': self.completed_wave_number,
+            'wave_bonus': self.wave_bonus,
+            'game_speed': self.game_speed,
+            'entity_counts': {
+                'enemies': len(self.enemies),
+                'towers': len(self.towers),
+                'projectiles': len(self.projectiles)
+            }
+        }
@@ -0,0 +1,285 @@
+import math
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .simulation_context import get_context
+
+_by_distance_then_index = itemgetter(0, 1)
+
+
+def targetable_with(enemy, can_target_flying: bool, can_target_invisible: bool) -> bool:
+    """Check if a tower with these targeting flags may target an enemy"""
+    if not can_target_flying and getattr(enemy, 'flying', False):
+        return False
+    if not can_target_invisible and getattr(enemy, 'invisible', False):
+        return getattr(enemy, 'detected_by_detector', False)
+    return True
+
+
+def beam_hits(candidates: Iterable[Tuple[int, object]], x: float, y: float, direction_x: float,
+              direction_y: float, length: float, half_width: float) -> List[Tuple[object, float]]:
+    """Get the (enemy, distance) pairs of (index, enemy) candidates inside a beam, nearest first.
+
+    The beam starts at (x, y) and runs along a unit direction for length;
+    enemies count if they are in front, within length of the start and
+    within half_width of the beam's centre line. Equal distances keep list order.
+    """
+    hits = []
+    for index, enemy in candidates:
+        dx = enemy.x - x
+        dy = enemy.y - y
+        if abs(dx * direction_y - dy * direction_x) <= half_width and dx * direction_x + dy * direction_y > 0:
+            distance = math.sqrt(dx * dx + dy * dy)
+            if distance <= length:
+                hits.append((distance, index, enemy))
+    hits.sort(key=_by_distance_then_index)
+    return [(enemy, distance) for distance, _, enemy in hits]
+
+
+def sector_hits(candidates: Iterable[Tuple[int, object]], x: float, y: float, angle: float,
+                half_angle: float, radius: float) -> List[object]:
+    """Get the enemies of (index, enemy) candidates inside a cone, in list order.
+
+    The cone points from (x, y) towards angle and spans half_angle radians
+    either side of it out to radius. Membership is a dot-product test against
+    cos(half_angle), so no per-enemy atan2 or angle wraparound is needed.
+    """
+    direction_x = math.cos(angle)
+    direction_y = math.sin(angle)
+    cos_half_angle = math.cos(min(half_angle, math.pi))
+    radius_squared = radius * radius
+    hits = []
+    for index, enemy in candidates:
+        dx = enemy.x - x
+        dy = enemy.y - y
+        distance_squared = dx * dx + dy * dy
+        if (distance_squared <= radius_squared and
+                dx * direction_x + dy * direction_y >= math.sqrt(distance_squared) * cos_half_angle):
+            hits.append((index, enemy))
+    hits.sort(key=itemgetter(0))
+    return [enemy for _, enemy in hits]
+
+
+class SpatialGrid:
+    """Uniform grid of enemy positions for fast radius queries.
+
+    SimulationCore rebuilds it once per tick before towers update, so each
+    tower only looks at enemies in the cells its range overlaps instead of
+    scanning every enemy. Queries return exactly the enemies inside the radius,
+    in the same order as the indexed list, so results match a linear scan.
+
+    Neighbour counts (how many targetable enemies sit within a splash or chain
+    radius of an enemy) are cached per radius and targeting flags until the
+    next rebuild, so every Cannon or Lightning tower scoring the same enemy
+    this tick shares one count. They are first asked for after detector towers
+    have run, so detection is already settled.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, object]]] = {}
+        self.enemies = None  # List the grid was built from
+        self.bounds: Optional[Tuple[int, int, int, int]] = None  # Occupied cell range (min x, min y, max x, max y)
+        # (radius, can_target_flying, can_target_invisible) -> {id(enemy): neighbour count}
+        self.neighbor_counts: Dict[Tuple[float, bool, bool], Dict[int, int]] = {}
+
+    def rebuild(self, enemies: List):
+        """Index the current positions of all enemies"""
+        cells = {}
+        cell_size = self.cell_size
+        for index, enemy in enumerate(enemies):
+            key = (int(enemy.x // cell_size), int(enemy.y // cell_size))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [(index, enemy)]
+            else:
+                cell.append((index, enemy))
+        self.cells = cells
+        self.enemies = enemies
+        self.bounds = None
+        if cells:
+            cell_xs = [cell_x for cell_x, _ in cells]
+            cell_ys = [cell_y for _, cell_y in cells]
+            self.bounds = (min(cell_xs), min(cell_ys), max(cell_xs), max(cell_ys))
+        self.neighbor_counts = {}
+
+    def clear(self):
+        """Drop the index so stale data is never queried between ticks"""
+        self.cells = {}
+        self.enemies = None
+        self.bounds = None
+        self.neighbor_counts = {}
+
+    def covers(self, enemies: List) -> bool:
+        """Check if the grid was built from this enemy list"""
+        return self.enemies is enemies
+
+    def _cells_near(self, x: float, y: float, radius: float) -> List[List[Tuple[int, object]]]:
+        """Get the occupied cells overlapping the square around a circle"""
+        return self._cells_in_box(x - radius, y - radius, x + radius, y + radius)
+
+    def _cells_in_box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[List[Tuple[int, object]]]:
+        """Get the occupied cells overlapping an axis-aligned box"""
+        cell_size = self.cell_size
+        min_cell_x = int(min_x // cell_size)
+        max_cell_x = int(max_x // cell_size)
+        min_cell_y = int(min_y // cell_size)
+        max_cell_y = int(max_y // cell_size)
+
+        # Walk whichever is smaller: the cells under the query box or the occupied cells
+        box_cells = (max_cell_x - min_cell_x + 1) * (max_cell_y - min_cell_y + 1)
+        if box_cells <= len(self.cells):
+            candidate_cells = []
+            for cell_x in range(min_cell_x, max_cell_x + 1):
+                for cell_y in range(min_cell_y, max_cell_y + 1):
+                    cell = self.cells.get((cell_x, cell_y))
+                    if cell:
+                        candidate_cells.append(cell)
+        else:
+            candidate_cells = [cell for (cell_x, cell_y), cell in self.cells.items()
+                               if min_cell_x <= cell_x <= max_cell_x and min_cell_y <= cell_y <= max_cell_y]
+        return candidate_cells
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Tuple[object, float]]:
+        """Get (enemy, squared distance) pairs within radius of a point, in list order"""
+        radius_squared = radius * radius
+        hits = []
+        for cell in self._cells_near(x, y, radius):
+            for index, enemy in cell:
+                dx = enemy.x - x
+                dy = enemy.y - y
+                distance_squared = dx * dx + dy * dy
+                if distance_squared <= radius_squared:
+                    hits.append((index, enemy, distance_squared))
+
+        # Restore list order so ties resolve exactly like a linear scan
+        hits.sort(key=lambda hit: hit[0])
+        return [(enemy, distance_squared) for _, enemy, distance_squared in hits]
+
+    def nearest(self, x: float, y: float, predicate: Optional[Callable] = None):
+        """Get the enemy closest to a point that passes predicate, ties go to the first in list order.
+
+        Cells are searched in square rings around the point's cell, stopping
+        once no unsearched ring can hold anything closer than the best so far.
+        """
+        if self.bounds is None:
+            return None
+        cell_size = self.cell_size
+        center_x = int(x // cell_size)
+        center_y = int(y // cell_size)
+        min_x, min_y, max_x, max_y = self.bounds
+        last_ring = max(center_x - min_x, max_x - center_x, center_y - min_y, max_y - center_y)
+
+        best = None
+        best_key = None  # (squared distance, index)
+        for ring in range(last_ring + 1):
+            if best_key is not None:
+                # Everything in this ring is at least ring - 1 whole cells away
+                reach = (ring - 1) * cell_size
+                if reach > 0 and reach * reach > best_key[0]:
+                    break
+            if ring == 0:
+                ring_cells = [self.cells.get((center_x, center_y))]
+            elif 8 * ring > len(self.cells):
+                # The ring is wider than the occupied area, finish with every cell left
+                ring_cells = [cell for (cell_x, cell_y), cell in self.cells.items()
+                              if max(abs(cell_x - center_x), abs(cell_y - center_y)) >= ring]
+                last_ring = ring
+            else:
+                ring_cells = []
+                for cell_x in range(center_x - ring, center_x + ring + 1):
+                    ring_cells.append(self.cells.get((cell_x, center_y - ring)))
+                    ring_cells.append(self.cells.get((cell_x, center_y + ring)))
+                for cell_y in range(center_y - ring + 1, center_y + ring):
+                    ring_cells.append(self.cells.get((center_x - ring, cell_y)))
+                    ring_cells.append(self.cells.get((center_x + ring, cell_y)))
+
+            for cell in ring_cells:
+                if not cell:
+                    continue
+                for index, enemy in cell:
+                    dx = enemy.x - x
+                    dy = enemy.y - y
+                    key = (dx * dx + dy * dy, index)
+                    if (best_key is None or key < best_key) and (predicate is None or predicate(enemy)):
+                        best = enemy
+                        best_key = key
+            if ring == last_ring:
+                break
+        return best
+
+    def neighbor_count(self, enemy, radius: float, can_target_flying: bool = True,
+                       can_target_invisible: bool = True) -> int:
+        """Count the other targetable enemies within radius of an enemy (cached until the next rebuild)"""
+        key = (radius, can_target_flying, can_target_invisible)
+        counts = self.neighbor_counts.get(key)
+        if counts is None:
+            counts = self.neighbor_counts[key] = {}
+        count = counts.get(id(enemy))
+        if count is None:
+            x = enemy.x
+            y = enemy.y
+            radius_squared = radius * radius
+            count = 0
+            for cell in self._cells_near(x, y, radius):
+                for _, other in cell:
+                    dx = other.x - x
+                    dy = other.y - y
+                    if (dx * dx + dy * dy <= radius_squared and other is not enemy
+                            and targetable_with(other, can_target_flying, can_target_invisible)):
+                        count += 1
+            counts[id(enemy)] = count
+        return count
+
+    def nearest_chain(self, start, length: int, radius: float, can_target_flying: bool = True,
+                      can_target_invisible: bool = True) -> List:
+        """Build a chain of up to length enemies, each hop to the nearest new targetable enemy within radius"""
+        chain = [start]
+        chained = {id(start)}
+        current = start
+        while len(chain) < length:
+            # Closest unchained enemy, ties go to the first in list order
+            next_enemy = None
+            best_distance_squared = 0.0
+            for other, distance_squared in self.query_radius(current.x, current.y, radius):
+                if (id(other) not in chained and (next_enemy is None or distance_squared < best_distance_squared)
+                        and targetable_with(other, can_target_flying, can_target_invisible)):
+                    next_enemy = other
+                    best_distance_squared = distance_squared
+            if next_enemy is None:
+                break
+            chain.append(next_enemy)
+            chained.add(id(next_enemy))
+            current = next_enemy
+        return chain
+
+    def query_beam(self, x: float, y: float, direction_x: float, direction_y: float, length: float,
+                   half_width: float) -> List[Tuple[object, float]]:
+        """Get (enemy, distance) pairs inside a beam (see beam_hits), nearest first"""
+        end_x = x + direction_x * length
+        end_y = y + direction_y * length
+        cells = self._cells_in_box(min(x, end_x) - half_width, min(y, end_y) - half_width,
+                                   max(x, end_x) + half_width, max(y, end_y) + half_width)
+        return beam_hits((entry for cell in cells for entry in cell),
+                         x, y, direction_x, direction_y, length, half_width)
+
+    def query_sector(self, x: float, y: float, angle: float, half_angle: float, radius: float) -> List:
+        """Get the enemies inside a cone (see sector_hits), in list order"""
+        if half_angle >= math.pi:
+            cells = self._cells_near(x, y, radius)
+        else:
+            # Bounding box of the apex, both ends of the arc and any axis direction the arc sweeps over
+            xs = [x, x + math.cos(angle - half_angle) * radius, x + math.cos(angle + half_angle) * radius]
+            ys = [y, y + math.sin(angle - half_angle) * radius, y + math.sin(angle + half_angle) * radius]
+            for quarter in range(4):
+                axis_angle = quarter * math.pi / 2
+                if abs((axis_angle - angle + math.pi) % (2 * math.pi) - math.pi) <= half_angle:
+                    xs.append(x + math.cos(axis_angle) * radius)
+                    ys.append(y + math.sin(axis_angle) * radius)
+            cells = self._cells_in_box(min(xs), min(ys), max(xs), max(ys))
+        return sector_hits((entry for cell in cells for entry in cell), x, y, angle, half_angle, radius)
+
+
+def get_enemy_grid() -> SpatialGrid:
+    """Get the enemy index of the running simulation (see simulation_context; empty outside its projectile phase)"""
+    return get_context().enemy_grid
@@ -0,0 +1,215 @@
+"""Central status-effect engine.
+
+Every freeze, wet, burn and poison application goes through
+StatusEffects.apply(), which checks the enemy's immunity bits first.
+Damage-over-time effects are stored here as compact records scheduled on a
+timing wheel, so update() only touches the effects whose next hit is due,
+and a burning enemy takes its burn exactly once per period however many
+flame towers are on the map. Other periodic enemy timers (regeneration,
+ability cooldowns) can run on the same wheel through every(). The short-lived
+counter-effect popups ("SUPER!", "HIT!") live here as well, so enemy updates
+no longer manage per-enemy lists.
+
+Freeze and wet timers stay on the enemies: Enemy.update_with_speed already
+advances them in its single pass per tick.
+
+Entities reach the running simulation's engine through get_status_effects()
+(see simulation_context).
+"""
+from typing import Callable, Dict, List, Tuple
+
+from enemies.immunities import FREEZE, WET, BURN, POISON
+from .rng import cosmetics_enabled
+from .simulation_context import get_context
+from .timing_wheel import TimingWheel
+
+# Ticks between damage-over-time hits, and the tower type the damage counts as
+DOT_PERIODS = {BURN: 20, POISON: 60}
+DOT_TOWER_TYPES = {BURN: 'flame', POISON: 'poison'}
+
+COUNTER_EFFECT_DURATION = 30  # 0.5 seconds at 60 FPS
+
+
+class DamageOverTime:
+    """An active burn or poison on one enemy"""
+    __slots__ = ('enemy', 'effect', 'expires', 'next_hit', 'damage', 'source')
+
+    def __init__(self, enemy, effect: int, expires: float, next_hit: float, damage: int, source=None):
+        self.enemy = enemy
+        self.effect = effect
+        self.expires = expires  # Wheel time the effect wears off
+        self.next_hit = next_hit  # Wheel time of the next hit
+        self.damage = damage
+        self.source = source  # Tower credited with the damage (if any)
+
+
+class PeriodicTask:
+    """A callback run every period ticks for as long as its enemy is in play"""
+    __slots__ = ('enemy', 'period', 'callback', 'next_run')
+
+    def __init__(self, enemy, period: float, callback: Callable, next_run: float):
+        self.enemy = enemy
+        self.period = period
+        self.callback = callback  # callback(enemy), returning False stops the task
+        self.next_run = next_run
+
+
+class StatusEffects:
+    """Active status effects of every enemy in a simulation"""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Drop every active effect"""
+        self.dots: Dict[Tuple[int, int], DamageOverTime] = {}  # (id(enemy), effect) -> record
+        self.counter_effects: Dict[int, Tuple[object, List[dict]]] = {}  # id(enemy) -> (enemy, popups)
+        self.tasks: Dict[int, List[PeriodicTask]] = {}  # id(enemy) -> running periodic tasks
+        self.wheel = TimingWheel()
+
+    @property
+    def now(self) -> float:
+        """Ticks (scaled by game speed) the engine has advanced"""
+        return self.wheel.now
+
+    def apply(self, enemy, effect: int, duration: float, strength: float = 0, source=None) -> bool:
+        """Apply an effect to an enemy, returns False if the enemy is immune.
+
+        strength is the damage per hit for burn and poison and the lightning
+        damage multiplier for wet. Freeze resistance shortens and weakens the
+        freeze rather than blocking it.
+        """
+        if effect == FREEZE:
+            enemy.apply_freeze(duration)
+            return True
+        if enemy.immunity_mask & effect:
+            return False
+        if effect == WET:
+            enemy.apply_wet_status(duration, strength)
+            return True
+        if effect not in DOT_PERIODS:
+            raise ValueError(f"Unknown status effect {effect}")
+
+        # Re-applying an active effect refreshes duration and damage but keeps the hit cadence
+        key = (id(enemy), effect)
+        dot = self.dots.get(key)
+        now = self.wheel.now
+        if dot is None or dot.expires <= now:
+            dot = DamageOverTime(enemy, effect, now + duration, now + DOT_PERIODS[effect], strength, source)
+            self.dots[key] = dot
+            self.wheel.schedule(dot.next_hit, dot)
+        else:
+            dot.expires = now + duration
+            dot.damage = strength
+            dot.source = source
+        return True
+
+    def every(self, enemy, period: float, callback: Callable):
+        """Run callback(enemy) every period ticks until it returns False or the enemy leaves play"""
+        task = PeriodicTask(enemy, period, callback, self.wheel.now + period)
+        self.tasks.setdefault(id(enemy), []).append(task)
+        self.wheel.schedule(task.next_run, task)
+
+    def release(self, enemy):
+        """Forget everything tracked for an enemy that left play (before it is recycled)"""
+        for effect in DOT_PERIODS:
+            self.dots.pop((id(enemy), effect), None)
+        self.counter_effects.pop(id(enemy), None)
+        for task in self.tasks.pop(id(enemy), ()):
+            task.enemy = None  # Its wheel entry is dropped when it comes due
+
+    def is_active(self, enemy, effect: int) -> bool:
+        """Check if a damage-over-time effect is active on an enemy"""
+        return self.remaining(enemy, effect) > 0
+
+    def remaining(self, enemy, effect: int) -> float:
+        """Get the ticks left on a damage-over-time effect (0 if inactive)"""
+        dot = self.dots.get((id(enemy), effect))
+        return max(0, dot.expires - self.wheel.now) if dot is not None else 0
+
+    def forget_source(self, tower):
+        """Stop crediting a removed tower for effects it applied"""
+        for dot in self.dots.values():
+            if dot.source is tower:
+                dot.source = None
+
+    def show_counter_effect(self, enemy, effectiveness_type: str):
+        """Add a counter-effectiveness popup above an enemy (visual only)"""
+        if not cosmetics_enabled():
+            return
+        entry = self.counter_effects.get(id(enemy))
+        if entry is None:
+            entry = self.counter_effects[id(enemy)] = (enemy, [])
+        entry[1].append({'type': effectiveness_type, 'timer': COUNTER_EFFECT_DURATION})
+
+    def counter_effects_of(self, enemy) -> List[dict]:
+        """Get the active counter-effectiveness popups of an enemy"""
+        entry = self.counter_effects.get(id(enemy))
+        return entry[1] if entry is not None else []
+
+    def update(self, speed_multiplier: float = 1):
+        """Advance time by one tick at the given game speed and run whatever fell due"""
+        for _, item in self.wheel.advance(speed_multiplier):
+            if type(item) is DamageOverTime:
+                self._run_dot(item)
+            else:
+                self._run_task(item)
+
+        for key, (enemy, popups) in list(self.counter_effects.items()):
+            for popup in popups:
+                popup['timer'] -= speed_multiplier
+            popups[:] = [popup for popup in popups if popup['timer'] > 0]
+            if not popups or enemy.health <= 0 or enemy.reached_end:
+                del self.counter_effects[key]
+
+    def _run_dot(self, dot: DamageOverTime):
+        """Deal every hit of a damage-over-time effect that is due, then reschedule it"""
+        enemy = dot.enemy
+        key = (id(enemy), dot.effect)
+        if self.dots.get(key) is not dot:
+            return  # Expired and since replaced by a fresh application
+
+        period = DOT_PERIODS[dot.effect]
+        # A fast game speed can make more than one hit due in a single tick
+        while dot.next_hit <= self.wheel.now:
+            if enemy.health <= 0 or enemy.reached_end or dot.next_hit > dot.expires:
+                del self.dots[key]
+                return
+            self._hit(dot)
+            dot.next_hit += period
+        if enemy.health <= 0:
+            del self.dots[key]
+            return
+        self.wheel.schedule(dot.next_hit, dot)
+
+    def _run_task(self, task: PeriodicTask):
+        """Run a periodic task for every period that is due, then reschedule it"""
+        enemy = task.enemy
+        if enemy is None:
+            return  # Released
+        while task.next_run <= self.wheel.now:
+            if enemy.health <= 0 or enemy.reached_end or task.callback(enemy) is False:
+                self._end_task(task)
+                return
+            task.next_run += task.period
+        self.wheel.schedule(task.next_run, task)
+
+    def _end_task(self, task: PeriodicTask):
+        """Drop a finished periodic task from its enemy's list"""
+        tasks = self.tasks.get(id(task.enemy))
+        if tasks is not None:
+            tasks.remove(task)
+            if not tasks:
+                del self.tasks[id(task.enemy)]
+
+    @staticmethod
+    def _hit(dot: DamageOverTime):
+        """Deal one damage-over-time hit and credit the source tower"""
+        actual_damage = dot.enemy.take_damage(dot.damage, DOT_TOWER_TYPES[dot.effect])
+        if dot.source is not None:
+            dot.source.report_damage(actual_damage)
+
+
+def get_status_effects() -> StatusEffects:
+    """Get the status-effect engine of the running simulation"""
+    return get_context().status_effects
@@ -0,0 +1,101 @@
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - towers fall back to the spatial grid
+    np = None
+
+
+class TargetingMatrix:
+    """Towers x enemies squared-distance matrix for batch targeting.
+
+    SimulationCore rebuilds it once per tick after detector towers have run,
+    so every tower's in-range mask and default "furthest along the path"
+    target come from a few array operations instead of a Python loop per
+    tower. Enemy flying/invisible state becomes boolean columns and each
+    tower's can_target_flying/can_target_invisible flags select which columns
+    exclude it. Like the spatial grid, it is a snapshot of the tick: enemies
+    moved by a tower's attack (teleports) are seen at their indexed position.
+    """
+
+    def __init__(self):
+        self.enemies = None  # List the matrix was built from
+        self.rows: Dict[int, int] = {}  # id(tower) -> row
+        self.ranges = None
+        self.distances_squared = None
+        self.in_range = None
+        self.targetable = None
+        self.progress = None
+
+    @property
+    def available(self) -> bool:
+        """Whether the matrix can be built in this environment"""
+        return np is not None
+
+    def rebuild(self, towers: List, enemies: List):
+        """Compute distances and eligibility for every tower/enemy pair"""
+        self.clear()
+        if np is None or not towers or not enemies:
+            return
+
+        enemy_x = np.array([enemy.x for enemy in enemies], dtype=float)
+        enemy_y = np.array([enemy.y for enemy in enemies], dtype=float)
+        tower_x = np.array([tower.x for tower in towers], dtype=float)
+        tower_y = np.array([tower.y for tower in towers], dtype=float)
+        self.ranges = [tower.range for tower in towers]
+        ranges = np.array(self.ranges, dtype=float)
+
+        dx = enemy_x[np.newaxis, :] - tower_x[:, np.newaxis]
+        dy = enemy_y[np.newaxis, :] - tower_y[:, np.newaxis]
+        self.distances_squared = dx * dx + dy * dy
+        self.in_range = self.distances_squared <= (ranges * ranges)[:, np.newaxis]
+
+        # Eligibility columns, combined with each tower's restrictions
+        flying = np.array([bool(getattr(enemy, 'flying', False)) for enemy in enemies], dtype=bool)
+        hidden = np.array([bool(getattr(enemy, 'invisible', False))
+                           and not getattr(enemy, 'detected_by_detector', False) for enemy in enemies], dtype=bool)
+        blocks_flying = np.array([not tower.can_target_flying for tower in towers], dtype=bool)
+        blocks_hidden = np.array([not tower.can_target_invisible for tower in towers], dtype=bool)
+        excluded = (blocks_flying[:, np.newaxis] & flying[np.newaxis, :]) | \
+                   (blocks_hidden[:, np.newaxis] & hidden[np.newaxis, :])
+        self.targetable = self.in_range & ~excluded
+
+        self.progress = np.array([enemy.get_distance_from_start() for enemy in enemies], dtype=float)
+        self.rows = {id(tower): row for row, tower in enumerate(towers)}
+        self.enemies = enemies
+
+    def clear(self):
+        """Drop the matrix so stale data is never queried between ticks"""
+        self.enemies = None
+        self.rows = {}
+        self.ranges = None
+        self.distances_squared = None
+        self.in_range = None
+        self.targetable = None
+        self.progress = None
+
+    def covers(self, tower, enemies: List) -> bool:
+        """Check if the matrix was built from this enemy list and includes the tower"""
+        return self.enemies is enemies and id(tower) in self.rows
+
+    def query_range(self, tower, radius: float) -> Optional[List[Tuple[object, float]]]:
+        """Get (enemy, squared distance) pairs in the tower's range, in list order.
+
+        Returns None when the radius is not the range the matrix was built with.
+        """
+        row = self.rows[id(tower)]
+        if radius != self.ranges[row]:
+            return None
+        indices = np.flatnonzero(self.in_range[row])
+        enemies = self.enemies
+        return [(enemies[i], distance_squared) for i, distance_squared
+                in zip(indices.tolist(), self.distances_squared[row, indices].tolist())]
+
+    def furthest_target(self, tower):
+        """Get the targetable enemy in range that is furthest along the path"""
+        row = self.rows[id(tower)]
+        candidates = self.targetable[row]
+        if not candidates.any():
+            return None
+        # Masked argmax - ties resolve to the first enemy in list order, like max()
+        return self.enemies[int(np.argmax(np.where(candidates, self.progress, -np.inf)))]
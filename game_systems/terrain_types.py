@@ -58,6 +58,7 @@ TERRAIN_PROPERTIES = {
         'tower_placeable': True,
         'enemy_walkable': False,
         'special_rules': 'enemy_speed_boost',
+        'enemy_speed_multiplier': 1.5,  # Sand increases enemy speed by 50%
         'allowed_towers': 'all'
     }
 }
@@ -100,6 +101,10 @@ def get_terrain_color(terrain_type: int) -> tuple:
     """Get the color for rendering this terrain type"""
     return get_terrain_property(terrain_type, 'color') or (255, 255, 255)
 
+def get_enemy_speed_multiplier(terrain_type: int) -> float:
+    """Get how much this terrain speeds up (or slows down) enemies walking over it"""
+    return get_terrain_property(terrain_type, 'enemy_speed_multiplier') or 1.0
+
 def get_terrain_name(terrain_type: int) -> str:
     """Get the name of a terrain type"""
     return get_terrain_property(terrain_type, 'name') or 'Unknown' 
\ No newline at end of file
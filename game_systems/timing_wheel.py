@@ -0,0 +1,60 @@
+"""Timing wheel for work that falls due on a future tick.
+
+Timers that only fire every 20-60 ticks (burn, poison, regeneration,
+ability cooldowns) would otherwise be counted down on every enemy on every
+tick. The wheel instead buckets each scheduled item by the whole tick it is
+due, so advancing it only looks at the buckets for the ticks that passed.
+
+Time is a float so the wheel can advance by any game speed: advance() visits
+every whole tick since the previous call, returns each item whose due time
+has been reached exactly once, and never skips one.
+"""
+import math
+from operator import itemgetter
+from typing import Any, List, Tuple
+
+_due_key = itemgetter(0)
+
+
+class TimingWheel:
+    """Scheduled items bucketed by the tick they fall due"""
+
+    def __init__(self, slots: int = 64):
+        # An item due more than one turn ahead waits in its slot until the
+        # wheel comes round to its tick again
+        self.slots: List[List[Tuple[float, Any]]] = [[] for _ in range(slots)]
+        self.now = 0.0
+        self._next_tick = 0  # First whole tick that may still hold due items
+
+    def __len__(self) -> int:
+        return sum(len(slot) for slot in self.slots)
+
+    def schedule(self, due: float, item: Any):
+        """Schedule an item for a (possibly fractional) tick, past ticks fire on the next advance"""
+        tick = max(math.floor(due), self._next_tick)
+        self.slots[tick % len(self.slots)].append((due, item))
+
+    def advance(self, ticks: float) -> List[Tuple[float, Any]]:
+        """Move time forward and return the (due, item) pairs that fell due, oldest first"""
+        self.now += ticks
+        now = self.now
+        last_tick = math.floor(now)
+        slot_count = len(self.slots)
+
+        due_items = []
+        for tick in range(self._next_tick, min(last_tick, self._next_tick + slot_count - 1) + 1):
+            index = tick % slot_count
+            slot = self.slots[index]
+            if slot:
+                waiting = []
+                for entry in slot:
+                    if entry[0] <= now:
+                        due_items.append(entry)
+                    else:
+                        waiting.append(entry)
+                self.slots[index] = waiting
+
+        # The current tick can still hold items due later within it, visit it again next time
+        self._next_tick = last_tick
+        due_items.sort(key=_due_key)
+        return due_items
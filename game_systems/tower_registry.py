@@ -0,0 +1,53 @@
+import heapq
+from typing import Iterable, List, Optional, Set
+
+
+class TowerRegistry:
+    """Compact integer IDs for placed towers with O(1) lookup.
+
+    IDs index straight into a slot list, so projectile hits find their source
+    tower without scanning. When a tower is removed its ID is retired: it
+    looks up as None, so hits from projectiles still in flight credit nobody,
+    and it is only freed by release() once nothing carries it any more. The
+    smallest free ID is handed to the next tower placed, keeping IDs compact
+    and assignment deterministic across runs.
+    """
+
+    def __init__(self):
+        self.slots: List[Optional[object]] = []
+        self.free_ids: List[int] = []  # Min-heap of IDs released by removed towers
+        self.retired: Set[int] = set()  # IDs of removed towers that projectiles may still carry
+
+    def register(self, tower) -> int:
+        """Give a tower the next free ID and return it"""
+        if self.free_ids:
+            tower_id = heapq.heappop(self.free_ids)
+            self.slots[tower_id] = tower
+        else:
+            tower_id = len(self.slots)
+            self.slots.append(tower)
+        tower.tower_id = tower_id
+        return tower_id
+
+    def unregister(self, tower):
+        """Retire a removed tower's ID until release() frees it"""
+        tower_id = tower.tower_id
+        if self.get(tower_id) is tower:
+            self.slots[tower_id] = None
+            self.retired.add(tower_id)
+
+    def release(self, in_use: Iterable = ()):
+        """Free the retired IDs that are not in use (carried by a projectile, a queued blast, ...)"""
+        in_use = set(in_use)
+        for tower_id in sorted(self.retired - in_use):
+            self.retired.discard(tower_id)
+            heapq.heappush(self.free_ids, tower_id)
+
+    def get(self, tower_id) -> Optional[object]:
+        """Get the tower with an ID, or None"""
+        if isinstance(tower_id, int) and 0 <= tower_id < len(self.slots):
+            return self.slots[tower_id]
+        return None
+
+    def __len__(self) -> int:
+        return len(self.slots) - len(self.free_ids) - len(self.retired)
@@ -367,16 +367,17 @@ class TowerUpgradeSystem:
             }
         }
 
-    def get_tower_currency(self, tower_id: str, tower_type: str) -> int:
-        """Get the current currency for a specific tower"""
-        key = f"{tower_id}_{tower_type}"
-        return self.tower_currencies.get(key, 0)
+    def get_tower_currency(self, tower_id: int, tower_type: str = None) -> int:
+        """Get the current currency for a specific tower (tower IDs are unique, so type is not needed)"""
+        return self.tower_currencies.get(tower_id, 0)
     
-    def add_tower_currency(self, tower_id: str, tower_type: str, amount: int):
+    def add_tower_currency(self, tower_id: int, tower_type: str, amount: int):
         """Add currency for a specific tower"""
-        key = f"{tower_id}_{tower_type}"
-        current = self.tower_currencies.get(key, 0)
-        self.tower_currencies[key] = current + amount
+        self.tower_currencies[tower_id] = self.tower_currencies.get(tower_id, 0) + amount
+    
+    def clear_tower_currency(self, tower_id: int):
+        """Forget a removed tower's currency so a tower reusing its ID starts fresh"""
+        self.tower_currencies.pop(tower_id, None)
     
     def get_upgrade_cost(self, tower_type: str, upgrade_type: UpgradeType, current_level: int) -> int:
         """Calculate the cost for the next upgrade level"""
@@ -391,18 +392,17 @@ class TowerUpgradeSystem:
         # Exponential cost scaling: cost increases by 50% each level
         return int(base_cost * (1.5 ** current_level))
     
-    def can_upgrade(self, tower_id: str, tower_type: str, upgrade_type: UpgradeType, current_level: int) -> bool:
+    def can_upgrade(self, tower_id: int, tower_type: str, upgrade_type: UpgradeType, current_level: int) -> bool:
         """Check if a tower can be upgraded"""
         cost = self.get_upgrade_cost(tower_type, upgrade_type, current_level)
         currency = self.get_tower_currency(tower_id, tower_type)
         return currency >= cost and cost < 999999
     
-    def upgrade_tower(self, tower_id: str, tower_type: str, upgrade_type: UpgradeType, current_level: int) -> bool:
+    def upgrade_tower(self, tower_id: int, tower_type: str, upgrade_type: UpgradeType, current_level: int) -> bool:
         """Attempt to upgrade a tower"""
         if self.can_upgrade(tower_id, tower_type, upgrade_type, current_level):
             cost = self.get_upgrade_cost(tower_type, upgrade_type, current_level)
-            key = f"{tower_id}_{tower_type}"
-            self.tower_currencies[key] = self.tower_currencies.get(key, 0) - cost
+            self.tower_currencies[tower_id] = self.tower_currencies.get(tower_id, 0) - cost
             return True
         return False
     
@@ -412,7 +412,7 @@ class TowerUpgradeSystem:
             return self.upgrade_definitions[tower_type][upgrade_type]
         return {}
     
-    def apply_upgrades_to_tower(self, tower, tower_id: str):
+    def apply_upgrades_to_tower(self, tower, tower_id: int):
         """Apply all upgrades to a tower"""
         tower_type = tower.tower_type
         
@@ -0,0 +1,198 @@
+"""Detection of invisible enemies by detector towers.
+
+SimulationCore used to clear detected_by_detector on every enemy each tick,
+and every DetectorTower then scanned the whole swarm for invisible enemies.
+The visibility service keeps invisible enemies in their own small table
+instead. SPAWN, KILL and LEAK events keep the table current, and each
+enemy in it owns one bit of the tick's detected_mask. Enemies spawned in
+the middle of a tick (splits, summons) are added straight away, so the
+same tick's detectors can already see them.
+
+For each detector, the service remembers which invisible enemies are in
+its range. Membership is only re-tested when an enemy enters a new grid
+cell, or when its cell is crossed by the edge of some detector's range.
+A cell that is wholly inside or outside every range keeps its answer.
+Each detector reveals the closest max_detections enemies in its range,
+and the union of these becomes detected_mask. Only enemies whose bit
+changed get their detected_by_detector flag flipped; that flag is what
+tower eligibility checks read.
+
+Outside a SimulationCore (legacy runners, tests), no events feed the
+fallback service, so each detector scans the list it is given, as before.
+Detector towers reach the running simulation's service through
+get_visibility() (see simulation_context).
+"""
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from .simulation_context import get_context
+
+_by_distance = itemgetter(0)
+
+
+class Visibility:
+    """Tracks invisible enemies and which of them detector towers reveal each tick"""
+
+    def __init__(self, tracking: bool = False, cell_size: int = 64):
+        self.tracking = tracking  # Fed by SPAWN/KILL/LEAK events (SimulationCore) rather than scanning
+        self.cell_size = cell_size
+        self.invisible: Dict[int, object] = {}  # id(enemy) -> enemy, in spawn order
+        self.bits: Dict[int, int] = {}  # id(enemy) -> bit in detected_mask
+        self.by_bit: List[Optional[object]] = []
+        self._free_bits: List[int] = []
+        self.enemies = None  # Enemy list of the tick being detected
+        self.detected_mask = 0  # Invisible enemies revealed this tick
+        self._revealed = 0  # Mask being gathered while detectors run
+
+        # Range membership, re-tested only for enemies that may have crossed a range boundary
+        self.in_range: Dict[int, Dict[int, object]] = {}  # id(detector) -> {id(enemy): enemy}
+        self.enemy_cells: Dict[int, Tuple[int, int]] = {}  # id(enemy) -> cell at its last test
+        self._layout: Tuple[Tuple[int, float, float, float], ...] = ()  # (id, x, y, range) per detector
+        self._crossed_cells: Dict[Tuple[int, int], bool] = {}  # cell -> whether a range edge crosses it
+
+    def track(self, spawns: List):
+        """Start tracking the invisible enemies among new spawns (usable as a SPAWN subscriber)"""
+        for enemy, _ in spawns:
+            self.add(enemy)
+
+    def add(self, enemy):
+        """Start tracking an enemy that entered play, if it is invisible and not tracked yet"""
+        if getattr(enemy, 'invisible', False) and id(enemy) not in self.invisible:
+            bit = self._free_bits.pop() if self._free_bits else len(self.by_bit)
+            if bit == len(self.by_bit):
+                self.by_bit.append(None)
+            self.by_bit[bit] = enemy
+            self.bits[id(enemy)] = bit
+            self.invisible[id(enemy)] = enemy
+            enemy.detected_by_detector = False
+
+    def untrack(self, enemies: List):
+        """Stop tracking enemies that left play (usable as a KILL/LEAK subscriber)"""
+        for enemy in enemies:
+            key = id(enemy)
+            if self.invisible.pop(key, None) is None:
+                continue
+            bit = self.bits.pop(key)
+            self.by_bit[bit] = None
+            self._free_bits.append(bit)
+            self.detected_mask &= ~(1 << bit)
+            self._revealed &= ~(1 << bit)
+            self.enemy_cells.pop(key, None)
+            for members in self.in_range.values():
+                members.pop(key, None)
+
+    def update(self, detectors: List, enemies: List):
+        """Bring range membership up to date before the tick's detectors run on an enemy list"""
+        if not self.tracking:
+            return
+        self.enemies = enemies
+        layout = tuple((id(detector), detector.x, detector.y, detector.detection_range) for detector in detectors)
+        if layout != self._layout:
+            # Detectors were placed, sold, moved or upgraded - test everything again
+            self._layout = layout
+            self._crossed_cells = {}
+            self.enemy_cells = {}
+            self.in_range = {id(detector): {} for detector in detectors}
+        if not layout:
+            return
+
+        cell_size = self.cell_size
+        for key, enemy in self.invisible.items():
+            cell = (int(enemy.x // cell_size), int(enemy.y // cell_size))
+            if self.enemy_cells.get(key) == cell and not self._crossed(cell):
+                continue
+            self.enemy_cells[key] = cell
+            for detector_id, x, y, detection_range in layout:
+                members = self.in_range[detector_id]
+                dx = enemy.x - x
+                dy = enemy.y - y
+                if dx * dx + dy * dy <= detection_range * detection_range:
+                    members[key] = enemy
+                else:
+                    members.pop(key, None)
+
+    def _crossed(self, cell: Tuple[int, int]) -> bool:
+        """Check if any detector's range edge passes through a cell"""
+        crossed = self._crossed_cells.get(cell)
+        if crossed is None:
+            cell_size = self.cell_size
+            min_x = cell[0] * cell_size
+            min_y = cell[1] * cell_size
+            max_x = min_x + cell_size
+            max_y = min_y + cell_size
+            crossed = False
+            for _, x, y, detection_range in self._layout:
+                near_x = min(max(x, min_x), max_x) - x
+                near_y = min(max(y, min_y), max_y) - y
+                far_x = max(x - min_x, max_x - x)
+                far_y = max(y - min_y, max_y - y)
+                range_squared = detection_range * detection_range
+                if near_x * near_x + near_y * near_y <= range_squared < far_x * far_x + far_y * far_y:
+                    crossed = True
+                    break
+            self._crossed_cells[cell] = crossed
+        return crossed
+
+    def detect(self, detector, enemies: List) -> List:
+        """Reveal the invisible enemies in a detector's range closest to it (up to max_detections)"""
+        x = detector.x
+        y = detector.y
+        range_squared = detector.detection_range * detector.detection_range
+        tracked = self.tracking and enemies is self.enemies
+        if tracked:
+            members = self.in_range.get(id(detector))
+            if members is not None:
+                candidates = [enemy for key, enemy in self.invisible.items() if key in members]
+            else:
+                # Placed since the last update - test it against every invisible enemy
+                candidates = list(self.invisible.values())
+            # Enemies killed or leaked this tick stay tracked until the events are dispatched
+            candidates = [enemy for enemy in candidates if enemy.health > 0 and not enemy.reached_end]
+        else:
+            # Not fed by events (or another list) - clear this detector's last picks and scan the list
+            for enemy in detector.detected_enemies:
+                enemy.detected_by_detector = False
+            candidates = [enemy for enemy in enemies if getattr(enemy, 'invisible', False)]
+
+        in_range = []
+        for enemy in candidates:
+            dx = enemy.x - x
+            dy = enemy.y - y
+            distance_squared = dx * dx + dy * dy
+            if distance_squared <= range_squared:
+                in_range.append((distance_squared, enemy))
+
+        # Closest first, equal distances keep spawn (list) order
+        in_range.sort(key=_by_distance)
+        detected = [enemy for _, enemy in in_range[:detector.max_detections]]
+        if tracked:
+            for enemy in detected:
+                self._revealed |= 1 << self.bits[id(enemy)]
+        else:
+            for enemy in detected:
+                enemy.detected_by_detector = True
+        return detected
+
+    def publish(self):
+        """Finish the detector phase: flip detected_by_detector where the detected mask changed"""
+        if not self.tracking:
+            return
+        revealed = self._revealed
+        changed = revealed ^ self.detected_mask
+        self.detected_mask = revealed
+        self._revealed = 0
+        self.enemies = None
+        while changed:
+            lowest = changed & -changed
+            changed ^= lowest
+            self.by_bit[lowest.bit_length() - 1].detected_by_detector = bool(revealed & lowest)
+
+    def is_detected(self, enemy) -> bool:
+        """Check the tick's detected mask for a tracked enemy"""
+        bit = self.bits.get(id(enemy))
+        return bit is not None and bool(self.detected_mask >> bit & 1)
+
+
+def get_visibility() -> Visibility:
+    """Get the visibility service of the running simulation"""
+    return get_context().visibility
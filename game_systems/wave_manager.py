@@ -7,7 +7,10 @@ from enemies import (BasicEnemy, FastEnemy, TankEnemy, ShieldedEnemy,
                     ArmoredEnemy, EnergyShieldEnemy, GroundedEnemy, 
                     FireElementalEnemy, ToxicEnemy, PhaseShiftEnemy, BlastProofEnemy,
                     SpectralEnemy, CrystallineEnemy, ToxicMutantEnemy, VoidEnemy, AdaptiveEnemy)
+from .enemy_factory import get_enemy_factory
 from .enemy_introduction import EnemyIntroduction
+from .rng import get_simulation_rng
+from .wave_plan import WavePlan, MIN_SPAWN_INTERVAL, range_value
 
 class WaveManager:
     """Manages enemy waves and spawning"""
@@ -25,10 +28,6 @@ class WaveManager:
         self.round_progression = self.config['round_progression']
         self.money_config = self.config['money_config']
         
-        # Initialize with starting values
-        self.enemies_per_wave = self.spawn_config['base_enemy_count']
-        self.spawn_delay = self.spawn_config['base_spawn_delay']
-        
         # Enemy introduction system
         self.enemy_introduction = EnemyIntroduction()
         
@@ -63,138 +62,77 @@ class WaveManager:
             'VoidEnemy': VoidEnemy,
             'AdaptiveEnemy': AdaptiveEnemy
         }
+        
+        # Counts, delays and enemy picks for every wave, compiled from the config
+        self.plan = WavePlan(self.config, self.enemy_classes)
+        
+        # Initialize with starting values
+        self.enemies_per_wave = self.calculate_enemies_per_wave()
+        self.spawn_delay = self.calculate_spawn_delay()
     
     def get_value_for_wave(self, config_section: dict, wave_number: int) -> int:
         """Get a configuration value for a specific wave from wave ranges"""
-        # Check wave ranges first
-        for (min_wave, max_wave), value in config_section['wave_ranges'].items():
-            if min_wave <= wave_number <= max_wave:
-                return value
-        
-        # Fallback to default
-        return config_section['default']
+        return range_value(config_section, wave_number)
     
     def calculate_spawn_delay(self) -> int:
         """Calculate spawn delay based on current wave using per-round configuration"""
-        base_delay = self.spawn_config['base_spawn_delay']
-        min_delay = self.spawn_config['min_spawn_delay']
-        
-        # Calculate total reduction based on rounds completed
-        total_reduction = 0
-        for wave in range(2, self.wave_number + 1):  # Start from wave 2 (wave 1 uses base)
-            reduction_per_round = self.get_value_for_wave(
-                self.round_progression['spawn_delay_reduction_per_round'], wave
-            )
-            total_reduction += reduction_per_round
-        
-        # Calculate base delay after reductions
-        current_delay = base_delay - total_reduction
-        
-        # Apply special round multipliers if applicable
-        if self.wave_number in self.round_progression['special_rounds']:
-            multiplier = self.round_progression['special_rounds'][self.wave_number]['spawn_delay_multiplier']
-            current_delay = int(current_delay * multiplier)
-        
-        # Ensure we don't go below minimum
-        return max(min_delay, current_delay)
+        return self.plan.wave(self.wave_number).spawn_delay
     
     def calculate_enemies_per_wave(self) -> int:
         """Calculate number of enemies per wave using per-round configuration"""
-        # Check for boss waves first
-        boss_waves = self.config['boss_waves']
-        if self.wave_number in boss_waves:
-            return self.spawn_config['boss_enemy_count']
-        
-        base_count = self.spawn_config['base_enemy_count']
-        
-        # Calculate total increase based on rounds completed
-        total_increase = 0
-        for wave in range(2, self.wave_number + 1):  # Start from wave 2 (wave 1 uses base)
-            increase_per_round = self.get_value_for_wave(
-                self.round_progression['enemy_increase_per_round'], wave
-            )
-            total_increase += increase_per_round
-        
-        # Calculate base enemy count after increases
-        current_count = base_count + total_increase
-        
-        # Apply special round multipliers if applicable
-        if self.wave_number in self.round_progression['special_rounds']:
-            multiplier = self.round_progression['special_rounds'][self.wave_number]['enemy_multiplier']
-            current_count = int(current_count * multiplier)
-        
-        return current_count
+        return self.plan.wave(self.wave_number).enemy_count
 
     def get_enemy_type_for_wave(self) -> type:
         """Determine which enemy type to spawn based on current wave"""
-        import random
-
-        # Check for boss waves first
-        boss_waves = self.config['boss_waves']
-        if self.wave_number in boss_waves:
-            boss_class_name = boss_waves[self.wave_number]
-            return self.enemy_classes[boss_class_name]
-        
-        # Find the appropriate wave configuration
-        wave_compositions = self.config['wave_compositions']
-        for (min_wave, max_wave), enemy_types in wave_compositions.items():
-            if min_wave <= self.wave_number <= max_wave:
-                # Use weighted random selection
-                rand = random.random()
-                cumulative_weight = 0
-                
-                for enemy_class_name, weight in enemy_types:
-                    cumulative_weight += weight
-                    if rand <= cumulative_weight:
-                        return self.enemy_classes[enemy_class_name]
-        
+        enemy_class = self.plan.pick_enemy_type(self.plan.wave(self.wave_number), get_simulation_rng())
         # Fallback to basic enemy
-        return BasicEnemy
+        return enemy_class if enemy_class is not None else BasicEnemy
+    
+    def _due_spawns(self, ticks: float, limit: int) -> int:
+        """Advance the spawn timeline and return how many spawns fell due (at most limit)"""
+        remaining = self.enemies_per_wave - self.enemies_spawned
+        if remaining <= 0:
+            return 0
+        
+        # Keep the overshoot so spawn times stay exact at any game speed
+        interval = max(MIN_SPAWN_INTERVAL, self.spawn_delay)
+        self.spawn_timer += ticks
+        due = 0
+        while self.spawn_timer >= interval and due < min(remaining, limit):
+            self.spawn_timer -= interval
+            due += 1
+        return due
     
     def should_spawn_enemy(self) -> bool:
         """Check if it's time to spawn a new enemy"""
-        if self.enemies_spawned >= self.enemies_per_wave:
-            return False
-        
-        self.spawn_timer += 1
-        if self.spawn_timer >= self.spawn_delay:
-            self.spawn_timer = 0
-            return True
-        
-        return False
+        return self._due_spawns(1, 1) > 0
     
     def should_spawn_enemy_with_speed(self, speed_multiplier: float) -> bool:
         """Check if it's time to spawn a new enemy with speed multiplier"""
-        if self.enemies_spawned >= self.enemies_per_wave:
-            return False
-        
-        self.spawn_timer += speed_multiplier
-        if self.spawn_timer >= self.spawn_delay:
-            self.spawn_timer = 0
-            return True
-        
-        return False
+        return self._due_spawns(speed_multiplier, 1) > 0
+    
+    def spawn_enemies(self, speed_multiplier: float = 1.0) -> List:
+        """Spawn and return every enemy due this tick (several at high speeds or short delays)"""
+        return [self._create_enemy() for _ in range(self._due_spawns(speed_multiplier, self.enemies_per_wave))]
     
     def spawn_enemy(self, speed_multiplier: float = 1.0) -> object:
-        """Spawn and return a new enemy with optional speed multiplier"""
-        if speed_multiplier != 1.0:
-            if not self.should_spawn_enemy_with_speed(speed_multiplier):
-                return None
-        else:
-            if not self.should_spawn_enemy():
-                return None
-        
+        """Spawn and return a new enemy with optional speed multiplier (one per call)"""
+        if not self.should_spawn_enemy_with_speed(speed_multiplier):
+            return None
+        return self._create_enemy()
+    
+    def _create_enemy(self):
+        """Create, scale and count the next enemy of the wave"""
         enemy_class = self.get_enemy_type_for_wave()
-        # Pass wave number to enemy for immunity system
-        enemy = enemy_class(self.path, self.wave_number)
+        # Pass wave number to enemy for immunity system, progressive scaling
+        # is applied once per wave and enemy type by the factory
+        enemy = get_enemy_factory().create(enemy_class, self.path, self.wave_number,
+                                           scale=self.apply_enemy_scaling)
         
         # Check if this enemy type needs introduction
         enemy_type_name = enemy_class.__name__
         self.enemy_introduction.check_new_enemy(enemy_type_name)
         
-        # Apply progressive scaling based on wave number
-        self.apply_enemy_scaling(enemy)
-        
         self.enemies_spawned += 1
         
         return enemy
@@ -341,23 +279,7 @@ class WaveManager:
     
     def get_max_wave_number(self) -> int:
         """Get the maximum wave number from boss waves and wave compositions"""
-        max_boss_wave = 0
-        if self.config['boss_waves']:
-            max_boss_wave = max(int(wave) for wave in self.config['boss_waves'].keys())
-        
-        max_composition_wave = 0
-        if self.config['wave_compositions']:
-            for wave_range in self.config['wave_compositions'].keys():
-                # Parse range like "1-5" or handle tuple ranges
-                if isinstance(wave_range, tuple):
-                    end_wave = wave_range[1] 
-                elif isinstance(wave_range, str) and '-' in wave_range:
-                    end_wave = int(wave_range.split('-')[1])
-                else:
-                    end_wave = int(wave_range)
-                max_composition_wave = max(max_composition_wave, end_wave)
-        
-        return max(max_boss_wave, max_composition_wave)
+        return self.plan.max_wave
     
     def draw_introduction(self, screen):
         """Draw enemy introduction overlay if active"""
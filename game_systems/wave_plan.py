@@ -0,0 +1,131 @@
+"""Wave configuration compiled into per-wave spawn plans.
+
+The wave config describes enemy counts and spawn delays as per-round
+increments over wave ranges, and enemy picks as weighted lists. WavePlan
+turns that into one WaveSpec per wave: the count and delay come from prefix
+sums of the per-round increments (no loop from wave 2 every time a wave
+starts), and each composition becomes a cumulative weight table that
+pick_enemy_type() searches with bisect. Specs are compiled the first time a
+wave is asked for and cached.
+"""
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Spawns are never closer together than one tick at 1x speed (the old
+# per-tick check could not spawn faster, whatever the configured delay)
+MIN_SPAWN_INTERVAL = 1.0
+
+
+def _wave_bounds(wave_range) -> Tuple[int, int]:
+    """Get (first, last) wave of a config range key ((start, end) tuple, 'start-end' string or single wave)"""
+    if isinstance(wave_range, tuple):
+        return wave_range[0], wave_range[1]
+    if isinstance(wave_range, str) and '-' in wave_range:
+        start, end = wave_range.split('-')
+        return int(start), int(end)
+    return int(wave_range), int(wave_range)
+
+
+def range_value(config_section: dict, wave_number: int):
+    """Get a configuration value for a specific wave from wave ranges"""
+    for wave_range, value in config_section['wave_ranges'].items():
+        first, last = _wave_bounds(wave_range)
+        if first <= wave_number <= last:
+            return value
+    return config_section['default']
+
+
+class WaveSpec(NamedTuple):
+    """Everything needed to spawn one wave"""
+    wave_number: int
+    enemy_count: int
+    spawn_delay: float
+    boss_type: Optional[type]  # Set on boss waves, which spawn only the boss
+    enemy_types: Tuple[type, ...]  # Empty if no composition covers the wave
+    cumulative_weights: Tuple[float, ...]
+
+
+class WavePlan:
+    """Per-wave spawn plans compiled (lazily) from a wave config"""
+
+    def __init__(self, wave_config: dict, enemy_classes: Dict[str, type]):
+        self.config = wave_config
+        self.enemy_classes = enemy_classes
+        self.spawn_config = wave_config['spawn_config']
+        self.round_progression = wave_config['round_progression']
+        self.boss_waves = wave_config['boss_waves']
+        self.max_wave = self._max_wave_number()
+
+        # Prefix sums of the per-round increments: index w holds the total for waves 2..w
+        self._enemy_increase_totals: List[int] = [0, 0]
+        self._delay_reduction_totals: List[int] = [0, 0]
+        self._specs: Dict[int, WaveSpec] = {}
+
+    def _max_wave_number(self) -> int:
+        """Get the last wave named by boss waves or wave compositions"""
+        max_boss_wave = max((int(wave) for wave in self.boss_waves), default=0)
+        max_composition_wave = max((_wave_bounds(wave_range)[1]
+                                    for wave_range in self.config['wave_compositions']), default=0)
+        return max(max_boss_wave, max_composition_wave)
+
+    def _running_total(self, totals: List[int], section: dict, wave_number: int) -> int:
+        """Extend a prefix-sum table up to a wave and return its total"""
+        while len(totals) <= wave_number:
+            totals.append(totals[-1] + range_value(section, len(totals)))
+        return totals[max(wave_number, 1)]
+
+    def wave(self, wave_number: int) -> WaveSpec:
+        """Get the (cached) spawn plan for a wave"""
+        spec = self._specs.get(wave_number)
+        if spec is None:
+            spec = self._compile(wave_number)
+            self._specs[wave_number] = spec
+        return spec
+
+    def _compile(self, wave_number: int) -> WaveSpec:
+        """Compile the spawn plan for one wave"""
+        special = self.round_progression['special_rounds'].get(wave_number)
+
+        # Spawn delay shrinks by a per-round amount from wave 2 on
+        spawn_delay = self.spawn_config['base_spawn_delay'] - self._running_total(
+            self._delay_reduction_totals, self.round_progression['spawn_delay_reduction_per_round'], wave_number)
+        if special is not None:
+            spawn_delay = int(spawn_delay * special['spawn_delay_multiplier'])
+        spawn_delay = max(self.spawn_config['min_spawn_delay'], spawn_delay)
+
+        boss_type = None
+        enemy_types: Tuple[type, ...] = ()
+        cumulative_weights: Tuple[float, ...] = ()
+        if wave_number in self.boss_waves:
+            boss_type = self.enemy_classes[self.boss_waves[wave_number]]
+            enemy_count = self.spawn_config['boss_enemy_count']
+        else:
+            enemy_count = self.spawn_config['base_enemy_count'] + self._running_total(
+                self._enemy_increase_totals, self.round_progression['enemy_increase_per_round'], wave_number)
+            if special is not None:
+                enemy_count = int(enemy_count * special['enemy_multiplier'])
+
+            for wave_range, composition in self.config['wave_compositions'].items():
+                first, last = _wave_bounds(wave_range)
+                if first <= wave_number <= last:
+                    enemy_types = tuple(self.enemy_classes[name] for name, _ in composition)
+                    weights = []
+                    cumulative_weight = 0
+                    for _, weight in composition:
+                        cumulative_weight += weight
+                        weights.append(cumulative_weight)
+                    cumulative_weights = tuple(weights)
+                    break
+
+        return WaveSpec(wave_number, enemy_count, spawn_delay, boss_type, enemy_types, cumulative_weights)
+
+    @staticmethod
+    def pick_enemy_type(spec: WaveSpec, rng) -> Optional[type]:
+        """Pick the class of the next enemy of a wave (None if the composition gives no pick)"""
+        if spec.boss_type is not None:
+            return spec.boss_type
+        if not spec.enemy_types:
+            return None
+        # First entry whose cumulative weight reaches the roll
+        index = bisect_left(spec.cumulative_weights, rng.random())
+        return spec.enemy_types[index] if index < len(spec.enemy_types) else None
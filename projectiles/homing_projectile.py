@@ -5,6 +5,10 @@ from .projectile import Projectile
 
 class HomingProjectile(Projectile):
     """Projectile that homes in on the nearest enemy"""
+    __slots__ = ('turning_speed', 'current_target', 'target_enemy', 'retarget_timer', 'retarget_interval')
+
+    update_protocol = 'homing'  # update_homing_with_speed(enemies, speed)
+    
     def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float,
                  speed: float, damage: int, tower_type: str = "basic"):
         super().__init__(start_x, start_y, target_x, target_y, speed, damage, tower_type)
@@ -13,6 +17,12 @@ class HomingProjectile(Projectile):
         self.turning_speed = 0.1
         self.current_target = None
         self.max_distance = 500
+
+        # Locked target, re-acquired when lost or every retarget_interval ticks (see game_systems.homing)
+        from game_systems.homing import RETARGET_INTERVAL
+        self.target_enemy = None
+        self.retarget_timer = 0
+        self.retarget_interval = RETARGET_INTERVAL
     
     def update(self):
         """Update with homing behavior"""
@@ -26,7 +36,7 @@ class HomingProjectile(Projectile):
             self.should_remove = True
         
         # Check if projectile is off-screen
-        if self.x < -50 or self.x > 1250 or self.y < -50 or self.y > 850:
+        if self.is_off_screen():
             self.should_remove = True
     
     def update_homing(self, enemies: List):
@@ -42,15 +52,9 @@ class HomingProjectile(Projectile):
                 self.should_remove = True
             return
         
-        # Find nearest enemy
-        nearest_enemy = None
-        min_distance = float('inf')
-        
-        for enemy in enemies:
-            distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_enemy = enemy
+        # Home in on the locked target
+        from game_systems.homing import locked_target
+        nearest_enemy = locked_target(self, enemies, self.velocity_x, self.velocity_y, 1)
         
         if nearest_enemy:
             # Calculate desired direction
@@ -81,7 +85,7 @@ class HomingProjectile(Projectile):
         if self.distance_traveled >= self.max_distance:
             self.should_remove = True
         
-        if self.x < -50 or self.x > 1250 or self.y < -50 or self.y > 850:
+        if self.is_off_screen():
             self.should_remove = True
     
     def update_homing_with_speed(self, enemies: List, speed_multiplier: float):
@@ -97,15 +101,9 @@ class HomingProjectile(Projectile):
                 self.should_remove = True
             return
         
-        # Find nearest enemy
-        nearest_enemy = None
-        min_distance = float('inf')
-        
-        for enemy in enemies:
-            distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_enemy = enemy
+        # Home in on the locked target
+        from game_systems.homing import locked_target
+        nearest_enemy = locked_target(self, enemies, self.velocity_x, self.velocity_y, speed_multiplier)
         
         if nearest_enemy:
             # Calculate desired direction
@@ -136,7 +134,7 @@ class HomingProjectile(Projectile):
         if self.distance_traveled >= self.max_distance:
             self.should_remove = True
         
-        if self.x < -50 or self.x > 1250 or self.y < -50 or self.y > 850:
+        if self.is_off_screen():
             self.should_remove = True
     
     def check_collision(self, enemies: List) -> dict:
@@ -5,6 +5,8 @@ from .projectile import Projectile
 
 class IceProjectile(Projectile):
     """Projectile that applies freeze effect in an area"""
+    __slots__ = ('freeze_duration', 'area_radius', 'slow_factor')
+
     def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float,
                  speed: float, damage: int, tower_type: str, freeze_duration: int, area_radius: int, slow_factor: float):
         super().__init__(start_x, start_y, target_x, target_y, speed, damage, tower_type)
@@ -16,41 +18,28 @@ class IceProjectile(Projectile):
     
     def check_collision(self, enemies: List) -> dict:
         """Apply freeze effect to enemies in area"""
-        # Check if projectile reached target area
+        # Check if projectile reached target area with enemies in it
         target_distance = math.sqrt((self.x - self.target_x)**2 + (self.y - self.target_y)**2)
+        burst = False
         if target_distance < 10:  # Close enough to target
-            # Apply freeze to all enemies in area
-            total_damage = 0
-            enemies_hit = 0
-            for enemy in enemies:
-                distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
-                if distance <= self.area_radius:
-                    enemy.apply_freeze(self.freeze_duration)
-                    if self.damage > 0:
-                        actual_damage = enemy.take_damage(self.damage, self.tower_type)
-                        total_damage += actual_damage
-                    enemies_hit += 1
-            
-            if enemies_hit > 0:
-                self.should_remove = True
-                return {'hit': True, 'damage': total_damage, 'tower_id': self.source_tower_id}
+            area_radius_squared = self.area_radius * self.area_radius
+            burst = any((self.x - enemy.x)**2 + (self.y - enemy.y)**2 <= area_radius_squared for enemy in enemies)
         
         # Also check direct collision with any enemy
-        for enemy in enemies:
-            distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
-            if distance < (self.size + enemy.size):
-                # Apply freeze to all enemies in area around hit point
-                total_damage = 0
-                for other_enemy in enemies:
-                    area_distance = math.sqrt((self.x - other_enemy.x)**2 + (self.y - other_enemy.y)**2)
-                    if area_distance <= self.area_radius:
-                        other_enemy.apply_freeze(self.freeze_duration)
-                        if self.damage > 0:
-                            actual_damage = other_enemy.take_damage(self.damage, self.tower_type)
-                            total_damage += actual_damage
-                
-                self.should_remove = True
-                return {'hit': True, 'damage': total_damage, 'tower_id': self.source_tower_id}
+        if not burst:
+            burst = any(math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2) < (self.size + enemy.size)
+                        for enemy in enemies)
+        
+        if burst:
+            # Freeze (and damage) all enemies in the area around the burst
+            from game_systems.area_effects import get_area_effects, DamageProfile
+            from game_systems.status_effects import FREEZE
+            outcome = get_area_effects().explode(enemies, self.x, self.y, self.area_radius,
+                                                 DamageProfile(self.damage, self.tower_type),
+                                                 ((FREEZE, self.freeze_duration, 0),), self.source_tower_id)
+            self.should_remove = True
+            if outcome is not None:
+                return {'hit': True, 'damage': outcome[1], 'tower_id': self.source_tower_id}
         return {'hit': False, 'damage': 0, 'tower_id': None}
     
     def draw(self, screen: pygame.Surface):
@@ -1,9 +1,25 @@
 import pygame
 import math
-from typing import List
+import itertools
+from typing import Iterable, Iterator, List
+
+# Projectiles that leave this area (min x, max x, min y, max y) are removed
+SCREEN_BOUNDS = (-50, 1250, -50, 850)
+
+# Collision result of a projectile that hit nothing
+NO_HIT = {'hit': False, 'damage': 0, 'tower_id': None}
+
 
 class Projectile:
     """Base class for all projectiles"""
+    __slots__ = ('x', 'y', 'target_x', 'target_y', 'speed', 'damage', 'tower_type', 'source_tower_id',
+                 'velocity_x', 'velocity_y', 'size', 'color', 'should_remove', 'distance_traveled',
+                 'max_distance')
+
+    update_protocol = 'speed'  # update_with_speed(speed) - see game_systems.dispatch
+    target_radius = 10  # Distance from the target point that counts as arriving (on_impact)
+    trigger_radius = 0  # Distance from the target point at which it goes off without touching an enemy (0: never)
+    
     def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float, 
                  speed: float, damage: int, tower_type: str = "basic"):
         self.x = float(start_x)
@@ -50,7 +66,7 @@ class Projectile:
             self.should_remove = True
         
         # Check if projectile is off-screen
-        if self.x < -50 or self.x > 1250 or self.y < -50 or self.y > 850:
+        if self.is_off_screen():
             self.should_remove = True
         
         # Check collision with target area
@@ -69,7 +85,7 @@ class Projectile:
             self.should_remove = True
         
         # Check if projectile is off-screen
-        if self.x < -50 or self.x > 1250 or self.y < -50 or self.y > 850:
+        if self.is_off_screen():
             self.should_remove = True
         
         # Check collision with target area
@@ -79,7 +95,41 @@ class Projectile:
     def has_reached_target(self) -> bool:
         """Check if projectile has reached its target area"""
         distance_to_target = math.sqrt((self.x - self.target_x)**2 + (self.y - self.target_y)**2)
-        return distance_to_target < 10
+        return distance_to_target < self.target_radius
+
+    def is_off_screen(self) -> bool:
+        """Check if projectile has left the screen bounds"""
+        min_x, max_x, min_y, max_y = SCREEN_BOUNDS
+        return self.x < min_x or self.x > max_x or self.y < min_y or self.y > max_y
+
+    def touching(self, enemies: List) -> Iterator[int]:
+        """Yield the indices of the enemies this projectile overlaps, in list order"""
+        for index, enemy in enumerate(enemies):
+            distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
+            if distance < (self.size + enemy.size):
+                yield index
+
+    def reached_trigger_point(self) -> bool:
+        """Check if projectile is close enough to its target point to go off on its own"""
+        if not self.trigger_radius:
+            return False
+        distance_to_target = math.sqrt((self.x - self.target_x)**2 + (self.y - self.target_y)**2)
+        return distance_to_target < self.trigger_radius
+
+    def check_collision(self, enemies: List) -> dict:
+        """Check collision with enemies, resolving it through resolve_hits() on a touch or at the trigger point"""
+        hits = self.touching(enemies)
+        first = next(hits, None)
+        if first is not None:
+            # Put the first hit back; the rest are only tested as far as resolve_hits reads them
+            return self.resolve_hits(enemies, itertools.chain((first,), hits))
+        if self.reached_trigger_point():
+            return self.resolve_hits(enemies, ())
+        return dict(NO_HIT)
+
+    def resolve_hits(self, enemies: List, hits: Iterable[int]) -> dict:
+        """Apply the projectile's effect given the indices of the enemies it touches - overridden by subclasses"""
+        return dict(NO_HIT)
     
     def on_impact(self):
         """Handle projectile impact - to be overridden by subclasses"""
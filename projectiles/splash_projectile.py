@@ -1,10 +1,12 @@
 import pygame
-import math
-from typing import List
-from .projectile import Projectile
+from typing import Iterable, List
+from .projectile import Projectile, NO_HIT
 
 class SplashProjectile(Projectile):
     """Projectile that deals area damage on impact"""
+    __slots__ = ('splash_radius', 'has_exploded')
+    trigger_radius = Projectile.target_radius  # Explodes on reaching its target, even without a direct hit
+
     def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float,
                  speed: float, damage: int, splash_radius: float):
         super().__init__(start_x, start_y, target_x, target_y, speed, damage, tower_type)
@@ -18,34 +20,23 @@ class SplashProjectile(Projectile):
         self.has_exploded = True
         self.should_remove = True
     
-    def check_collision(self, enemies: List) -> dict:
-        """Check for direct hit, then explode"""
-        direct_hit = False
-        for enemy in enemies:
-            distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
-            if distance < (self.size + enemy.size):
-                direct_hit = True
-                break
-        
-        if direct_hit or self.has_reached_target():
-            total_damage = self.explode(enemies)
-            return {'hit': total_damage > 0, 'damage': total_damage, 'tower_id': self.source_tower_id}
-        return {'hit': False, 'damage': 0, 'tower_id': None}
+    def resolve_hits(self, enemies: List, hits: Iterable[int]) -> dict:
+        """Explode with falloff damage in the splash radius"""
+        total_damage = self.explode(enemies)
+        if total_damage is None:
+            # Queued - the area-effect service credits the tower when it resolves
+            return dict(NO_HIT)
+        return {'hit': total_damage > 0, 'damage': total_damage, 'tower_id': self.source_tower_id}
     
     def explode(self, enemies: List):
-        """Deal splash damage to all enemies in radius"""
-        total_damage = 0
-        for enemy in enemies:
-            distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
-            if distance <= self.splash_radius:
-                # Damage decreases with distance
-                damage_multiplier = 1.0 - (distance / self.splash_radius) * 0.5
-                actual_damage = max(1, int(self.damage * damage_multiplier))
-                damage_dealt = enemy.take_damage(actual_damage, self.tower_type)
-                total_damage += damage_dealt
-        
+        """Deal splash damage to all enemies in radius, returns the damage dealt (None if queued)"""
+        from game_systems.area_effects import get_area_effects, DamageProfile
+        # Damage decreases with distance, down to half at the edge
+        outcome = get_area_effects().explode(enemies, self.x, self.y, self.splash_radius,
+                                             DamageProfile(self.damage, self.tower_type, falloff=0.5),
+                                             tower_id=self.source_tower_id)
         self.should_remove = True
-        return total_damage
+        return None if outcome is None else outcome[1]
     
     def draw(self, screen: pygame.Surface):
         """Draw splash projectile"""
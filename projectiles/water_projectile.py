@@ -1,10 +1,12 @@
 import pygame
-import math
-from typing import List
+from typing import Iterable, List
 from .projectile import Projectile
 
 class WaterProjectile(Projectile):
     """Projectile that applies wet status to enemies in an area"""
+    __slots__ = ('wet_duration', 'splash_radius', 'lightning_multiplier', 'has_splashed')
+    trigger_radius = 8  # Splashes when close enough to its target, even without a direct hit
+
     def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float,
                  speed: float, damage: int, tower_type: str, wet_duration: int, splash_radius: int, lightning_multiplier: float):
         super().__init__(start_x, start_y, target_x, target_y, speed, damage, tower_type)
@@ -15,21 +17,10 @@ class WaterProjectile(Projectile):
         self.color = (30, 144, 255)  # Deep blue
         self.has_splashed = False
     
-    def check_collision(self, enemies: List) -> dict:
-        """Check for collision and apply wet status in area"""
-        # Check if projectile reached target area
-        target_distance = math.sqrt((self.x - self.target_x)**2 + (self.y - self.target_y)**2)
-        if target_distance < 8:  # Close enough to target
-            enemies_hit = self.splash_water(enemies)
-            return {'hit': enemies_hit > 0, 'damage': 0, 'tower_id': self.source_tower_id}
-        
-        # Also check direct collision with any enemy
-        for enemy in enemies:
-            distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
-            if distance < (self.size + enemy.size):
-                enemies_hit = self.splash_water(enemies)
-                return {'hit': enemies_hit > 0, 'damage': 0, 'tower_id': self.source_tower_id}
-        return {'hit': False, 'damage': 0, 'tower_id': None}
+    def resolve_hits(self, enemies: List, hits: Iterable[int]) -> dict:
+        """Soak everything in the splash radius"""
+        enemies_hit = self.splash_water(enemies)
+        return {'hit': enemies_hit > 0, 'damage': 0, 'tower_id': self.source_tower_id}
     
     def splash_water(self, enemies: List):
         """Apply wet status to all enemies in splash radius"""
@@ -37,17 +28,15 @@ class WaterProjectile(Projectile):
             return 0
         
         self.has_splashed = True
-        enemies_hit = 0
-        
-        for enemy in enemies:
-            distance = math.sqrt((self.x - enemy.x)**2 + (self.y - enemy.y)**2)
-            if distance <= self.splash_radius:
-                # Apply wet status
-                enemy.apply_wet_status(self.wet_duration, self.lightning_multiplier)
-                enemies_hit += 1
+        from game_systems.area_effects import get_area_effects, DamageProfile
+        from game_systems.status_effects import WET
+        outcome = get_area_effects().explode(enemies, self.x, self.y, self.splash_radius, DamageProfile(0),
+                                             ((WET, self.wet_duration, self.lightning_multiplier),),
+                                             self.source_tower_id)
         
         self.should_remove = True
-        return enemies_hit
+        # Queued splashes are credited by the area-effect service
+        return 0 if outcome is None else outcome[0]
     
     def draw(self, screen: pygame.Surface):
         """Draw water projectile with water effects"""
@@ -0,0 +1,111 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemies import BasicEnemy
+from game_systems.area_effects import AreaEffects, DamageProfile
+from game_systems.events import EventBus, DAMAGE
+from game_systems.simulation_context import SimulationContext, get_context, set_context
+from game_systems.simulation_core import SimulationCore
+from projectiles import IceProjectile
+from towers import CannonTower
+from towers.cannon_tower import ExplosiveCannonball
+
+
+class TestAreaEffects(unittest.TestCase):
+    """Test cases for the area-of-effect service"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 400), (1200, 400)]
+        rng = random.Random(4)
+        self.enemies = []
+        for _ in range(120):
+            enemy = BasicEnemy(self.test_path)
+            enemy.x, enemy.y = rng.uniform(100, 1100), rng.uniform(300, 500)
+            enemy.health = enemy.max_health = 1000
+            self.enemies.append(enemy)
+        self.previous_context = get_context()
+        self.context = SimulationContext()
+        set_context(self.context)
+
+    def tearDown(self):
+        set_context(self.previous_context)
+
+    def damage_taken(self, enemies):
+        return [enemy.max_health - enemy.health for enemy in enemies]
+
+    def test_profiles(self):
+        """Test full damage inside the inner radius, outer damage beyond it and linear falloff"""
+        stepped = DamageProfile(25, inner_radius=15, outer_damage=10)
+        self.assertEqual([stepped.amount(distance, 40) for distance in (0, 14.9, 15, 40)], [25, 25, 10, 10])
+        falloff = DamageProfile(20, falloff=0.5)
+        self.assertEqual([falloff.amount(distance, 40) for distance in (0, 20, 40)], [20, 15, 10])
+        self.assertEqual(DamageProfile(1, falloff=0.9).amount(40, 40), 1)
+
+    def test_deferred_blasts_match_immediate(self):
+        """Test queued blasts deal the same damage as immediate ones and credit each source tower once"""
+        blasts = [(random.Random(i).uniform(100, 1100), random.Random(-i).uniform(300, 500)) for i in range(30)]
+        profile = DamageProfile(25, inner_radius=15, outer_damage=10)
+
+        immediate = AreaEffects()
+        reference = [immediate.explode(self.enemies, x, y, 60, profile) for x, y in blasts]
+        expected = self.damage_taken(self.enemies)
+        for enemy in self.enemies:
+            enemy.health = enemy.max_health
+
+        tower = CannonTower(0, 0)
+        credited = []
+        events = EventBus()
+        events.subscribe(DAMAGE, credited.extend)
+        self.context.events = events
+        deferred = AreaEffects({7: tower}.get, deferred=True)
+        for x, y in blasts:
+            self.assertIsNone(deferred.explode(self.enemies, x, y, 60, profile, tower_id=7))
+        self.assertEqual(self.damage_taken(self.enemies), [0] * len(self.enemies))
+
+        deferred.resolve(self.enemies)
+        events.dispatch()
+        self.assertEqual(self.damage_taken(self.enemies), expected)
+        self.assertEqual([amount for _, amount in credited],
+                         [damage for enemies_hit, damage in reference if enemies_hit])
+        self.assertEqual(deferred.queue, [])
+
+    def test_ice_burst_freezes_area_once(self):
+        """Test an ice projectile touching one enemy freezes and damages everything in its area once"""
+        projectile = IceProjectile(600, 400, 900, 400, 3.0, 4, 'ice', 120, 50, 0.5)
+        near = [enemy for enemy in self.enemies if (enemy.x - 600) ** 2 + (enemy.y - 400) ** 2 <= 50 ** 2]
+        self.enemies[0].x, self.enemies[0].y = 600, 405
+        near = [self.enemies[0]] + [enemy for enemy in near if enemy is not self.enemies[0]]
+
+        result = projectile.check_collision(self.enemies)
+        self.assertTrue(result['hit'])
+        self.assertTrue(projectile.should_remove)
+        self.assertTrue(all(enemy.frozen for enemy in near))
+        self.assertEqual(sum(self.damage_taken(self.enemies)), result['damage'])
+        self.assertEqual(result['damage'], 4 * len(near))
+
+    def test_core_resolves_and_credits_blasts(self):
+        """Test a cannonball in a SimulationCore explodes at the end of the projectile phase"""
+        core = SimulationCore(seed=3)
+        tower = CannonTower(500, 300)
+        core.tower_registry.register(tower)
+        core.enemies.extend(self.enemies)
+        cannonball = ExplosiveCannonball(self.enemies[0].x - 3, self.enemies[0].y, 1200, 400, 1, 25, 40, 15)
+        cannonball.source_tower_id = tower.tower_id
+        core.projectiles.append(cannonball)
+
+        core.update_projectiles()
+        self.assertTrue(cannonball.should_remove)
+        dealt = sum(self.damage_taken(self.enemies))
+        self.assertGreaterEqual(dealt, 25)
+        core.events.dispatch()
+        self.assertEqual(tower.total_damage_dealt, dealt)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.game_config import get_balance_config
+from game_systems.damage_table import DamageTable, get_damage_table
+import enemies
+
+
+def reference_multiplier(counter_config, tower_type, enemy_class, wet):
+    """Counter multiplier as the nested-dict lookup computed it"""
+    multipliers = counter_config.get('tower_enemy_multipliers', {})
+    multiplier = counter_config.get('default_multiplier', 1.0)
+    if tower_type in multipliers:
+        tower_multipliers = multipliers[tower_type]
+        if enemy_class in tower_multipliers:
+            multiplier = tower_multipliers[enemy_class]
+        elif tower_type == 'lightning' and wet and 'wet_enemies' in tower_multipliers:
+            multiplier = tower_multipliers['wet_enemies']
+    return max(counter_config.get('min_multiplier', 0.1),
+               min(counter_config.get('max_multiplier', 3.0), multiplier))
+
+
+class TestDamageTable(unittest.TestCase):
+    """Test cases for the compiled counter multiplier table"""
+
+    def test_matches_config_for_every_pair(self):
+        """Test every tower/enemy/wet combination matches the config lookup"""
+        counter_config = get_balance_config()['counter_system']
+        table = get_damage_table()
+        enemy_classes = [getattr(enemies, name) for name in enemies.__all__]
+        tower_types = list(counter_config['tower_enemy_multipliers']) + ['unknown']
+
+        for tower_type in tower_types:
+            for enemy_class in enemy_classes:
+                for wet in (False, True):
+                    self.assertEqual(table.multiplier(tower_type, enemy_class, wet),
+                                     reference_multiplier(counter_config, tower_type, enemy_class.__name__, wet),
+                                     (tower_type, enemy_class.__name__, wet))
+
+    def test_clamping_and_wet_precedence(self):
+        """Test clamping is compiled in and named enemies beat the wet bonus"""
+        Named = type('Named', (), {})
+        Other = type('Other', (), {})
+        table = DamageTable({
+            'tower_enemy_multipliers': {
+                'lightning': {'Named': 0.5, 'wet_enemies': 9.0},
+                'ice': {'Named': 0.01},
+            },
+            'max_multiplier': 2.0,
+            'min_multiplier': 0.2,
+        })
+
+        self.assertEqual(table.multiplier('lightning', Other, wet=True), 2.0)
+        self.assertEqual(table.multiplier('lightning', Other, wet=False), 1.0)
+        self.assertEqual(table.multiplier('lightning', Named, wet=True), 0.5)
+        self.assertEqual(table.multiplier('ice', Named, wet=True), 0.2)
+        self.assertEqual(table.multiplier('basic', Named), 1.0)
+
+    def test_take_damage_uses_table(self):
+        """Test take_damage applies the compiled multiplier"""
+        enemy = enemies.BasicEnemy([(0, 0), (100, 0)])
+        multiplier = get_damage_table().multiplier('antiair', enemies.BasicEnemy)
+        health = enemy.health
+
+        enemy.take_damage(10, 'antiair')
+        self.assertEqual(health - enemy.health, int(10 * multiplier))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems.dispatch import enemy_dispatch, tower_dispatch, projectile_dispatch
+from enemies import BasicEnemy, SplittingEnemy, NecromancerBoss, MegaBoss, TimeLordBoss
+from towers import BasicTower
+from towers.cannon_tower import ExplosiveCannonball
+from projectiles import BasicProjectile, HomingProjectile
+
+
+class TestDispatch(unittest.TestCase):
+    """Test cases for per-class update dispatch"""
+
+    def test_enemy_hooks(self):
+        """Test enemy hooks are read from the class once"""
+        basic = enemy_dispatch(BasicEnemy)
+        self.assertFalse(basic.spawns_minions or basic.spawns_echoes or basic.summons_undead)
+        self.assertIsNone(basic.on_death)
+        self.assertIs(enemy_dispatch(BasicEnemy), basic)
+
+        self.assertIsNotNone(enemy_dispatch(SplittingEnemy).on_death)
+        self.assertTrue(enemy_dispatch(MegaBoss).spawns_minions)
+        self.assertTrue(enemy_dispatch(TimeLordBoss).spawns_echoes)
+        self.assertTrue(enemy_dispatch(NecromancerBoss).summons_undead)
+        self.assertTrue(enemy_dispatch(NecromancerBoss).tracks_dead_enemies)
+
+    def test_enemy_update(self):
+        """Test the enemy handler advances the enemy with game speed"""
+        enemy = BasicEnemy([(0, 0), (1000, 0)])
+        enemy_dispatch(BasicEnemy).update(enemy, 2)
+        self.assertAlmostEqual(enemy.distance_traveled, enemy.speed * 2)
+
+    def test_tower_update(self):
+        """Test towers dispatch to their optimized speed update"""
+        self.assertIs(tower_dispatch(BasicTower).update, BasicTower.update_with_speed_optimized)
+
+    def test_projectile_protocols(self):
+        """Test projectiles are advanced through their declared protocol"""
+        projectile = BasicProjectile(0, 0, 100, 0, 5, 1)
+        projectile_dispatch(BasicProjectile).update(projectile, [], 2)
+        self.assertEqual(projectile.x, 10)
+
+        self.assertIs(projectile_dispatch(HomingProjectile).update, HomingProjectile.update_homing_with_speed)
+
+        # Plain projectiles ignore the speed multiplier
+        cannonball = ExplosiveCannonball(100, 100, 200, 100, 5, 1, 30, 1)
+        projectile_dispatch(ExplosiveCannonball).update(cannonball, [], 3)
+        self.assertEqual(cannonball.x, 105)
+
+    def test_undeclared_projectile_is_inferred(self):
+        """Test legacy projectile classes without a declared protocol still dispatch"""
+        class LegacyProjectile:
+            def __init__(self):
+                self.calls = []
+
+            def update(self, enemies):
+                self.calls.append(('update', enemies))
+
+            def update_with_speed(self, enemies, speed_multiplier):
+                self.calls.append(('update_with_speed', speed_multiplier))
+
+        projectile = LegacyProjectile()
+        dispatch = projectile_dispatch(LegacyProjectile)
+        dispatch.update(projectile, [], 2)
+        self.assertEqual(projectile.calls, [('update_with_speed', 2)])
+        self.assertIsNone(dispatch.check_collision)
+
+
+if __name__ == '__main__':
+    unittest.main()
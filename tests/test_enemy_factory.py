@@ -0,0 +1,114 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemies import BasicEnemy, FireElementalEnemy, RegeneratingEnemy, BlastProofEnemy
+from enemies.immunities import FLAME, EXPLOSIVE, CANNON, MISSILE
+from game_systems.enemy_factory import EnemyFactory, slot_names
+from game_systems.simulation_context import SimulationContext, get_context, set_context
+from game_systems.status_effects import StatusEffects
+
+
+class TestEnemyFactory(unittest.TestCase):
+    """Test cases for prototype-based enemy spawning and recycling"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 100), (200, 100), (200, 300)]
+        self.factory = EnemyFactory()
+        self.previous_context = get_context()
+        self.status_effects = StatusEffects()
+        self.context = SimulationContext(status_effects=self.status_effects)
+        set_context(self.context)
+
+    def tearDown(self):
+        set_context(self.previous_context)
+
+    def state(self, enemy) -> dict:
+        return {name: getattr(enemy, name) for name in slot_names(type(enemy)) if hasattr(enemy, name)}
+
+    def test_clone_matches_constructor(self):
+        """Test a cloned enemy has the same state as one built normally"""
+        self.factory.create(FireElementalEnemy, self.test_path, 12)
+        self.context.rng = random.Random(5)
+        clone = self.factory.create(FireElementalEnemy, self.test_path, 12)
+        self.context.rng = random.Random(5)
+        built = FireElementalEnemy(self.test_path, 12)
+        self.assertIsInstance(clone, FireElementalEnemy)
+        self.assertEqual(self.state(clone), self.state(built))
+
+    def test_scaling_applied_once_per_prototype(self):
+        """Test the scale callback runs on the first spawn only and carries over to clones"""
+        calls = []
+
+        def scale(enemy):
+            calls.append(enemy)
+            enemy.max_health = enemy.health = enemy.max_health * 3
+
+        first = self.factory.create(BasicEnemy, self.test_path, 4, scale=scale)
+        second = self.factory.create(BasicEnemy, self.test_path, 4, scale=scale)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second.max_health, first.max_health)
+        self.assertEqual(second.health, first.max_health)
+
+    def test_mutable_state_not_shared(self):
+        """Test clones get their own particle lists but share the path"""
+        first = self.factory.create(FireElementalEnemy, self.test_path)
+        second = self.factory.create(FireElementalEnemy, self.test_path)
+        first.flame_particles.append({'life': 5})
+        self.assertEqual(second.flame_particles, [])
+        self.assertIs(second.path, first.path)
+
+    def test_immunities_rolled_per_spawn(self):
+        """Test each clone rolls its own immunities and keeps its class's granted ones"""
+        self.context.rng = random.Random(3)
+        masks = [self.factory.create(BlastProofEnemy, self.test_path, 60).immunity_mask for _ in range(20)]
+        for mask in masks:
+            self.assertEqual(mask & (EXPLOSIVE | CANNON | MISSILE), EXPLOSIVE | CANNON | MISSILE)
+        self.assertGreater(len(set(masks)), 1)
+
+        self.context.rng = random.Random(3)
+        expected = [BlastProofEnemy(self.test_path, 60).immunity_mask for _ in range(20)]
+        self.assertEqual(masks, expected)
+        self.assertTrue(self.factory.create(FireElementalEnemy, self.test_path).immunity_mask & FLAME)
+
+    def test_released_enemies_reused_after_a_wave(self):
+        """Test released enemies are only reused once a whole wave has passed"""
+        enemies = [self.factory.create(BasicEnemy, self.test_path) for _ in range(3)]
+        enemies[0].health = 0
+        self.factory.release(enemies[:2])
+        self.assertEqual(self.factory.pooled(BasicEnemy), 0)
+
+        self.factory.recycle_released()
+        self.assertEqual(self.factory.pooled(BasicEnemy), 0)
+        self.factory.recycle_released()
+        self.assertEqual(self.factory.pooled(BasicEnemy), 2)
+
+        reused = self.factory.create(BasicEnemy, self.test_path)
+        self.assertIn(reused, enemies[:2])
+        self.assertEqual(reused.health, reused.max_health)
+        self.assertEqual(self.factory.pooled(BasicEnemy), 1)
+
+    def test_release_cancels_periodic_tasks(self):
+        """Test releasing a regenerating enemy stops its regeneration, reuse restarts it"""
+        enemy = self.factory.create(RegeneratingEnemy, self.test_path)
+        enemy.health -= 5
+        self.factory.release([enemy])
+        self.assertEqual(self.status_effects.tasks, {})
+        for _ in range(300):
+            self.status_effects.update()
+        self.assertEqual(len(self.status_effects.wheel), 0)
+
+        self.factory.recycle_released()
+        self.factory.recycle_released()
+        reused = self.factory.create(RegeneratingEnemy, self.test_path)
+        self.assertIs(reused, enemy)
+        self.assertEqual(len(self.status_effects.tasks[id(reused)]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems import SimulationCore
+from game_systems.entity_list import EntityList
+
+
+class TestEntityList(unittest.TestCase):
+    """Test cases for deferred entity removal"""
+
+    def test_compact_preserves_order(self):
+        """Test marked entities are dropped in one pass with survivors in order"""
+        entities = EntityList(object() for _ in range(10))
+        original = list(entities)
+        for entity in original[::3]:
+            entities.mark_removed(entity)
+
+        self.assertEqual(len(entities), 10)
+        self.assertTrue(entities.is_removed(original[3]))
+
+        list_identity = id(entities)
+        entities.compact()
+        self.assertEqual(entities, [entity for i, entity in enumerate(original) if i % 3])
+        self.assertEqual(id(entities), list_identity)
+        self.assertFalse(entities.is_removed(original[3]))
+
+    def test_behaves_like_a_list(self):
+        """Test the container still works as a plain list"""
+        entities = EntityList([1, 2])
+        entities.append(3)
+        entities.extend([4])
+        self.assertEqual(entities, [1, 2, 3, 4])
+        self.assertIn(3, entities)
+        self.assertEqual(EntityList(), [])
+
+    def test_core_compacts_each_tick(self):
+        """Test leaked enemies are gone from the core's list after the tick"""
+        core = SimulationCore()
+        core.step(300)
+        for enemy in core.enemies:
+            enemy.reached_end = True
+        lives = core.lives
+        leaked = len(core.enemies)
+        self.assertGreater(leaked, 0)
+
+        core.update_enemies()
+        self.assertEqual(core.lives, lives - leaked)
+        self.assertEqual(core.enemies, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
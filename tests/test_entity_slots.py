@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import enemies
+import projectiles
+from game_systems.tower_manager import TowerManager
+from towers.cannon_tower import ExplosiveCannonball
+from towers.explosive_tower import ExplosiveRocket
+from towers.missile_tower import HomingMissile
+from towers.poison_tower import PoisonProjectile
+
+
+class TestEntitySlots(unittest.TestCase):
+    """Test cases for slotted enemies, towers and projectiles"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 100), (200, 100), (200, 300)]
+
+    def test_enemies_have_no_instance_dict(self):
+        """Test every enemy class stores its state in slots"""
+        for name in enemies.__all__:
+            with self.subTest(enemy_class=name):
+                enemy = getattr(enemies, name)(self.test_path)
+                self.assertFalse(hasattr(enemy, '__dict__'))
+                with self.assertRaises(AttributeError):
+                    enemy.undeclared_state = 1
+
+    def test_towers_have_no_instance_dict(self):
+        """Test every tower class stores its state in slots"""
+        for tower_type, tower_class in TowerManager()._get_tower_classes().items():
+            with self.subTest(tower_type=tower_type):
+                self.assertFalse(hasattr(tower_class(100, 100), '__dict__'))
+
+    def test_projectiles_have_no_instance_dict(self):
+        """Test projectile classes store their state in slots"""
+        for name in ('BasicProjectile', 'SniperProjectile', 'HomingProjectile'):
+            with self.subTest(projectile_class=name):
+                projectile = getattr(projectiles, name)(0, 0, 100, 100, 5, 10, 'basic')
+                self.assertFalse(hasattr(projectile, '__dict__'))
+        for projectile_class in (ExplosiveCannonball, ExplosiveRocket, HomingMissile, PoisonProjectile):
+            self.assertEqual(projectile_class.__dictoffset__, 0)  # No per-instance __dict__
+            self.assertIn('source_tower_id', projectile_class.__slots__)
+
+    def test_status_effect_state_is_declared(self):
+        """Test freeze, wet and detection state starts inactive on every enemy"""
+        enemy = enemies.TankEnemy(self.test_path)
+        self.assertEqual((enemy.freeze_timer, enemy.wet_timer), (0, 0))
+        self.assertFalse(enemy.detected_by_detector)
+
+    def test_base_speed_follows_initial_speed(self):
+        """Test subclasses set their base speed through set_base_speed"""
+        for name in ('FastEnemy', 'TankEnemy', 'SpeedBoss', 'SplittingEnemy'):
+            with self.subTest(enemy_class=name):
+                enemy = getattr(enemies, name)(self.test_path)
+                self.assertEqual(enemy.base_speed, enemy.speed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemies import BasicEnemy, NecromancerBoss
+from game_systems.events import EventBus, DAMAGE, KILL, SPAWN, LEAK, credit_damage
+from game_systems.simulation_core import SimulationCore
+from towers import BasicTower, LaserTower
+
+
+class TestEventBus(unittest.TestCase):
+    """Test cases for the gameplay event bus"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 100), (200, 100), (200, 300)]
+        self.bus = EventBus()
+
+    def test_batches_are_dispatched_in_kind_order(self):
+        """Test each subscriber gets its kind's whole batch once per dispatch"""
+        received = []
+        self.bus.subscribe(KILL, lambda events: received.append(('kill', list(events))))
+        self.bus.subscribe(SPAWN, lambda events: received.append(('spawn', [event.enemy for event in events])))
+        enemies = [BasicEnemy(self.test_path) for _ in range(3)]
+
+        self.bus.kill(enemies[0])
+        self.bus.kill(enemies[1])
+        self.bus.spawn(enemies[2], enemies[0])
+        self.bus.dispatch()
+        self.assertEqual(received, [('spawn', [enemies[2]]), ('kill', enemies[:2])])
+
+        self.bus.dispatch()
+        self.assertEqual(len(received), 2)
+
+    def test_unsubscribed_kinds_are_not_queued(self):
+        """Test publishing without subscribers queues nothing"""
+        self.bus.leak(BasicEnemy(self.test_path))
+        self.bus.damage(BasicTower(0, 0), 5)
+        self.assertEqual((self.bus.pending(LEAK), self.bus.pending(DAMAGE)), (0, 0))
+
+    def test_events_published_while_dispatching_wait(self):
+        """Test events raised by a handler are delivered on the next dispatch"""
+        enemy = BasicEnemy(self.test_path)
+        batches = []
+
+        def handler(events):
+            batches.append(len(events))
+            if len(batches) == 1:
+                self.bus.kill(enemy)
+        self.bus.subscribe(KILL, handler)
+
+        self.bus.kill(enemy)
+        self.bus.dispatch()
+        self.assertEqual(self.bus.pending(KILL), 1)
+        self.bus.dispatch()
+        self.assertEqual(batches, [1, 1])
+
+    def test_credit_damage(self):
+        """Test the currency subscriber records damage once per reported hit"""
+        tower = LaserTower(0, 0)
+        self.bus.subscribe(DAMAGE, credit_damage)
+        self.bus.damage(tower, 40)
+        self.bus.damage(tower, 10)
+        self.bus.dispatch()
+        self.assertEqual(tower.total_damage_dealt, 50)
+
+
+class TestCoreEvents(unittest.TestCase):
+    """Test cases for the simulation's event subscribers"""
+
+    def test_kills_pay_out_at_end_of_tick(self):
+        """Test kill rewards are paid when the tick's events are dispatched"""
+        core = SimulationCore(seed=1)
+        enemy = BasicEnemy(core.map.get_path())
+        core.enemies.append(enemy)
+        enemy.health = 0
+        money = core.money
+
+        core.update_enemies()
+        self.assertEqual(core.money, money)
+        core.events.dispatch()
+        self.assertEqual(core.money, money + enemy.reward)
+
+    def test_necromancers_hear_about_deaths(self):
+        """Test only Necromancer bosses in play are told about kills"""
+        core = SimulationCore(seed=1)
+        path = core.map.get_path()
+        boss = NecromancerBoss(path)
+        core.events.spawn(boss)
+        core.events.dispatch()
+        self.assertEqual(core.dead_enemy_trackers, [boss])
+
+        victim = BasicEnemy(path)
+        core.events.kill(victim)
+        core.events.dispatch()
+        self.assertEqual(boss.dead_enemies_list[-1]['type'], 'BasicEnemy')
+
+        core.events.leak(boss)
+        core.events.dispatch()
+        self.assertEqual(core.dead_enemy_trackers, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemies import BasicEnemy
+from game_systems.homing import locked_target, nearest_enemy
+from game_systems.simulation_context import SimulationContext, get_context, set_context
+from game_systems.spatial_grid import SpatialGrid
+from projectiles import HomingProjectile
+from towers.missile_tower import HomingMissile
+
+
+class TestHoming(unittest.TestCase):
+    """Test cases for homing target locking"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 400), (1200, 400)]
+        self.enemies = []
+        for x in (300, 340, 900):
+            enemy = BasicEnemy(self.test_path)
+            enemy.x, enemy.y = x, 400
+            self.enemies.append(enemy)
+        self.previous_context = get_context()
+        self.context = SimulationContext()
+        set_context(self.context)
+
+    def tearDown(self):
+        set_context(self.previous_context)
+
+    def test_grid_and_scan_agree(self):
+        """Test the nearest living enemy is the same with and without the enemy grid"""
+        self.enemies[0].health = 0
+        expected = nearest_enemy(self.enemies, 250, 400)
+        self.assertIs(expected, self.enemies[1])
+
+        grid = SpatialGrid()
+        grid.rebuild(self.enemies)
+        self.context.enemy_grid = grid
+        self.assertIs(nearest_enemy(self.enemies, 250, 400), expected)
+
+    def test_lock_kept_until_interval(self):
+        """Test a locked target is kept while closer enemies appear, until the interval runs out"""
+        projectile = HomingProjectile(200, 400, 300, 400, 2.0, 5)
+        projectile.update_homing_with_speed(self.enemies, 1.0)
+        self.assertIs(projectile.target_enemy, self.enemies[0])
+
+        closer = BasicEnemy(self.test_path)
+        closer.x, closer.y = projectile.x + 20, 400
+        enemies = self.enemies + [closer]
+        for _ in range(projectile.retarget_interval - 1):
+            projectile.update_homing_with_speed(enemies, 1.0)
+            self.assertIs(projectile.target_enemy, self.enemies[0])
+        projectile.update_homing_with_speed(enemies, 1.0)
+        self.assertIs(projectile.target_enemy, closer)
+
+    def test_lock_lost_on_death_or_leaving_cone(self):
+        """Test a target is dropped as soon as it dies or falls behind the projectile"""
+        projectile = HomingProjectile(200, 400, 300, 400, 2.0, 5)
+        self.assertIs(locked_target(projectile, self.enemies, 1, 0, 1), self.enemies[0])
+
+        self.enemies[0].health = 0
+        self.assertIs(locked_target(projectile, self.enemies, 1, 0, 1), self.enemies[1])
+
+        self.enemies[1].x = 150
+        self.enemies[2].x = 230
+        self.assertIs(locked_target(projectile, self.enemies, 1, 0, 1), self.enemies[2])
+
+    def test_missile_follows_locked_target(self):
+        """Test a homing missile aims at its locked target's current position"""
+        missile = HomingMissile(200, 400, 300, 400, 3.0, 40, 60, 20)
+        missile.update_with_speed(self.enemies, 1.0)
+        self.assertIs(missile.target_enemy, self.enemies[0])
+
+        self.enemies[0].y = 420
+        missile.update_with_speed(self.enemies, 1.0)
+        self.assertEqual((missile.target_x, missile.target_y), (300, 420))
+
+
+if __name__ == '__main__':
+    unittest.main()
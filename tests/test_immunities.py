@@ -0,0 +1,74 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.game_config import get_balance_config
+from enemies import BasicEnemy, BlastProofEnemy
+from enemies.immunities import (EFFECT_BITS, RANDOM_IMMUNITIES, FREEZE, WET, EXPLOSIVE,
+                                immunity_names, roll_immunities, wave_immunity_chance)
+
+
+def reference_immunities(wave_number, rng):
+    """Random immunities as the per-spawn dict roll produced them"""
+    immunity_config = get_balance_config()['immunity']
+    immunities = {name: False for name in ('freeze', 'slow', 'poison', 'burn', 'wet', 'stun')}
+    chance = min(immunity_config['max_immunity_chance'], wave_number * immunity_config['base_chance_per_wave'])
+    if wave_number % 10 == 0:
+        chance *= immunity_config['boss_wave_multiplier']
+    elif wave_number % 5 == 0:
+        chance *= immunity_config['mini_boss_multiplier']
+    for name in immunities:
+        if rng.random() < chance:
+            immunities[name] = True
+    if wave_number <= immunity_config['early_game_waves']:
+        immune = [name for name, value in immunities.items() if value]
+        if len(immune) > immunity_config['early_game_max_immunities']:
+            keep = rng.sample(immune, immunity_config['early_game_max_immunities'])
+            immunities = {name: name in keep for name in immunities}
+    return sorted(name for name, value in immunities.items() if value)
+
+
+class TestImmunities(unittest.TestCase):
+    """Test cases for bitmask immunities"""
+
+    def test_rolls_match_dict_rolls(self):
+        """Test the bitmask roll draws the same immunities from the same RNG stream"""
+        for wave_number in (1, 5, 9, 10, 15, 20, 40):
+            rng, reference_rng = random.Random(wave_number), random.Random(wave_number)
+            for _ in range(300):
+                mask = roll_immunities(wave_number, rng)
+                self.assertEqual(sorted(immunity_names(mask)), reference_immunities(wave_number, reference_rng))
+            self.assertEqual(rng.random(), reference_rng.random())
+
+    def test_wave_chances_are_cached(self):
+        """Test per-wave chances are computed once"""
+        self.assertIs(wave_immunity_chance(7), wave_immunity_chance(7))
+        self.assertIsNone(wave_immunity_chance(40)[1])
+
+    def test_bit_checks(self):
+        """Test immunity and resistance checks read the mask"""
+        enemy = BasicEnemy([(0, 0), (100, 0)])
+        enemy.immunity_mask = FREEZE | WET
+        self.assertTrue(enemy.is_immune_to('wet'))
+        self.assertTrue(enemy.has_resistance_to('freeze'))
+        self.assertFalse(enemy.is_immune_to('poison'))
+        self.assertFalse(enemy.is_immune_to('unknown'))
+
+        enemy.apply_wet_status(60, 2.0)
+        self.assertFalse(enemy.wet)
+
+    def test_granted_immunities(self):
+        """Test enemy types add their fixed immunities to the rolled ones"""
+        enemy = BlastProofEnemy([(0, 0), (100, 0)])
+        self.assertTrue(enemy.immunity_mask & EXPLOSIVE)
+        self.assertTrue(enemy.is_immune_to('missile'))
+        self.assertEqual(len(set(EFFECT_BITS.values())), len(EFFECT_BITS))
+        self.assertEqual(len(RANDOM_IMMUNITIES), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,7 +39,7 @@ class TestIntegration(unittest.TestCase):
         enemies = [enemy]
         
         # Force tower to be ready to shoot
-        tower.shoot_timer = tower.fire_rate
+        tower.fire_timer = 0
         
         # Update tower
         tower.update(enemies, projectiles)
@@ -59,7 +59,7 @@ class TestIntegration(unittest.TestCase):
         enemies = [enemy]
         
         # Make tower shoot
-        tower.shoot_timer = tower.fire_rate
+        tower.fire_timer = 0
         tower.update(enemies, projectiles)
         
         # Get the projectile
@@ -86,7 +86,7 @@ class TestIntegration(unittest.TestCase):
         enemies = [enemy]
         
         # Make tower shoot
-        tower.shoot_timer = tower.fire_rate
+        tower.fire_timer = 0
         tower.update(enemies, projectiles)
         
         if projectiles:
@@ -238,7 +238,7 @@ class TestIntegration(unittest.TestCase):
         enemies = [enemy]
         
         # Make tower shoot
-        tower.shoot_timer = tower.fire_rate
+        tower.fire_timer = 0
         tower.update(enemies, projectiles)
         
         if projectiles:
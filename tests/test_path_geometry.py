@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems.path_geometry import PathGeometry, get_path_geometry
+from enemies import BasicEnemy, TeleportingEnemy
+
+
+class TestPathGeometry(unittest.TestCase):
+    """Test cases for arc-length path parameterization"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 0), (100, 0), (100, 50), (400, 50)]
+        self.geometry = PathGeometry(self.test_path)
+
+    def test_cumulative_lengths(self):
+        """Test segment lengths are accumulated along the path"""
+        self.assertEqual(self.geometry.cumulative_lengths, [0.0, 100.0, 150.0, 450.0])
+        self.assertEqual(self.geometry.total_length, 450.0)
+
+    def test_position_at(self):
+        """Test distances map to points on the right segment"""
+        self.assertEqual(self.geometry.position_at(0), (0.0, 0.0, 0))
+        self.assertEqual(self.geometry.position_at(60), (60.0, 0.0, 0))
+        self.assertEqual(self.geometry.position_at(125), (100.0, 25.0, 1))
+        self.assertEqual(self.geometry.position_at(450), (400.0, 50.0, 3))
+
+    def test_hint_matches_binary_search(self):
+        """Test the forward cursor gives the same segment as a fresh search"""
+        index = 0
+        for distance in range(0, 451, 7):
+            index = self.geometry.segment_index_at(distance, index)
+            self.assertEqual(index, self.geometry.segment_index_at(distance))
+
+    def test_geometry_is_shared(self):
+        """Test enemies on the same path share one geometry"""
+        first = BasicEnemy(self.test_path)
+        second = BasicEnemy(list(self.test_path))
+
+        self.assertIs(first.path_geometry, second.path_geometry)
+        self.assertIs(get_path_geometry(self.test_path), first.path_geometry)
+
+    def test_enemy_moves_by_arc_length(self):
+        """Test enemies stay on the path and track exact distance traveled"""
+        enemy = BasicEnemy(self.test_path)
+        enemy.speed = 7
+        while not enemy.reached_end:
+            enemy.move_along_path()
+            x, y, _ = self.geometry.position_at(enemy.distance_traveled)
+            self.assertAlmostEqual(enemy.x, x)
+            self.assertAlmostEqual(enemy.y, y)
+
+        self.assertEqual(enemy.distance_traveled, 450.0)
+        self.assertEqual((enemy.x, enemy.y), (400.0, 50.0))
+
+    def test_offset_fades_by_next_waypoint(self):
+        """Test displaced spawns rejoin the path at the next waypoint"""
+        enemy = BasicEnemy(self.test_path)
+        enemy.speed = 5
+        enemy.set_path_progress(50, 0, 10)
+        self.assertEqual((enemy.x, enemy.y), (50.0, 10.0))
+
+        while enemy.distance_traveled < 100:
+            enemy.move_along_path()
+        self.assertEqual((enemy.x, enemy.y), (100.0, 0.0))
+
+    def test_teleport_uses_exact_distance(self):
+        """Test teleporting sets distance traveled to the waypoint's real distance"""
+        path = [(i * 40, 0) for i in range(12)]
+        enemy = TeleportingEnemy(path)
+        enemy.attempt_teleport()
+
+        self.assertEqual(enemy.distance_traveled, enemy.path_geometry.cumulative_lengths[enemy.path_index])
+        self.assertEqual((enemy.x, enemy.y), (float(path[enemy.path_index][0]), 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems import Map
+from game_systems.path_geometry import get_path_geometry
+from game_systems.terrain_types import SAND
+from enemies import BasicEnemy
+
+
+class TestPathTerrain(unittest.TestCase):
+    """Test cases for terrain speed intervals along enemy paths"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.map = Map(1200, 800)
+        rng = random.Random(6)
+        for row in self.map.grid_layout:
+            for grid_x in range(len(row)):
+                if rng.random() < 0.3:
+                    row[grid_x] = SAND
+
+    def test_intervals_match_grid_lookup(self):
+        """Test the multiplier at every path distance matches the cell under that point"""
+        diagonal_path = [(250, 150), (700, 600), (300, 700.5), (1000, 160), (1000, 700)]
+        for path in (self.map.get_path(), diagonal_path):
+            geometry = get_path_geometry(path)
+            path_terrain = self.map.path_terrain(geometry)
+            distances = [i * 0.5 for i in range(int(geometry.total_length * 2) + 1)] + [geometry.total_length]
+            for distance in distances:
+                x, y, path_index = geometry.position_at(distance)
+                self.assertEqual(path_terrain.multiplier_at(distance, path_index),
+                                 self.map.terrain_speed_at(x, y), (path, distance))
+                # A stale hint still finds the right interval
+                self.assertEqual(path_terrain.multiplier_at(distance, 0), path_terrain.multiplier_at(distance))
+            self.assertLess(len(path_terrain.starts), len(distances) // 10)
+
+    def test_enemy_speed_on_and_off_path(self):
+        """Test enemies get terrain speed from path progress, or from their cell while displaced"""
+        enemy = BasicEnemy(self.map.get_path())
+        enemy.set_map_reference(self.map)
+        while not enemy.reached_end:
+            # Speed is set from the terrain under the enemy before it moves
+            x, y = enemy.x, enemy.y
+            enemy.update()
+            self.assertEqual(enemy.speed, enemy.base_speed * self.map.terrain_speed_at(x, y))
+
+        displaced = BasicEnemy(self.map.get_path())
+        displaced.set_map_reference(self.map)
+        displaced.set_path_progress(300, 0, 40)
+        displaced.apply_terrain_speed_effects()
+        self.assertEqual(displaced.speed, displaced.base_speed * self.map.terrain_speed_at(displaced.x, displaced.y))
+
+
+if __name__ == '__main__':
+    unittest.main()
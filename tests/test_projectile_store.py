@@ -0,0 +1,119 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems import SimulationCore
+from game_systems.projectile_store import ProjectileStore
+from game_systems.simulation_context import get_context, set_context
+from projectiles import BasicProjectile, SniperProjectile, FreezeProjectile, WaterProjectile, HomingProjectile
+from enemies import BasicEnemy, TankEnemy
+
+
+@unittest.skipUnless(ProjectileStore().available, "NumPy is not installed")
+class TestProjectileStore(unittest.TestCase):
+    """Test cases for the batched projectile update"""
+
+    def setUp(self):
+        """Remember the simulation context to restore for other tests"""
+        self.previous_context = get_context()
+
+    def tearDown(self):
+        """Restore the simulation context for other tests"""
+        set_context(self.previous_context)
+
+    def make_core(self, batched):
+        """Create a core with a scripted field of enemies and projectiles"""
+        core = SimulationCore(seed=5)
+        core.projectile_store.min_batch_size = 0 if batched else 10 ** 9
+        rng = random.Random(3)
+        path = [(0, 400), (1200, 400)]
+
+        for i in range(60):
+            enemy = (BasicEnemy, TankEnemy)[i % 2](path)
+            enemy.x, enemy.y = rng.uniform(100, 1100), rng.uniform(300, 500)
+            enemy.health = enemy.max_health = 1000
+            core.enemies.append(enemy)
+
+        for i in range(200):
+            start_x, start_y = rng.uniform(0, 1200), rng.uniform(250, 550)
+            target_x, target_y = rng.uniform(0, 1200), rng.uniform(250, 550)
+            kind = i % 5
+            if kind == 0:
+                projectile = BasicProjectile(start_x, start_y, target_x, target_y, 6, 3)
+            elif kind == 1:
+                projectile = SniperProjectile(start_x, start_y, target_x, target_y, 12, 7)
+            elif kind == 2:
+                projectile = FreezeProjectile(start_x, start_y, target_x, target_y, 4, 1, 'freezer', 60)
+            elif kind == 3:
+                projectile = WaterProjectile(start_x, start_y, target_x, target_y, 5, 0, 'splash', 120, 40, 2.0)
+            else:
+                projectile = HomingProjectile(start_x, start_y, target_x, target_y, 5, 2, 'missile')
+            core.projectiles.append(projectile)
+        return core
+
+    def state(self, core):
+        """Collect enemy and projectile state after the projectile phase"""
+        return ([(enemy.health, enemy.frozen, enemy.wet) for enemy in core.enemies],
+                [(type(projectile).__name__, projectile.x, projectile.y) for projectile in core.projectiles])
+
+    def test_batched_hits_match_per_object(self):
+        """Test batched flight and collision give the same results as check_collision"""
+        reference = self.make_core(batched=False)
+        batched = self.make_core(batched=True)
+
+        for _ in range(40):
+            set_context(reference.context)
+            reference.update_projectiles()
+            set_context(batched.context)
+            batched.update_projectiles()
+
+        self.assertEqual(self.state(batched), self.state(reference))
+        self.assertTrue(any(enemy.health < 1000 for enemy in batched.enemies))
+
+    def test_only_straight_kinds_are_batched(self):
+        """Test homing projectiles keep their own update"""
+        core = self.make_core(batched=True)
+        core.projectile_store.advance(core.projectiles, core.enemies, 1)
+
+        for projectile in core.projectiles:
+            self.assertEqual(core.projectile_store.handles(projectile),
+                             not isinstance(projectile, HomingProjectile))
+
+    def test_batched_path_follows_projectile_class(self):
+        """Test the batch uses a projectile class's own resolve_hits, radii and screen bounds"""
+        class Marker(BasicProjectile):
+            __slots__ = ()
+            trigger_radius = 30
+
+            def resolve_hits(self, enemies, hits):
+                self.should_remove = True
+                return {'hit': True, 'damage': len(list(hits)), 'tower_id': 'marker'}
+
+        results = []
+        for batched in (False, True):
+            core = self.make_core(batched)
+            core.projectiles.clear()
+            core.projectiles.append(Marker(600, 100, 600, 120, 5, 1))  # Goes off near its target
+            core.projectiles.append(Marker(1248, 400, 1300, 400, 5, 1))  # Flies off screen
+            core.projectile_store.advance(core.projectiles, core.enemies, 1)
+            self.assertEqual(core.projectile_store.handles(core.projectiles[0]), batched)
+            if batched:
+                outcome = [core.projectile_store.resolve_hits(projectile) for projectile in core.projectiles]
+            else:
+                outcome = []
+                for projectile in core.projectiles:
+                    projectile.update_with_speed(1)
+                    outcome.append(projectile.check_collision(core.enemies))
+            results.append((outcome, [projectile.should_remove for projectile in core.projectiles]))
+
+        self.assertEqual(results[1], results[0])
+        self.assertEqual(results[0][0][0]['tower_id'], 'marker')
+        self.assertTrue(results[0][1][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems import SimulationCore
+from game_systems.terrain_types import GRASS
+from game_systems.simulation_context import get_context, set_context
+
+
+class TestSimulationCore(unittest.TestCase):
+    """Test cases for the headless simulation core"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.previous_context = get_context()
+        self.core = SimulationCore()
+
+    def tearDown(self):
+        """Restore the simulation context (random stream, services) for other tests"""
+        set_context(self.previous_context)
+
+    def find_grass_position(self, core=None):
+        """Find the pixel center of the first grass cell on the map"""
+        game_map = (core or self.core).map
+        for grid_y in range(game_map.grid_height):
+            for grid_x in range(game_map.grid_width):
+                if game_map.get_terrain_at_grid(grid_x, grid_y) == GRASS:
+                    return game_map.grid_to_pixel(grid_x, grid_y)
+        self.fail("Map has no grass cells")
+
+    def test_core_creation(self):
+        """Test core owns gameplay state with config starting values"""
+        self.assertEqual(self.core.money, self.core.game_config.get('starting_money', 20))
+        self.assertEqual(self.core.lives, self.core.game_config.get('starting_lives', 20))
+        self.assertEqual(self.core.enemies, [])
+        self.assertEqual(self.core.towers, [])
+        self.assertEqual(self.core.projectiles, [])
+        self.assertEqual(self.core.tick_count, 0)
+
+    def test_step_runs_requested_ticks(self):
+        """Test step advances the tick counter and spawns enemies"""
+        ticks_run = self.core.step(300)
+
+        self.assertEqual(ticks_run, 300)
+        self.assertEqual(self.core.tick_count, 300)
+        self.assertGreater(self.core.wave_manager.enemies_spawned, 0)
+
+    def test_step_stops_when_game_over(self):
+        """Test step does not advance a finished game"""
+        self.core.game_over = True
+
+        self.assertEqual(self.core.step(10), 0)
+        self.assertEqual(self.core.tick_count, 0)
+
+    def test_leaked_enemies_cost_lives(self):
+        """Test enemies reaching the end remove lives and can end the game"""
+        self.core.lives = 1
+        self.core.step(5000)
+
+        self.assertTrue(self.core.game_over)
+        self.assertLessEqual(self.core.lives, 0)
+
+    def test_place_and_remove_tower(self):
+        """Test headless tower placement and refund"""
+        self.core.money = 1000
+        tower = self.core.place_tower('basic', self.find_grass_position())
+
+        self.assertIsNotNone(tower)
+        self.assertIn(tower, self.core.towers)
+        self.assertIs(tower.upgrade_system_reference, self.core.upgrade_system)
+        money_after_build = self.core.money
+        self.assertLess(money_after_build, 1000)
+
+        refund = self.core.remove_tower(tower)
+        self.assertGreater(refund, 0)
+        self.assertEqual(self.core.money, money_after_build + refund)
+        self.assertNotIn(tower, self.core.towers)
+
+    def snapshot(self, core):
+        """Collect the gameplay-relevant state of a core"""
+        return (
+            core.tick_count, core.money, core.lives, core.wave_manager.wave_number,
+            [(type(enemy).__name__, enemy.x, enemy.y, enemy.health, enemy.immunity_mask)
+             for enemy in core.enemies],
+            [(projectile.x, projectile.y) for projectile in core.projectiles],
+        )
+
+    def run_seeded(self, seed, cosmetics=True):
+        """Run a short scripted game with a fixed seed"""
+        core = SimulationCore(seed=seed, cosmetics=cosmetics)
+        core.money = 1000
+        core.wave_manager.wave_number = 4  # Later waves roll more immunities
+        core.place_tower('basic', self.find_grass_position(core))
+        core.step(600)
+        return core
+
+    def test_seeded_runs_are_identical(self):
+        """Test two runs with the same seed produce identical state"""
+        first = self.run_seeded(1234)
+        second = self.run_seeded(1234)
+
+        self.assertGreater(len(first.enemies), 0)
+        self.assertEqual(self.snapshot(first), self.snapshot(second))
+
+    def test_cosmetics_do_not_change_gameplay(self):
+        """Test a headless run without particles matches a run with them"""
+        rendered = self.run_seeded(4321, cosmetics=True)
+        headless = self.run_seeded(4321, cosmetics=False)
+
+        self.assertEqual(self.snapshot(rendered), self.snapshot(headless))
+
+    def test_reset_replays_seeded_run(self):
+        """Test resetting a seeded core replays the same game"""
+        core = SimulationCore(seed=99)
+        core.step(600)
+        expected = self.snapshot(core)
+
+        core.reset()
+        core.step(600)
+        self.assertEqual(self.snapshot(core), expected)
+
+    def test_reset(self):
+        """Test reset restores a fresh game"""
+        self.core.step(200)
+        self.core.money = 0
+        self.core.reset()
+
+        self.assertEqual(self.core.tick_count, 0)
+        self.assertEqual(self.core.enemies, [])
+        self.assertEqual(self.core.wave_manager.wave_number, 1)
+        self.assertEqual(self.core.money, self.core.game_config.get('starting_money', 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+import unittest
+import sys
+import os
+import random
+import math
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems.spatial_grid import SpatialGrid, beam_hits, sector_hits
+from towers import BasicTower, SniperTower, LightningTower, CannonTower, LaserTower, FlameTower
+from enemies import BasicEnemy, InvisibleEnemy
+
+
+class TestSpatialGrid(unittest.TestCase):
+    """Test cases for the enemy spatial index"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 100), (1200, 100)]
+        rng = random.Random(7)
+        self.enemies = []
+        for _ in range(200):
+            enemy = BasicEnemy(self.test_path)
+            enemy.x = rng.uniform(-50, 1250)
+            enemy.y = rng.uniform(-50, 850)
+            self.enemies.append(enemy)
+
+    def linear_query(self, x, y, radius):
+        """Reference result from a plain scan"""
+        return [(enemy, (enemy.x - x) ** 2 + (enemy.y - y) ** 2) for enemy in self.enemies
+                if (enemy.x - x) ** 2 + (enemy.y - y) ** 2 <= radius * radius]
+
+    def test_query_matches_linear_scan(self):
+        """Test radius queries return exactly the enemies a linear scan finds, in list order"""
+        grid = SpatialGrid(cell_size=64)
+        grid.rebuild(self.enemies)
+
+        for x, y, radius in [(600, 400, 150), (0, 0, 80), (1200, 800, 300), (300, 700, 2000), (500, 500, 0)]:
+            self.assertEqual(grid.query_radius(x, y, radius), self.linear_query(x, y, radius))
+
+    def test_covers_only_indexed_list(self):
+        """Test the grid only answers for the list it was built from"""
+        grid = SpatialGrid()
+        grid.rebuild(self.enemies)
+
+        self.assertTrue(grid.covers(self.enemies))
+        self.assertFalse(grid.covers(list(self.enemies)))
+
+        grid.clear()
+        self.assertFalse(grid.covers(self.enemies))
+
+    def test_tower_uses_index(self):
+        """Test towers get the same range results with and without the index"""
+        tower = BasicTower(600, 400)
+        expected = tower.get_enemies_in_range(self.enemies)
+
+        grid = SpatialGrid()
+        grid.rebuild(self.enemies)
+        tower.set_spatial_index_reference(grid)
+
+        self.assertEqual(tower.get_enemies_in_range(self.enemies), expected)
+
+    def test_optimized_targeting_considers_all_candidates(self):
+        """Test optimized targeting finds the furthest enemy even with many in range"""
+        tower = BasicTower(600, 100)
+        enemies = []
+        for i in range(15):
+            enemy = BasicEnemy(self.test_path)
+            enemy.x, enemy.y = 590 + i, 100
+            enemy.distance_traveled = i
+            enemies.append(enemy)
+
+        grid = SpatialGrid()
+        grid.rebuild(enemies)
+        tower.set_spatial_index_reference(grid)
+        tower.acquire_target_optimized(enemies)
+
+        self.assertIs(tower.target, enemies[-1])
+
+    def test_health_targeting_considers_all_candidates(self):
+        """Test most-health targeting is not cut short after a few candidates"""
+        tower = SniperTower(600, 100)
+        enemies = []
+        for i in range(15):
+            enemy = BasicEnemy(self.test_path)
+            enemy.x, enemy.y = 590 + i, 100
+            enemy.health = 1 + i
+            enemies.append(enemy)
+
+        tower.acquire_target_optimized(enemies)
+
+        self.assertIs(tower.target, enemies[-1])
+
+    def clustered_enemies(self):
+        """200 enemies bunched along a stretch of path, some of them invisible"""
+        rng = random.Random(11)
+        enemies = []
+        for i in range(200):
+            enemy = (InvisibleEnemy if i % 7 == 0 else BasicEnemy)(self.test_path)
+            enemy.x = rng.uniform(500, 700)
+            enemy.y = rng.uniform(80, 120)
+            enemy.detected_by_detector = i % 14 == 0
+            enemies.append(enemy)
+        return enemies
+
+    def test_nearest_matches_linear_scan(self):
+        """Test nearest-enemy queries match a scan, ties and filters included"""
+        grid = SpatialGrid(cell_size=64)
+        self.enemies[5].x, self.enemies[5].y = 610, 400
+        self.enemies[9].x, self.enemies[9].y = 590, 400
+        grid.rebuild(self.enemies)
+
+        def linear_nearest(x, y, predicate=lambda enemy: True):
+            candidates = [(((enemy.x - x) ** 2 + (enemy.y - y) ** 2), index)
+                          for index, enemy in enumerate(self.enemies) if predicate(enemy)]
+            return self.enemies[min(candidates)[1]] if candidates else None
+
+        self.assertIs(grid.nearest(600, 400), self.enemies[5])
+        rng = random.Random(3)
+        points = [(rng.uniform(-400, 1600), rng.uniform(-400, 1200)) for _ in range(100)]
+        for x, y in points:
+            self.assertIs(grid.nearest(x, y), linear_nearest(x, y))
+        even = set(map(id, self.enemies[::2]))
+        for x, y in points[:20]:
+            self.assertIs(grid.nearest(x, y, lambda enemy: id(enemy) in even),
+                          linear_nearest(x, y, lambda enemy: id(enemy) in even))
+        self.assertIsNone(grid.nearest(600, 400, lambda enemy: False))
+
+        grid.clear()
+        self.assertIsNone(grid.nearest(600, 400))
+
+    def test_neighbor_counts_cached_per_tick(self):
+        """Test neighbour counts match a scan and are shared until the grid is rebuilt"""
+        enemies = self.clustered_enemies()
+        grid = SpatialGrid()
+        grid.rebuild(enemies)
+        tower = CannonTower(600, 100)
+        expected = [tower.count_neighbors(enemy, enemies, 40) for enemy in enemies]
+
+        tower.set_spatial_index_reference(grid)
+        self.assertEqual([tower.count_neighbors(enemy, enemies, 40) for enemy in enemies], expected)
+        self.assertEqual(len(grid.neighbor_counts[(40, False, False)]), len(enemies))
+
+        grid.rebuild(enemies)
+        self.assertEqual(grid.neighbor_counts, {})
+
+    def test_chain_and_splash_targets_match_scan(self):
+        """Test Lightning and Cannon towers pick the same targets and chain with and without the index"""
+        enemies = self.clustered_enemies()
+        grid = SpatialGrid()
+        grid.rebuild(enemies)
+        for tower in (LightningTower(600, 100), CannonTower(600, 100)):
+            with self.subTest(tower=tower.tower_type):
+                tower.acquire_target_optimized(enemies)
+                expected_target = tower.target
+                tower.set_spatial_index_reference(grid)
+                tower.acquire_target_optimized(enemies)
+                self.assertIs(tower.target, expected_target)
+
+        lightning = LightningTower(600, 100)
+        lightning.chain_count = 6
+        for start in enemies[:20]:
+            expected = lightning.build_chain_sequence(enemies, start)
+            lightning.set_spatial_index_reference(grid)
+            self.assertEqual(lightning.build_chain_sequence(enemies, start), expected)
+            lightning.set_spatial_index_reference(None)
+
+    def test_beam_query_matches_scan(self):
+        """Test beam queries find the enemies a per-enemy cross/dot test finds, nearest first"""
+        grid = SpatialGrid()
+        grid.rebuild(self.enemies)
+        for x, y, angle, length, half_width in [(600, 400, 0.3, 300, 4), (100, 700, -1.2, 900, 40),
+                                                (1200, 0, 2.5, 500, 12)]:
+            direction_x, direction_y = math.cos(angle), math.sin(angle)
+            expected = []
+            for enemy in self.enemies:
+                dx, dy = enemy.x - x, enemy.y - y
+                distance = math.sqrt(dx * dx + dy * dy)
+                if distance <= length and abs(dx * direction_y - dy * direction_x) <= half_width \
+                        and dx * direction_x + dy * direction_y > 0:
+                    expected.append((enemy, distance))
+            expected.sort(key=lambda hit: hit[1])
+            self.assertEqual(grid.query_beam(x, y, direction_x, direction_y, length, half_width), expected)
+            self.assertEqual(beam_hits(enumerate(self.enemies), x, y, direction_x, direction_y, length,
+                                       half_width), expected)
+
+    def test_sector_query_matches_angle_test(self):
+        """Test cone queries find the enemies an atan2 angle test finds, in list order"""
+        grid = SpatialGrid()
+        grid.rebuild(self.enemies)
+        for x, y, angle, half_angle, radius in [(600, 400, 0.0, 0.4, 250), (600, 400, 3.0, 0.4, 250),
+                                                (300, 300, -2.0, 1.9, 400), (900, 500, 1.0, math.pi, 200)]:
+            expected = []
+            for enemy in self.enemies:
+                distance = math.sqrt((enemy.x - x) ** 2 + (enemy.y - y) ** 2)
+                angle_diff = abs(math.atan2(enemy.y - y, enemy.x - x) - angle)
+                if angle_diff > math.pi:
+                    angle_diff = 2 * math.pi - angle_diff
+                if distance <= radius and angle_diff <= half_angle:
+                    expected.append(enemy)
+            self.assertEqual(grid.query_sector(x, y, angle, half_angle, radius), expected)
+            self.assertEqual(sector_hits(enumerate(self.enemies), x, y, angle, half_angle, radius), expected)
+
+    def test_area_towers_hit_same_enemies(self):
+        """Test laser and flame towers damage the same enemies with and without the index"""
+        results = []
+        for indexed in (False, True):
+            enemies = self.clustered_enemies()
+            for enemy in enemies:
+                enemy.health = enemy.max_health = 1000
+            grid = SpatialGrid()
+            grid.rebuild(enemies)
+            laser, flame = LaserTower(450, 100), FlameTower(640, 130)
+            flame.target, flame.angle = enemies[0], -2.0
+            laser.laser_target = max(enemies, key=lambda enemy: enemy.x)
+            if indexed:
+                laser.set_spatial_index_reference(grid)
+                flame.set_spatial_index_reference(grid)
+            laser.fire_laser(enemies)
+            flame.spray_flames(enemies)
+            results.append(([enemy.health for enemy in enemies], laser.laser_end_point))
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(any(health < 1000 for health in results[0][0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import unittest
+import sys
+import os
+import pygame
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemies import BasicEnemy, RegeneratingEnemy
+from enemies.immunities import FREEZE, WET, BURN, POISON
+from game_systems.damage_table import get_damage_table
+from game_systems.events import EventBus, DAMAGE, credit_damage
+from game_systems.simulation_context import SimulationContext, get_context, set_context
+from game_systems.status_effects import StatusEffects, COUNTER_EFFECT_DURATION
+from towers import FlameTower
+
+
+class TestStatusEffects(unittest.TestCase):
+    """Test cases for the central status-effect engine"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 100), (200, 100), (200, 300)]
+        self.status_effects = StatusEffects()
+        self.previous_context = get_context()
+        self.context = SimulationContext(status_effects=self.status_effects)
+        set_context(self.context)
+        self.enemy = BasicEnemy(self.test_path)
+        self.enemy.health = self.enemy.max_health = 100000
+        self.enemy.immunity_mask = 0  # No random burn immunity
+
+    def tearDown(self):
+        set_context(self.previous_context)
+
+    def burn_hit(self, damage: int) -> int:
+        """Health lost to one burn hit of the given damage"""
+        return int(damage * get_damage_table().multiplier('flame', BasicEnemy))
+
+    def run_ticks(self, ticks: int, speed_multiplier: float = 1):
+        for _ in range(ticks):
+            self.status_effects.update(speed_multiplier)
+
+    def test_burn_hits_once_per_period(self):
+        """Test a 180 tick burn hits every 20 ticks, 9 times in total"""
+        self.status_effects.apply(self.enemy, BURN, 180, 5)
+        self.run_ticks(200)
+        self.assertEqual(self.enemy.max_health - self.enemy.health, 9 * self.burn_hit(5))
+        self.assertFalse(self.status_effects.is_active(self.enemy, BURN))
+
+    def test_total_damage_independent_of_game_speed(self):
+        """Test faster game speeds deal the same total burn damage"""
+        for speed_multiplier, ticks in ((2, 100), (1.5, 140)):
+            with self.subTest(speed_multiplier=speed_multiplier):
+                enemy = BasicEnemy(self.test_path)
+                enemy.health = enemy.max_health = 100000
+                enemy.immunity_mask = 0
+                self.status_effects.apply(enemy, BURN, 180, 5)
+                self.run_ticks(ticks, speed_multiplier)
+                self.assertEqual(enemy.max_health - enemy.health, 9 * self.burn_hit(5))
+
+    def test_several_towers_burn_once(self):
+        """Test overlapping flame towers refresh one burn instead of stacking"""
+        towers = [FlameTower(0, 0), FlameTower(10, 0), FlameTower(20, 0)]
+        for tower in towers:
+            self.status_effects.apply(self.enemy, BURN, tower.burn_duration, tower.burn_damage, source=tower)
+        self.assertEqual(len(self.status_effects.dots), 1)
+
+        events = EventBus()
+        events.subscribe(DAMAGE, credit_damage)
+        self.context.events = events
+        self.run_ticks(20)
+        events.dispatch()
+        self.assertEqual(self.enemy.max_health - self.enemy.health, self.burn_hit(towers[-1].burn_damage))
+        self.assertEqual(towers[-1].total_damage_dealt, self.burn_hit(towers[-1].burn_damage))
+        self.assertEqual(towers[0].total_damage_dealt, 0)
+
+    def test_reapplying_keeps_cadence(self):
+        """Test refreshing a burn does not reset the time to the next hit"""
+        self.status_effects.apply(self.enemy, BURN, 180, 5)
+        self.run_ticks(15)
+        self.status_effects.apply(self.enemy, BURN, 180, 5)
+        self.run_ticks(5)
+        self.assertEqual(self.enemy.max_health - self.enemy.health, self.burn_hit(5))
+        self.assertEqual(self.status_effects.remaining(self.enemy, BURN), 175)
+
+    def test_immunity_blocks_effects(self):
+        """Test immune enemies reject poison and wet but freeze resistance still freezes"""
+        self.enemy.immunity_mask |= POISON | WET | FREEZE
+        self.assertFalse(self.status_effects.apply(self.enemy, POISON, 300, 5))
+        self.assertFalse(self.status_effects.apply(self.enemy, WET, 300, 1.5))
+        self.assertFalse(self.status_effects.is_active(self.enemy, POISON))
+        self.assertFalse(self.enemy.wet)
+
+        self.assertTrue(self.status_effects.apply(self.enemy, FREEZE, 60))
+        self.assertTrue(self.enemy.frozen)
+
+    def test_dead_enemies_are_dropped(self):
+        """Test effects on dead enemies are removed without dealing damage"""
+        self.status_effects.apply(self.enemy, POISON, 300, 5)
+        self.enemy.health = 0
+        self.run_ticks(60)
+        self.assertEqual(self.status_effects.dots, {})
+        self.assertEqual(self.enemy.health, 0)
+
+    def test_expired_burn_restarts_cadence(self):
+        """Test a burn applied after the last one wore off waits a full period"""
+        self.status_effects.apply(self.enemy, BURN, 10, 5)
+        self.run_ticks(15)
+        self.assertFalse(self.status_effects.is_active(self.enemy, BURN))
+        self.status_effects.apply(self.enemy, BURN, 180, 5)
+        self.run_ticks(19)
+        self.assertEqual(self.enemy.health, self.enemy.max_health)
+        self.run_ticks(1)
+        self.assertEqual(self.enemy.max_health - self.enemy.health, self.burn_hit(5))
+
+    def test_periodic_tasks_stop(self):
+        """Test every() runs on its period until the callback or the enemy stops it"""
+        calls = []
+        self.status_effects.every(self.enemy, 30, lambda enemy: calls.append(self.status_effects.now))
+        self.status_effects.every(self.enemy, 25, lambda enemy: len(calls) < 2)
+        self.run_ticks(95, 1.5)
+        self.assertEqual(calls, [30.0, 60.0, 90.0, 120.0])
+        self.enemy.reached_end = True
+        self.run_ticks(40)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(len(self.status_effects.wheel), 0)
+
+    def test_regeneration_runs_on_the_wheel(self):
+        """Test regenerating enemies heal once per second after 3 seconds without damage"""
+        enemy = RegeneratingEnemy(self.test_path)
+        health = enemy.health
+        self.run_ticks(180)
+        self.assertEqual(enemy.health, health)
+        self.run_ticks(60)
+        self.assertEqual(enemy.health, health + enemy.regen_rate)
+
+        enemy.take_damage(1)
+        health = enemy.health
+        self.run_ticks(180)
+        self.assertEqual(enemy.health, health)
+
+    def test_poisoned_enemies_are_tinted(self):
+        """Test poisoned enemies are drawn with the green poison tint"""
+        screen = pygame.Surface((400, 400))
+        center = (int(self.enemy.x), int(self.enemy.y))
+        self.enemy.draw(screen)
+        self.assertEqual(tuple(screen.get_at(center))[:3], self.enemy.color)
+        self.status_effects.apply(self.enemy, POISON, 60, 1)
+        self.enemy.draw(screen)
+        red, green, blue = self.enemy.color
+        self.assertEqual(tuple(screen.get_at(center))[:3], (int(red * 0.7), int(green * 0.7) + 40, int(blue * 0.7)))
+
+    def test_counter_effects_expire(self):
+        """Test counter-effectiveness popups disappear after their duration"""
+        self.status_effects.show_counter_effect(self.enemy, 'super_effective')
+        self.assertEqual(len(self.status_effects.counter_effects_of(self.enemy)), 1)
+        self.run_ticks(COUNTER_EFFECT_DURATION)
+        self.assertEqual(self.status_effects.counter_effects_of(self.enemy), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems.targeting_matrix import TargetingMatrix
+from towers import (BasicTower, PoisonTower, MissileTower, SniperTower, AntiAirTower, LaserTower,
+                    LightningTower, SplashTower)
+from towers.tower import Tower
+from enemies import BasicEnemy, FlyingEnemy, InvisibleEnemy
+
+
+@unittest.skipUnless(TargetingMatrix().available, "NumPy is not installed")
+class TestTargetingMatrix(unittest.TestCase):
+    """Test cases for batch tower targeting"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 100), (1200, 100)]
+        rng = random.Random(11)
+        self.enemies = []
+        for i in range(150):
+            kind = rng.random()
+            enemy_class = FlyingEnemy if kind < 0.3 else InvisibleEnemy if kind < 0.6 else BasicEnemy
+            enemy = enemy_class(self.test_path)
+            enemy.x = rng.uniform(0, 1200)
+            enemy.y = rng.uniform(0, 800)
+            enemy.distance_traveled = rng.choice([rng.uniform(0, 1200), 500.0])
+            enemy.detected_by_detector = rng.random() < 0.5
+            self.enemies.append(enemy)
+
+        self.towers = []
+        for tower_class in (BasicTower, PoisonTower, MissileTower, SniperTower, Tower):
+            for _ in range(6):
+                self.towers.append(tower_class(rng.uniform(0, 1200), rng.uniform(0, 800)))
+
+    def test_range_query_matches_linear_scan(self):
+        """Test matrix range queries return exactly what a linear scan finds"""
+        expected = [tower.get_enemies_in_range(self.enemies) for tower in self.towers]
+
+        matrix = TargetingMatrix()
+        matrix.rebuild(self.towers, self.enemies)
+        for tower in self.towers:
+            tower.set_targeting_matrix_reference(matrix)
+
+        self.assertEqual([tower.get_enemies_in_range(self.enemies) for tower in self.towers], expected)
+        # Other radii are not in the matrix and fall back to a scan
+        self.assertIsNone(matrix.query_range(self.towers[0], 500))
+
+    def test_default_target_matches_per_tower_loop(self):
+        """Test masked argmax picks the same furthest eligible target as the Python loop"""
+        expected = []
+        for tower in self.towers:
+            tower.acquire_target_optimized(self.enemies)
+            expected.append(tower.target)
+
+        matrix = TargetingMatrix()
+        matrix.rebuild(self.towers, self.enemies)
+        for tower in self.towers:
+            tower.set_targeting_matrix_reference(matrix)
+            tower.target = None
+            self.assertTrue(matrix.covers(tower, self.enemies))
+            tower.acquire_target_optimized(self.enemies)
+
+        self.assertEqual([tower.target for tower in self.towers], expected)
+        self.assertTrue(any(target is not None for target in expected))
+
+    def test_restrictions_become_columns(self):
+        """Test flying and undetected invisible enemies are excluded per tower"""
+        tower = BasicTower(600, 100)
+        flyer = FlyingEnemy(self.test_path)
+        flyer.x, flyer.y, flyer.distance_traveled = 610, 100, 30
+        ghost = InvisibleEnemy(self.test_path)
+        ghost.x, ghost.y, ghost.distance_traveled = 605, 100, 20
+        walker = BasicEnemy(self.test_path)
+        walker.x, walker.y, walker.distance_traveled = 600, 100, 10
+        enemies = [flyer, ghost, walker]
+
+        matrix = TargetingMatrix()
+        matrix.rebuild([tower], enemies)
+        self.assertIs(matrix.furthest_target(tower), walker)
+
+        ghost.detected_by_detector = True
+        matrix.rebuild([tower], enemies)
+        self.assertIs(matrix.furthest_target(tower), ghost)
+
+    def test_eligibility_matches_can_target_enemy(self):
+        """Test the matrix and can_target_enemy agree for every tower's targeting flags"""
+        towers = [tower_class(600, 400) for tower_class in
+                  (Tower, BasicTower, AntiAirTower, LaserTower, LightningTower, SplashTower, MissileTower)]
+        for tower in towers:
+            tower.range = 2000
+        matrix = TargetingMatrix()
+        matrix.rebuild(towers, self.enemies)
+        for tower in towers:
+            row = matrix.targetable[matrix.rows[id(tower)]]
+            self.assertEqual(list(row), [tower.can_target_enemy(enemy) for enemy in self.enemies])
+
+    def test_stale_matrix_is_not_used(self):
+        """Test a cleared matrix or a different enemy list falls back to scanning"""
+        matrix = TargetingMatrix()
+        matrix.rebuild(self.towers, self.enemies)
+        self.assertFalse(matrix.covers(self.towers[0], list(self.enemies)))
+
+        matrix.clear()
+        self.assertFalse(matrix.covers(self.towers[0], self.enemies))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems.timing_wheel import TimingWheel
+
+
+class TestTimingWheel(unittest.TestCase):
+    """Test cases for the tick-bucketed timing wheel"""
+
+    def run_wheel(self, wheel: TimingWheel, ticks: int, speed_multiplier: float):
+        """Advance a wheel and return (fire time, item) for everything that fell due"""
+        fired = []
+        for _ in range(ticks):
+            fired.extend((wheel.now, item) for _, item in wheel.advance(speed_multiplier))
+        return fired
+
+    def test_items_fire_once_when_due(self):
+        """Test each item fires exactly once, on the first advance past its due time"""
+        for speed_multiplier in (1, 1.5, 2, 7, 0.25):
+            with self.subTest(speed_multiplier=speed_multiplier):
+                wheel = TimingWheel(slots=8)
+                due_times = [0.5, 3, 3.25, 7.9, 8, 20, 64.5]
+                for due in due_times:
+                    wheel.schedule(due, due)
+
+                fired = self.run_wheel(wheel, int(80 / speed_multiplier), speed_multiplier)
+                self.assertEqual([item for _, item in fired], due_times)
+                for fire_time, due in fired:
+                    self.assertGreaterEqual(fire_time, due)
+                    self.assertLess(fire_time - due, speed_multiplier)
+                self.assertEqual(len(wheel), 0)
+
+    def test_past_due_items_fire_on_next_advance(self):
+        """Test items scheduled for a tick already passed are not lost"""
+        wheel = TimingWheel()
+        wheel.advance(10.5)
+        wheel.schedule(3, 'late')
+        wheel.schedule(10.25, 'this tick')
+        self.assertEqual([item for _, item in wheel.advance(0.5)], ['late', 'this tick'])
+
+    def test_large_advance_spanning_several_turns(self):
+        """Test a jump longer than the wheel still returns every due item"""
+        wheel = TimingWheel(slots=4)
+        for due in range(1, 20):
+            wheel.schedule(due, due)
+        self.assertEqual([item for _, item in wheel.advance(12)], list(range(1, 13)))
+        self.assertEqual(len(wheel), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
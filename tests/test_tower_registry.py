@@ -0,0 +1,118 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_systems import SimulationCore
+from game_systems.tower_registry import TowerRegistry
+from game_systems.terrain_types import GRASS
+from projectiles import BasicProjectile
+from towers import BasicTower
+
+
+class TestTowerRegistry(unittest.TestCase):
+    """Test cases for integer tower IDs"""
+
+    def test_compact_ids_and_lookup(self):
+        """Test towers get consecutive IDs and are found directly"""
+        registry = TowerRegistry()
+        towers = [BasicTower(i * 50, 0) for i in range(3)]
+        for tower in towers:
+            registry.register(tower)
+
+        self.assertEqual([tower.tower_id for tower in towers], [0, 1, 2])
+        self.assertIs(registry.get(1), towers[1])
+        self.assertIsNone(registry.get(3))
+        self.assertIsNone(registry.get('1'))
+        self.assertEqual(len(registry), 3)
+
+    def test_ids_are_reused_smallest_first(self):
+        """Test released IDs are handed out again, lowest first"""
+        registry = TowerRegistry()
+        towers = [BasicTower(i * 50, 0) for i in range(4)]
+        for tower in towers:
+            registry.register(tower)
+
+        registry.unregister(towers[2])
+        registry.unregister(towers[0])
+        self.assertIsNone(registry.get(2))
+        registry.release()
+
+        first, second, third = BasicTower(0, 50), BasicTower(50, 50), BasicTower(100, 50)
+        self.assertEqual(registry.register(first), 0)
+        self.assertEqual(registry.register(second), 2)
+        self.assertEqual(registry.register(third), 4)
+
+    def test_retired_ids_wait_until_unused(self):
+        """Test a removed tower's ID is not reused while something still carries it"""
+        registry = TowerRegistry()
+        towers = [BasicTower(i * 50, 0) for i in range(2)]
+        for tower in towers:
+            registry.register(tower)
+
+        registry.unregister(towers[0])
+        registry.release([0])
+        self.assertEqual(registry.register(BasicTower(0, 50)), 2)
+        self.assertEqual(len(registry), 2)
+        registry.release([])
+        self.assertEqual(registry.register(BasicTower(50, 50)), 0)
+
+    def test_unplaced_towers_have_unique_ids(self):
+        """Test towers built outside a game still have distinct IDs"""
+        ids = {BasicTower(0, 0).tower_id for _ in range(10)}
+        self.assertEqual(len(ids), 10)
+
+    def test_core_attribution(self):
+        """Test the core credits hits through the registry and resets currency on ID reuse"""
+        core = SimulationCore()
+        game_map = core.map
+        grass = [game_map.grid_to_pixel(x, y) for y in range(game_map.grid_height)
+                 for x in range(game_map.grid_width) if game_map.get_terrain_at_grid(x, y) == GRASS]
+
+        tower = core.place_tower('basic', grass[0])
+        self.assertEqual(tower.tower_id, 0)
+        self.assertIs(core.find_tower_by_id(0), tower)
+
+        core._credit_projectile_hit({'hit': True, 'damage': 100, 'tower_id': 0})
+        core.events.dispatch()
+        self.assertGreater(core.upgrade_system.get_tower_currency(0), 0)
+
+        core.remove_tower(tower)
+        self.assertIsNone(core.find_tower_by_id(0))
+        replacement = next(t for t in (core.place_tower('basic', position) for position in grass[1:]) if t)
+        self.assertEqual(replacement.tower_id, 0)
+        self.assertEqual(core.upgrade_system.get_tower_currency(0), 0)
+
+    def test_sold_tower_projectile_credits_nobody(self):
+        """Test a projectile still in flight from a sold tower does not credit the tower placed after it"""
+        core = SimulationCore()
+        game_map = core.map
+        grass = [game_map.grid_to_pixel(x, y) for y in range(game_map.grid_height)
+                 for x in range(game_map.grid_width) if game_map.get_terrain_at_grid(x, y) == GRASS]
+
+        tower = core.place_tower('basic', grass[0])
+        projectile = BasicProjectile(tower.x, tower.y, tower.x + 500, tower.y, 5, 500, tower.tower_type)
+        projectile.source_tower_id = tower.tower_id
+        core.projectiles.append(projectile)
+
+        core.remove_tower(tower)
+        cannon = next(t for t in (core.place_tower('cannon', position) for position in grass[1:]) if t)
+        self.assertNotEqual(cannon.tower_id, 0)
+
+        core._credit_projectile_hit({'hit': True, 'damage': 500, 'tower_id': 0})
+        core.events.dispatch()
+        self.assertEqual(cannon.total_damage_dealt, 0)
+        self.assertEqual(core.upgrade_system.get_tower_currency(cannon.tower_id), 0)
+
+        # Once the projectile is gone the ID is free again
+        core.projectiles.mark_removed(projectile)
+        core.projectiles.compact()
+        core.update_projectiles()
+        replacement = next(t for t in (core.place_tower('basic', position) for position in grass[2:]) if t)
+        self.assertEqual(replacement.tower_id, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
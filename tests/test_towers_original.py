@@ -195,7 +195,7 @@ class TestTowers(unittest.TestCase):
         projectiles = []
         
         # Force tower to be ready to shoot
-        tower.shoot_timer = tower.fire_rate
+        tower.fire_timer = 0
         
         tower.update([self.basic_enemy], projectiles)
         
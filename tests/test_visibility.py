@@ -0,0 +1,118 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemies import BasicEnemy, InvisibleEnemy
+from game_systems.simulation_core import SimulationCore
+from game_systems.visibility import Visibility
+from towers import DetectorTower
+
+
+class TestVisibility(unittest.TestCase):
+    """Test cases for incremental detection of invisible enemies"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.test_path = [(0, 400), (1200, 400)]
+        self.rng = random.Random(11)
+        self.enemies = []
+        for i in range(120):
+            enemy = (InvisibleEnemy if i % 4 == 0 else BasicEnemy)(self.test_path)
+            enemy.x, enemy.y = self.rng.uniform(0, 1200), self.rng.uniform(0, 800)
+            self.enemies.append(enemy)
+        self.detectors = [DetectorTower(300, 300), DetectorTower(800, 500), DetectorTower(600, 200)]
+
+    def scan(self, detector):
+        """Reference picks from a plain scan of the list"""
+        in_range = [((enemy.x - detector.x) ** 2 + (enemy.y - detector.y) ** 2, enemy) for enemy in self.enemies
+                    if getattr(enemy, 'invisible', False) and
+                    (enemy.x - detector.x) ** 2 + (enemy.y - detector.y) ** 2 <= detector.detection_range ** 2]
+        in_range.sort(key=lambda pick: pick[0])
+        return [enemy for _, enemy in in_range[:detector.max_detections]]
+
+    def test_incremental_matches_scan(self):
+        """Test tracked detection matches a full scan while enemies move, leave and detectors upgrade"""
+        visibility = Visibility(tracking=True)
+        visibility.track([(enemy, None) for enemy in self.enemies])
+        for tick in range(60):
+            for enemy in self.enemies:
+                enemy.x += self.rng.uniform(-8, 12)
+                enemy.y += self.rng.uniform(-8, 8)
+            if tick == 20:
+                gone = self.enemies[::8]
+                self.enemies = [enemy for enemy in self.enemies if enemy not in gone]
+                visibility.untrack(gone)
+            if tick == 40:
+                self.detectors[1].detection_range = 380
+
+            visibility.update(self.detectors, self.enemies)
+            expected = set()
+            for detector in self.detectors:
+                picks = visibility.detect(detector, self.enemies)
+                self.assertEqual(picks, self.scan(detector))
+                expected.update(map(id, picks))
+            visibility.publish()
+
+            for enemy in self.enemies:
+                detected = id(enemy) in expected
+                self.assertEqual(enemy.detected_by_detector, detected)
+                self.assertEqual(visibility.is_detected(enemy), detected)
+
+    def test_visible_enemies_not_tracked(self):
+        """Test only invisible enemies get a bit in the detected mask"""
+        visibility = Visibility(tracking=True)
+        visibility.track([(enemy, None) for enemy in self.enemies])
+        self.assertEqual(len(visibility.invisible), len(self.enemies[::4]))
+        self.assertEqual(sorted(visibility.bits.values()), list(range(len(self.enemies[::4]))))
+
+    def test_core_detects_spawned_invisible_enemy(self):
+        """Test a SimulationCore reveals an invisible enemy that entered play through a spawn event"""
+        core = SimulationCore(seed=2)
+        detector = DetectorTower(500, 400)
+        core.tower_registry.register(detector)
+        core.towers.append(detector)
+        ghost = InvisibleEnemy(self.test_path)
+        ghost.x, ghost.y = 520, 400
+        core.enemies.append(ghost)
+        core.events.spawn(ghost)
+        core.events.dispatch()
+
+        core.update_towers()
+        self.assertTrue(ghost.detected_by_detector)
+        self.assertEqual(detector.detected_enemies, {ghost})
+
+        ghost.x = 1100
+        core.update_towers()
+        self.assertFalse(ghost.detected_by_detector)
+
+    def test_core_detects_enemy_spawned_this_tick(self):
+        """Test an invisible enemy split off during the enemy phase is detected in the same tick"""
+        ghost = InvisibleEnemy(self.test_path)
+        ghost.x, ghost.y = 520, 400
+
+        class SplitsIntoGhost(BasicEnemy):
+            __slots__ = ()
+
+            def on_death(self):
+                return [ghost]
+
+        core = SimulationCore(seed=2)
+        detector = DetectorTower(500, 400)
+        core.tower_registry.register(detector)
+        core.towers.append(detector)
+        splitter = SplitsIntoGhost(self.test_path)
+        splitter.health = 0
+        core.enemies.append(splitter)
+
+        core.update_enemies()
+        core.update_towers()
+        self.assertTrue(ghost.detected_by_detector)
+        self.assertEqual(detector.detected_enemies, {ghost})
+
+
+if __name__ == '__main__':
+    unittest.main()
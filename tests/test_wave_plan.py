@@ -0,0 +1,121 @@
+import unittest
+import sys
+import os
+import random
+
+# Add parent directory to path to import game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemies import BasicEnemy, FastEnemy, TankEnemy, MegaBoss
+from game_systems.wave_manager import WaveManager
+from game_systems.wave_plan import WavePlan, range_value
+
+WAVE_CONFIG = {
+    'spawn_config': {'base_enemy_count': 10, 'base_spawn_delay': 120, 'min_spawn_delay': 20,
+                     'boss_enemy_count': 1},
+    'round_progression': {
+        'enemy_increase_per_round': {'wave_ranges': {(1, 5): 2, (6, 12): 3}, 'default': 4},
+        'spawn_delay_reduction_per_round': {'wave_ranges': {(1, 8): 5, 9: 10}, 'default': 2},
+        'special_rounds': {6: {'enemy_multiplier': 1.5, 'spawn_delay_multiplier': 0.8}},
+    },
+    'wave_compositions': {
+        (1, 4): [['BasicEnemy', 0.5], ['FastEnemy', 0.3], ['TankEnemy', 0.2]],
+        (5, 14): [['TankEnemy', 0.4], ['FastEnemy', 0.4]],
+    },
+    'boss_waves': {15: 'MegaBoss'},
+}
+ENEMY_CLASSES = {'BasicEnemy': BasicEnemy, 'FastEnemy': FastEnemy, 'TankEnemy': TankEnemy, 'MegaBoss': MegaBoss}
+
+
+def reference_wave(config, wave_number):
+    """(count, delay) as the per-wave loops computed them"""
+    spawn = config['spawn_config']
+    progression = config['round_progression']
+    reduction = sum(range_value(progression['spawn_delay_reduction_per_round'], wave)
+                    for wave in range(2, wave_number + 1))
+    delay = spawn['base_spawn_delay'] - reduction
+    count = spawn['base_enemy_count'] + sum(range_value(progression['enemy_increase_per_round'], wave)
+                                            for wave in range(2, wave_number + 1))
+    if wave_number in progression['special_rounds']:
+        delay = int(delay * progression['special_rounds'][wave_number]['spawn_delay_multiplier'])
+        count = int(count * progression['special_rounds'][wave_number]['enemy_multiplier'])
+    if wave_number in config['boss_waves']:
+        count = spawn['boss_enemy_count']
+    return count, max(spawn['min_spawn_delay'], delay)
+
+
+def reference_pick(composition, rand):
+    """Enemy name picked by the linear weighted scan"""
+    cumulative_weight = 0
+    for name, weight in composition:
+        cumulative_weight += weight
+        if rand <= cumulative_weight:
+            return name
+    return None
+
+
+class TestWavePlan(unittest.TestCase):
+    """Test cases for the compiled wave plan"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.plan = WavePlan(WAVE_CONFIG, ENEMY_CLASSES)
+
+    def test_counts_and_delays_match_per_wave_loops(self):
+        """Test prefix sums give the same counts and delays, in any order of asking"""
+        for wave_number in (20, 1, 6, 9, 15, 3, 30):
+            with self.subTest(wave_number=wave_number):
+                spec = self.plan.wave(wave_number)
+                self.assertEqual((spec.enemy_count, spec.spawn_delay), reference_wave(WAVE_CONFIG, wave_number))
+        self.assertEqual(self.plan.max_wave, 15)
+
+    def test_picks_match_linear_scan(self):
+        """Test bisect over cumulative weights picks like the linear scan, including misses"""
+        rng = random.Random(3)
+        for wave_number in (2, 7):
+            spec = self.plan.wave(wave_number)
+            composition = next(types for (first, last), types in WAVE_CONFIG['wave_compositions'].items()
+                               if first <= wave_number <= last)
+            for _ in range(500):
+                state = rng.getstate()
+                picked = WavePlan.pick_enemy_type(spec, rng)
+                rng.setstate(state)
+                expected = reference_pick(composition, rng.random())
+                self.assertEqual(picked.__name__ if picked else None, expected)
+
+        self.assertIs(WavePlan.pick_enemy_type(self.plan.wave(15), rng), MegaBoss)
+        self.assertIsNone(WavePlan.pick_enemy_type(self.plan.wave(20), rng))
+
+
+class TestSpawnTimeline(unittest.TestCase):
+    """Test cases for exact spawn timing"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.manager = WaveManager([(0, 100), (200, 100), (200, 300)])
+        self.manager.enemies_per_wave = 1000
+        self.manager.spawn_delay = 10
+
+    def test_overshoot_is_kept_at_any_speed(self):
+        """Test 600 ticks of game time spawn 60 enemies whatever the game speed"""
+        for speed_multiplier, ticks in ((1, 600), (1.5, 400), (2, 300), (3, 200)):
+            with self.subTest(speed_multiplier=speed_multiplier):
+                self.setUp()
+                spawned = sum(len(self.manager.spawn_enemies(speed_multiplier)) for _ in range(ticks))
+                self.assertEqual(spawned, 60)
+
+    def test_several_spawns_in_one_tick(self):
+        """Test a tick longer than the spawn delay spawns more than one enemy"""
+        self.manager.spawn_delay = 2
+        self.assertEqual(len(self.manager.spawn_enemies(5)), 2)
+        self.assertEqual(len(self.manager.spawn_enemies(1)), 1)
+
+    def test_spawns_stop_at_wave_size(self):
+        """Test the timeline never spawns past the wave's enemy count"""
+        self.manager.enemies_per_wave = 3
+        self.assertEqual(len(self.manager.spawn_enemies(100)), 3)
+        self.assertEqual(self.manager.spawn_enemies(100), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ import math
 
 class AntiAirTower(Tower):
     """Tower specialized for targeting flying enemies"""
+    __slots__ = ('prioritize_flying',)
     
     def __init__(self, x, y):
         super().__init__(x, y, 'antiair')
@@ -22,14 +23,6 @@ class AntiAirTower(Tower):
         # Finalize initialization to update base stats
         self.finalize_initialization()
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-        return True
-    
     def acquire_target(self, enemies):
         """Find target, prioritizing flying enemies"""
         flying_targets = []
@@ -134,16 +127,11 @@ class AntiAirTower(Tower):
             self.target = None
             return
         
-        range_squared = self.range * self.range
         flying_targets = []
         ground_targets = []
         
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
+        for enemy, distance_squared in self.get_enemies_in_range(enemies):
+            if self.can_target_enemy(enemy):
                 actual_distance = math.sqrt(distance_squared)
                 if hasattr(enemy, 'flying') and enemy.flying:
                     flying_targets.append((enemy, actual_distance))
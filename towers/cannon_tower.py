@@ -1,9 +1,11 @@
 from .tower import Tower
 import pygame
 import math
+from game_systems.area_effects import get_area_effects, DamageProfile
 
 class CannonTower(Tower):
     """Heavy cannon tower with splash damage and long range"""
+    __slots__ = ('splash_radius', 'splash_damage')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'cannon')
@@ -25,19 +27,6 @@ class CannonTower(Tower):
         # Finalize initialization to update base stats
         self.finalize_initialization()
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        # Cannot target flying enemies
-        if hasattr(enemy, 'flying') and enemy.flying and not self.can_target_flying:
-            return False
-            
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-            
-        return True
-    
     def acquire_target(self, enemies):
         """Find target - prioritize groups of enemies"""
         valid_targets = []
@@ -46,13 +35,7 @@ class CannonTower(Tower):
             distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
             if distance <= self.range and self.can_target_enemy(enemy):
                 # Count nearby enemies for splash potential
-                nearby_count = 0
-                for other_enemy in enemies:
-                    if self.can_target_enemy(other_enemy):
-                        splash_distance = math.sqrt((enemy.x - other_enemy.x)**2 + (enemy.y - other_enemy.y)**2)
-                        if splash_distance <= self.splash_radius:
-                            nearby_count += 1
-                
+                nearby_count = self.count_neighbors(enemy, enemies, self.splash_radius)
                 valid_targets.append((enemy, distance, nearby_count))
         
         if valid_targets:
@@ -118,24 +101,13 @@ class CannonTower(Tower):
             self.target = None
             return
         
-        range_squared = self.range * self.range
         valid_targets = []
         
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
+        for enemy, distance_squared in self.get_enemies_in_range(enemies):
+            if self.can_target_enemy(enemy):
                 actual_distance = math.sqrt(distance_squared)
-                # Count nearby enemies for splash potential
-                nearby_count = 0
-                for other_enemy in enemies:
-                    if self.can_target_enemy(other_enemy):
-                        splash_distance = math.sqrt((enemy.x - other_enemy.x)**2 + (enemy.y - other_enemy.y)**2)
-                        if splash_distance <= self.splash_radius:
-                            nearby_count += 1
-                
+                # Count nearby enemies for splash potential (shared by all towers this tick)
+                nearby_count = self.count_neighbors(enemy, enemies, self.splash_radius)
                 valid_targets.append((enemy, actual_distance, nearby_count))
         
         if valid_targets:
@@ -165,6 +137,10 @@ class CannonTower(Tower):
 
 class ExplosiveCannonball:
     """Explosive cannonball projectile with AOE damage"""
+    __slots__ = ('x', 'y', 'speed', 'damage', 'splash_radius', 'splash_damage', 'color', 'dx', 'dy',
+                 'active', 'should_remove', 'source_tower_id')
+    
+    update_protocol = 'plain'  # update() - see game_systems.dispatch
     
     def __init__(self, x, y, target_x, target_y, speed, damage, splash_radius, splash_damage):
         self.x = x
@@ -213,34 +189,22 @@ class ExplosiveCannonball:
         for enemy in enemies:
             distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
             if distance <= 10:  # Direct hit
-                total_damage = 0
-                # Damage all enemies in splash radius
-                for enemy_in_range in enemies:
-                    explosion_distance = math.sqrt((enemy_in_range.x - self.x)**2 + (enemy_in_range.y - self.y)**2)
-                    if explosion_distance <= self.splash_radius:
-                        if explosion_distance < 15:  # Direct hit
-                            damage_dealt = enemy_in_range.take_damage(self.damage)
-                        else:  # Splash damage
-                            damage_dealt = enemy_in_range.take_damage(self.splash_damage)
-                        total_damage += damage_dealt
-                
-                self.active = False
-                self.should_remove = True
-                return {'hit': True, 'damage': total_damage, 'tower_id': getattr(self, 'source_tower_id', None)}
+                outcome = self.explode(enemies)
+                if outcome is None:
+                    # Queued - the area-effect service credits the tower when it resolves
+                    return {'hit': False, 'damage': 0, 'tower_id': None}
+                return {'hit': True, 'damage': outcome[1], 'tower_id': getattr(self, 'source_tower_id', None)}
         
         return {'hit': False, 'damage': 0, 'tower_id': None}
                 
     def explode(self, enemies):
-        """Create explosion and damage nearby enemies"""
-        # Damage all enemies in splash radius
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance <= self.splash_radius:
-                # Direct hit gets full damage, splash gets reduced damage
-                if distance < 15:  # Direct hit
-                    enemy.take_damage(self.damage)
-                else:  # Splash damage
-                    enemy.take_damage(self.splash_damage)
+        """Create explosion and damage nearby enemies, returns (enemies hit, damage) or None if queued"""
+        # Direct hit (within 15) gets full damage, splash gets reduced damage
+        outcome = get_area_effects().explode(
+            enemies, self.x, self.y, self.splash_radius,
+            DamageProfile(self.damage, inner_radius=15, outer_damage=self.splash_damage),
+            tower_id=getattr(self, 'source_tower_id', None))
         
         self.active = False
-        self.should_remove = True
\ No newline at end of file
+        self.should_remove = True
+        return outcome
\ No newline at end of file
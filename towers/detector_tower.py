@@ -1,10 +1,13 @@
 from .tower import Tower
 from config.game_config import get_balance_config
+from game_systems.visibility import get_visibility
 import pygame
 import math
 
 class DetectorTower(Tower):
     """Support tower that reveals invisible enemies to other towers and generates currency from detection - does not attack"""
+    __slots__ = ('detection_range', 'detected_enemies', 'detection_pulse_timer', 'max_detections',
+                 'currency_timer', 'last_detected_count')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'detector')
@@ -34,115 +37,27 @@ class DetectorTower(Tower):
         # Update detection pulse
         self.detection_pulse_timer += 0.1
         
-        # Clear all previously detected enemies first
-        for enemy in self.detected_enemies:
-            if hasattr(enemy, 'detected_by_detector'):
-                enemy.detected_by_detector = False
-        
         # Detect invisible enemies and make them targetable by other towers (max 3)
-        self.detected_enemies.clear()
-        invisible_in_range = []
-        
-        # Find all invisible enemies in range
-        invisible_count = 0
-        for enemy in enemies:
-            if hasattr(enemy, 'invisible') and enemy.invisible:
-                invisible_count += 1
-                distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-                if distance <= self.detection_range:
-                    invisible_in_range.append((enemy, distance))
-        
-        # Sort by distance and take only the closest 3
-        invisible_in_range.sort(key=lambda x: x[1])
-        detected_count = 0
-        
-        for enemy, distance in invisible_in_range:
-            if detected_count < self.max_detections:
-                self.detected_enemies.add(enemy)
-                # Mark enemy as detected so other towers can target it
-                enemy.detected_by_detector = True
-                detected_count += 1
+        self.detected_enemies = set(get_visibility().detect(self, enemies))
         
         # Generate currency based on detection
-        self.generate_detection_currency(detected_count)
+        self.generate_detection_currency(len(self.detected_enemies))
     
     def update_with_speed(self, enemies, projectiles, speed_multiplier):
         """Update with speed multiplier support"""
-        # Update detection pulse with speed
-        self.detection_pulse_timer += 0.1 * speed_multiplier
-        
-        # Clear all previously detected enemies first
-        for enemy in self.detected_enemies:
-            if hasattr(enemy, 'detected_by_detector'):
-                enemy.detected_by_detector = False
-        
-        # Detect invisible enemies and make them targetable by other towers (max 3)
-        self.detected_enemies.clear()
-        invisible_in_range = []
-        
-        # Find all invisible enemies in range
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance <= self.detection_range:
-                if hasattr(enemy, 'invisible') and enemy.invisible:
-                    invisible_in_range.append((enemy, distance))
-        
-        # Sort by distance and take only the closest 3
-        invisible_in_range.sort(key=lambda x: x[1])
-        detected_count = 0
-        
-        for enemy, distance in invisible_in_range:
-            if detected_count < self.max_detections:
-                self.detected_enemies.add(enemy)
-                # Mark enemy as detected so other towers can target it
-                enemy.detected_by_detector = True
-                detected_count += 1
-        
-        # Generate currency based on detection (adjusted for speed)
-        self.generate_detection_currency_with_speed(detected_count, speed_multiplier)
+        self.update_with_speed_optimized(enemies, projectiles, speed_multiplier)
     
     def update_with_speed_optimized(self, enemies, projectiles, speed_multiplier: float):
         """Update with speed multiplier and performance optimizations"""
         # Update detection pulse with speed
         self.detection_pulse_timer += 0.1 * speed_multiplier
         
-        # Clear all previously detected enemies first
-        for enemy in self.detected_enemies:
-            if hasattr(enemy, 'detected_by_detector'):
-                enemy.detected_by_detector = False
-        
-        # Detect invisible enemies and make them targetable by other towers (max 3)
-        self.detected_enemies.clear()
-        invisible_in_range = []
-        
-        # Find all invisible enemies in range (optimized)
-        range_squared = self.detection_range * self.detection_range
-        invisible_count = 0
-        
-        for enemy in enemies:
-            if hasattr(enemy, 'invisible') and enemy.invisible:
-                invisible_count += 1
-                dx = enemy.x - self.x
-                dy = enemy.y - self.y
-                distance_squared = dx * dx + dy * dy
-                
-                if distance_squared <= range_squared:
-                    actual_distance = math.sqrt(distance_squared)
-                    invisible_in_range.append((enemy, actual_distance))
-        
-        # Sort by distance and take only the closest 3
-        invisible_in_range.sort(key=lambda x: x[1])
-        detected_count = 0
-        
-        for enemy, distance in invisible_in_range:
-            if detected_count < self.max_detections:
-                self.detected_enemies.add(enemy)
-                # Mark enemy as detected so other towers can target it
-                enemy.detected_by_detector = True
-                detected_count += 1
+        # Detect invisible enemies and make them targetable by other towers (max 3) - the
+        # visibility service only looks at invisible enemies near a detector range boundary
+        self.detected_enemies = set(get_visibility().detect(self, enemies))
         
         # Generate currency based on detection (adjusted for speed)
-        self.generate_detection_currency_with_speed(detected_count, speed_multiplier)
+        self.generate_detection_currency_with_speed(len(self.detected_enemies), speed_multiplier)
     
     def generate_detection_currency_with_speed(self, detected_count, speed_multiplier):
         """Generate currency based on detected enemies with speed multiplier"""
@@ -1,9 +1,11 @@
 from .tower import Tower
 import pygame
 import math
+from game_systems.area_effects import get_area_effects, DamageProfile
 
 class ExplosiveTower(Tower):
     """Tower that fires explosive rockets with large splash damage"""
+    __slots__ = ('splash_radius', 'splash_damage')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'explosive')
@@ -22,38 +24,6 @@ class ExplosiveTower(Tower):
         self.can_target_flying = False
         self.can_target_invisible = False
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        if hasattr(enemy, 'flying') and enemy.flying and not self.can_target_flying:
-            return False
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-        return True
-    
-    def acquire_target(self, enemies):
-        """Find target using targeting restrictions"""
-        valid_targets = []
-        
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance <= self.range and self.can_target_enemy(enemy):
-                valid_targets.append((enemy, distance))
-        
-        if not valid_targets:
-            self.target = None
-            return
-        
-        # Target closest to end of path
-        self.target = max(valid_targets, key=lambda x: x[0].get_distance_from_start())[0]
-        
-        # Calculate angle to target
-        if self.target:
-            dx = self.target.x - self.x
-            dy = self.target.y - self.y
-            self.angle = math.atan2(dy, dx)
-    
     def shoot(self, projectiles):
         """Fire explosive rocket"""
         if self.target:
@@ -89,38 +59,6 @@ class ExplosiveTower(Tower):
 
 
 
-    def acquire_target_optimized(self, enemies):
-        """Optimized targeting with restrictions"""
-        if not enemies:
-            self.target = None
-            return
-        
-        range_squared = self.range * self.range
-        valid_targets = []
-        
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
-                actual_distance = math.sqrt(distance_squared)
-                valid_targets.append((enemy, actual_distance))
-                if len(valid_targets) >= 10:
-                    break
-        
-        if not valid_targets:
-            self.target = None
-            return
-        
-        # Target closest to end of path (default strategy)
-        self.target = max(valid_targets, key=lambda x: x[0].get_distance_from_start())[0]
-        
-        if self.target:
-            dx = self.target.x - self.x
-            dy = self.target.y - self.y
-            self.angle = math.atan2(dy, dx)
-    
     def update_with_speed_optimized(self, enemies, projectiles, speed_multiplier: float):
         """Update with speed multiplier and targeting restrictions"""
         self.acquire_target_optimized(enemies)
@@ -133,6 +71,10 @@ class ExplosiveTower(Tower):
             self.fire_timer -= speed_multiplier
 class ExplosiveRocket:
     """Explosive rocket projectile with massive AOE damage"""
+    __slots__ = ('x', 'y', 'speed', 'damage', 'splash_radius', 'splash_damage', 'color', 'dx', 'dy',
+                 'active', 'should_remove', 'trail_positions', 'source_tower_id')
+    
+    update_protocol = 'plain'  # update() - see game_systems.dispatch
     
     def __init__(self, x, y, target_x, target_y, speed, damage, splash_radius, splash_damage):
         self.x = x
@@ -194,34 +136,22 @@ class ExplosiveRocket:
         for enemy in enemies:
             distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
             if distance <= 12:  # Direct hit
-                total_damage = 0
-                # Damage all enemies in splash radius
-                for enemy_in_range in enemies:
-                    explosion_distance = math.sqrt((enemy_in_range.x - self.x)**2 + (enemy_in_range.y - self.y)**2)
-                    if explosion_distance <= self.splash_radius:
-                        if explosion_distance < 20:  # Direct hit
-                            damage_dealt = enemy_in_range.take_damage(self.damage)
-                        else:  # Splash damage
-                            damage_dealt = enemy_in_range.take_damage(self.splash_damage)
-                        total_damage += damage_dealt
-                
-                self.active = False
-                self.should_remove = True
-                return {'hit': True, 'damage': total_damage, 'tower_id': getattr(self, 'source_tower_id', None)}
+                outcome = self.explode(enemies)
+                if outcome is None:
+                    # Queued - the area-effect service credits the tower when it resolves
+                    return {'hit': False, 'damage': 0, 'tower_id': None}
+                return {'hit': True, 'damage': outcome[1], 'tower_id': getattr(self, 'source_tower_id', None)}
         
         return {'hit': False, 'damage': 0, 'tower_id': None}
                 
     def explode(self, enemies):
-        """Create massive explosion and damage all nearby enemies"""
-        # Damage all enemies in splash radius
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance <= self.splash_radius:
-                # Direct hit gets full damage, splash gets reduced damage
-                if distance < 20:  # Direct hit
-                    enemy.take_damage(self.damage)
-                else:  # Splash damage
-                    enemy.take_damage(self.splash_damage)
+        """Create massive explosion and damage all nearby enemies, returns (enemies hit, damage) or None if queued"""
+        # Direct hit (within 20) gets full damage, splash gets reduced damage
+        outcome = get_area_effects().explode(
+            enemies, self.x, self.y, self.splash_radius,
+            DamageProfile(self.damage, inner_radius=20, outer_damage=self.splash_damage),
+            tower_id=getattr(self, 'source_tower_id', None))
         
         self.active = False
         self.should_remove = True
+        return outcome
@@ -1,10 +1,14 @@
 from .tower import Tower
 import pygame
 import math
-import random
+from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
+from game_systems.spatial_grid import sector_hits
+from game_systems.status_effects import get_status_effects
+from enemies.immunities import BURN
 
 class FlameTower(Tower):
     """Tower that shoots flamethrower in a cone, causing burn damage over time"""
+    __slots__ = ('cone_angle', 'burn_damage', 'burn_duration', 'flame_particles')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'flame')
@@ -25,20 +29,6 @@ class FlameTower(Tower):
         self.can_target_flying = False
         self.can_target_invisible = False
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        # Cannot target flying enemies
-        if hasattr(enemy, 'flying') and enemy.flying and not self.can_target_flying:
-            return False
-            
-        # Cannot target invisible enemies
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-            
-        return True
-    
     def acquire_target(self, enemies):
         """Find closest target"""
         valid_targets = []
@@ -72,39 +62,22 @@ class FlameTower(Tower):
         if not self.target:
             return 0
             
-        # Find all enemies in flame cone
+        # Find all enemies in flame cone (only cells the cone overlaps when indexed)
         cone_angle_rad = math.radians(self.cone_angle / 2)
+        if self.spatial_index is not None and self.spatial_index.covers(enemies):
+            in_cone = self.spatial_index.query_sector(self.x, self.y, self.angle, cone_angle_rad, self.range)
+        else:
+            in_cone = sector_hits(enumerate(enemies), self.x, self.y, self.angle, cone_angle_rad, self.range)
         total_damage = 0
         
-        for enemy in enemies:
-            if not self.can_target_enemy(enemy):
-                continue
-                
-            # Check if enemy is in range
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance > self.range:
-                continue
-            
-            # Check if enemy is in cone
-            enemy_angle = math.atan2(enemy.y - self.y, enemy.x - self.x)
-            angle_diff = abs(enemy_angle - self.angle)
-            
-            # Handle angle wraparound
-            if angle_diff > math.pi:
-                angle_diff = 2 * math.pi - angle_diff
-            
-            if angle_diff <= cone_angle_rad:
+        for enemy in in_cone:
+            if self.can_target_enemy(enemy):
                 # Apply immediate damage with tower type
                 actual_damage = enemy.take_damage(self.damage, 'flame')
                 total_damage += actual_damage
                 
-                # Apply burn effect
-                if not hasattr(enemy, 'burn_timer'):
-                    enemy.burn_timer = 0
-                    enemy.burn_damage = 0
-                
-                enemy.burn_timer = self.burn_duration
-                enemy.burn_damage = self.burn_damage
+                # Apply burn effect (ticked once per game tick by the status-effect engine)
+                get_status_effects().apply(enemy, BURN, self.burn_duration, self.burn_damage, source=self)
         
         # Create visual flame particles
         self.create_flame_particles()
@@ -112,19 +85,22 @@ class FlameTower(Tower):
     
     def create_flame_particles(self):
         """Create flame particle effects"""
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         cone_angle_rad = math.radians(self.cone_angle / 2)
         
         for i in range(8):  # Create multiple particles
             # Random angle within cone
-            particle_angle = self.angle + random.uniform(-cone_angle_rad, cone_angle_rad)
-            particle_distance = random.uniform(20, self.range)
+            particle_angle = self.angle + rng.uniform(-cone_angle_rad, cone_angle_rad)
+            particle_distance = rng.uniform(20, self.range)
             
             particle_x = self.x + math.cos(particle_angle) * particle_distance
             particle_y = self.y + math.sin(particle_angle) * particle_distance
             
             # Random flame color
             colors = [(255, 69, 0), (255, 140, 0), (255, 215, 0), (255, 0, 0)]
-            color = random.choice(colors)
+            color = rng.choice(colors)
             
             self.flame_particles.append({
                 'x': particle_x,
@@ -146,7 +122,7 @@ class FlameTower(Tower):
         if self.target and self.fire_timer <= 0:
             damage_dealt = self.spray_flames(enemies)
             if damage_dealt > 0:
-                self.add_damage_dealt(damage_dealt)
+                self.report_damage(damage_dealt)
             
             # Generate currency immediately when firing
             self.generate_firing_currency()
@@ -158,19 +134,6 @@ class FlameTower(Tower):
             particle['life'] -= 1
             if particle['life'] <= 0:
                 self.flame_particles.remove(particle)
-        
-        # Update burn effects on enemies
-        burn_damage_dealt = 0
-        for enemy in enemies:
-            if hasattr(enemy, 'burn_timer') and enemy.burn_timer > 0:
-                enemy.burn_timer -= 1
-                if enemy.burn_timer % 20 == 0:  # Every 1/3 second
-                    actual_burn_damage = enemy.take_damage(enemy.burn_damage, 'flame')
-                    burn_damage_dealt += actual_burn_damage
-        
-        # Track burn damage
-        if burn_damage_dealt > 0:
-            self.add_damage_dealt(burn_damage_dealt)
     
     def update_with_speed(self, enemies, projectiles, speed_multiplier: float):
         """Update flame tower with speed multiplier for performance optimization"""
@@ -185,7 +148,7 @@ class FlameTower(Tower):
         if self.target and self.fire_timer <= 0:
             damage_dealt = self.spray_flames(enemies)
             if damage_dealt > 0:
-                self.add_damage_dealt(damage_dealt)
+                self.report_damage(damage_dealt)
             
             # Generate currency immediately when firing
             self.generate_firing_currency()
@@ -197,21 +160,6 @@ class FlameTower(Tower):
             particle['life'] -= speed_multiplier
             if particle['life'] <= 0:
                 self.flame_particles.remove(particle)
-        
-        # Update burn effects on enemies with speed multiplier
-        burn_damage_dealt = 0
-        for enemy in enemies:
-            if hasattr(enemy, 'burn_timer') and enemy.burn_timer > 0:
-                enemy.burn_timer -= speed_multiplier
-                # Apply burn damage based on speed - ensure consistent damage rate
-                burn_ticks = int(speed_multiplier)
-                if enemy.burn_timer % 20 <= burn_ticks:  # Every 1/3 second
-                    actual_burn_damage = enemy.take_damage(enemy.burn_damage, 'flame')
-                    burn_damage_dealt += actual_burn_damage
-        
-        # Track burn damage
-        if burn_damage_dealt > 0:
-            self.add_damage_dealt(burn_damage_dealt)
     
     def update_with_speed_optimized(self, enemies, projectiles, speed_multiplier: float):
         """Update flame tower with speed multiplier and optimizations"""
@@ -226,7 +174,7 @@ class FlameTower(Tower):
         if self.target and self.fire_timer <= 0:
             damage_dealt = self.spray_flames(enemies)
             if damage_dealt > 0:
-                self.add_damage_dealt(damage_dealt)
+                self.report_damage(damage_dealt)
             
             # Generate currency immediately when firing
             self.generate_firing_currency()
@@ -238,21 +186,6 @@ class FlameTower(Tower):
             particle['life'] -= speed_multiplier
             if particle['life'] <= 0:
                 self.flame_particles.remove(particle)
-        
-        # Update burn effects on enemies with speed multiplier
-        burn_damage_dealt = 0
-        for enemy in enemies:
-            if hasattr(enemy, 'burn_timer') and enemy.burn_timer > 0:
-                enemy.burn_timer -= speed_multiplier
-                # Apply burn damage based on speed - ensure consistent damage rate
-                burn_ticks = int(speed_multiplier)
-                if enemy.burn_timer % 20 <= burn_ticks:  # Every 1/3 second
-                    actual_burn_damage = enemy.take_damage(enemy.burn_damage, 'flame')
-                    burn_damage_dealt += actual_burn_damage
-        
-        # Track burn damage
-        if burn_damage_dealt > 0:
-            self.add_damage_dealt(burn_damage_dealt)
     
     def acquire_target_optimized(self, enemies):
         """Optimized targeting for flame tower using squared distance"""
@@ -260,16 +193,11 @@ class FlameTower(Tower):
             self.target = None
             return
         
-        range_squared = self.range * self.range
         valid_targets = []
         
-        # Use squared distance for initial filtering (avoids sqrt)
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
+        # Range query uses the per-tick spatial index when available
+        for enemy, distance_squared in self.get_enemies_in_range(enemies):
+            if self.can_target_enemy(enemy):
                 # Only calculate actual distance for valid targets
                 actual_distance = math.sqrt(distance_squared)
                 valid_targets.append((enemy, actual_distance))
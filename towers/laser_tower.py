@@ -1,9 +1,12 @@
 from .tower import Tower
 import pygame
 import math
+from game_systems.spatial_grid import beam_hits
 
 class LaserTower(Tower):
     """Tower that fires continuous laser beam through multiple GROUND enemies only"""
+    __slots__ = ('laser_width', 'laser_duration', 'laser_timer', 'laser_target', 'laser_end_point',
+                 'charging', 'charge_time', 'charge_timer')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'laser')
@@ -89,19 +92,6 @@ class LaserTower(Tower):
                 self.charging = False
                 self.charge_timer = 0
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        # Can target flying enemies
-        if hasattr(enemy, 'flying') and enemy.flying and not self.can_target_flying:
-            return False
-            
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-            
-        return True
-    
     def acquire_target(self, enemies):
         """Find target for laser - GROUND ENEMIES ONLY"""
         targets_in_range = []
@@ -130,19 +120,12 @@ class LaserTower(Tower):
             self.target = None
             return
         
-        range_squared = self.range * self.range
         targets_in_range = []
         
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
+        for enemy, distance_squared in self.get_enemies_in_range(enemies):
+            if self.can_target_enemy(enemy):
                 actual_distance = math.sqrt(distance_squared)
                 targets_in_range.append((enemy, actual_distance))
-                if len(targets_in_range) >= 10:
-                    break
         
         if targets_in_range:
             # Target enemy with most health
@@ -184,31 +167,16 @@ class LaserTower(Tower):
             dx /= distance
             dy /= distance
             
-            # Find all enemies in laser path
+            # Find all enemies in laser path, nearest first (only cells the beam crosses when indexed)
             laser_length = self.range
-            hit_enemies = []
-            
-            for enemy in enemies:
-                # Only hit enemies we can target
-                if not self.can_target_enemy(enemy):
-                    continue
-                    
-                # Check if enemy is in laser path
-                enemy_dx = enemy.x - self.x
-                enemy_dy = enemy.y - self.y
-                enemy_distance = math.sqrt(enemy_dx**2 + enemy_dy**2)
-                
-                if enemy_distance <= laser_length:
-                    # Calculate perpendicular distance from laser line
-                    cross_product = abs(enemy_dx * dy - enemy_dy * dx)
-                    if cross_product <= self.laser_width:
-                        # Check if enemy is in front of tower
-                        dot_product = enemy_dx * dx + enemy_dy * dy
-                        if dot_product > 0:
-                            hit_enemies.append((enemy, enemy_distance))
+            if self.spatial_index is not None and self.spatial_index.covers(enemies):
+                in_beam = self.spatial_index.query_beam(self.x, self.y, dx, dy, laser_length, self.laser_width)
+            else:
+                in_beam = beam_hits(enumerate(enemies), self.x, self.y, dx, dy, laser_length, self.laser_width)
+            # Only hit enemies we can target
+            hit_enemies = [(enemy, distance) for enemy, distance in in_beam if self.can_target_enemy(enemy)]
             
-            # Sort by distance and apply damage
-            hit_enemies.sort(key=lambda x: x[1])
+            # Apply damage in pierce order
             total_damage_dealt = 0
             for enemy, _ in hit_enemies:
                 actual_damage = enemy.take_damage(self.damage, self.tower_type)
@@ -220,7 +188,7 @@ class LaserTower(Tower):
             
             # Track damage for currency generation
             if total_damage_dealt > 0:
-                self.add_damage_dealt(total_damage_dealt)
+                self.report_damage(total_damage_dealt)
             
             # Generate currency immediately when firing
             self.generate_firing_currency()
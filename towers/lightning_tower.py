@@ -1,10 +1,13 @@
 from .tower import Tower
 import pygame
 import math
-import random
+from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
 
 class LightningTower(Tower):
     """Tower that chains lightning between enemies"""
+    __slots__ = ('chain_count', 'chain_range', 'lightning_timer', 'lightning_duration', 'chain_sequence',
+                 'charging_timer', 'charging_duration', 'spark_effects', 'screen_flash_timer',
+                 'potential_chain')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'lightning')
@@ -33,15 +36,6 @@ class LightningTower(Tower):
         self.can_target_flying = True
         self.can_target_invisible = False
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-            
-        return True
-    
     def acquire_target(self, enemies):
         """Find target - prioritize enemies with many nearby targets for chaining"""
         valid_targets = []
@@ -50,13 +44,7 @@ class LightningTower(Tower):
             distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
             if distance <= self.range and self.can_target_enemy(enemy):
                 # Count nearby enemies for chain potential
-                nearby_count = 0
-                for other_enemy in enemies:
-                    if self.can_target_enemy(other_enemy) and other_enemy != enemy:
-                        chain_distance = math.sqrt((enemy.x - other_enemy.x)**2 + (enemy.y - other_enemy.y)**2)
-                        if chain_distance <= self.chain_range:
-                            nearby_count += 1
-                
+                nearby_count = self.count_neighbors(enemy, enemies, self.chain_range)
                 valid_targets.append((enemy, distance, nearby_count))
         
         if valid_targets:
@@ -83,24 +71,33 @@ class LightningTower(Tower):
         pass
     
     def build_chain_sequence(self, enemies, start_enemy):
-        """Build the complete chain sequence for visual effects"""
+        """Build the complete chain sequence, each hop going to the closest enemy not yet hit"""
+        if self.spatial_index is not None and self.spatial_index.covers(enemies):
+            # Greedy nearest-hop search over the per-tick spatial index
+            return self.spatial_index.nearest_chain(start_enemy, self.chain_count, self.chain_range,
+                                                    self.can_target_flying, self.can_target_invisible)
+        
         chain_sequence = [start_enemy]
         hit_enemies = {start_enemy}
         current_enemy = start_enemy
+        chain_range_squared = self.chain_range * self.chain_range
         
         # Build the chain
         for _ in range(self.chain_count - 1):
-            next_targets = []
+            next_enemy = None
+            closest_distance_squared = chain_range_squared
             for enemy in enemies:
                 if enemy not in hit_enemies and self.can_target_enemy(enemy):
-                    distance = math.sqrt((current_enemy.x - enemy.x)**2 + (current_enemy.y - enemy.y)**2)
-                    if distance <= self.chain_range:
-                        next_targets.append((enemy, distance))
+                    dx = current_enemy.x - enemy.x
+                    dy = current_enemy.y - enemy.y
+                    distance_squared = dx * dx + dy * dy
+                    # Chain to closest enemy (the first one found on ties)
+                    if distance_squared <= closest_distance_squared and (
+                            next_enemy is None or distance_squared < closest_distance_squared):
+                        next_enemy = enemy
+                        closest_distance_squared = distance_squared
             
-            if next_targets:
-                # Chain to closest enemy
-                next_targets.sort(key=lambda x: x[1])
-                next_enemy = next_targets[0][0]
+            if next_enemy is not None:
                 chain_sequence.append(next_enemy)
                 hit_enemies.add(next_enemy)
                 current_enemy = next_enemy
@@ -144,14 +141,18 @@ class LightningTower(Tower):
         """Create spark particle effects"""
         self.spark_effects = []
         
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
+
         # Add sparks around tower
         for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(10, 20)
+            angle = rng.uniform(0, 2 * math.pi)
+            distance = rng.uniform(10, 20)
             spark_x = self.x + math.cos(angle) * distance
             spark_y = self.y + math.sin(angle) * distance
-            velocity_x = random.uniform(-2, 2)
-            velocity_y = random.uniform(-2, 2)
+            velocity_x = rng.uniform(-2, 2)
+            velocity_y = rng.uniform(-2, 2)
             
             spark = {
                 'x': spark_x,
@@ -166,12 +167,12 @@ class LightningTower(Tower):
         # Add sparks around each enemy in chain
         for enemy in self.chain_sequence:
             for _ in range(6):
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(5, 15)
+                angle = rng.uniform(0, 2 * math.pi)
+                distance = rng.uniform(5, 15)
                 spark_x = enemy.x + math.cos(angle) * distance
                 spark_y = enemy.y + math.sin(angle) * distance
-                velocity_x = random.uniform(-1.5, 1.5)
-                velocity_y = random.uniform(-1.5, 1.5)
+                velocity_x = rng.uniform(-1.5, 1.5)
+                velocity_y = rng.uniform(-1.5, 1.5)
                 
                 spark = {
                     'x': spark_x,
@@ -218,7 +219,7 @@ class LightningTower(Tower):
         if self.charging_timer == 1 and self.target:  # Fire on last frame of charging
             damage_dealt = self.fire_lightning_chain(enemies)
             if damage_dealt > 0:
-                self.add_damage_dealt(damage_dealt)
+                self.report_damage(damage_dealt)
             
             # Generate currency immediately when firing
             self.generate_firing_currency()
@@ -252,7 +253,7 @@ class LightningTower(Tower):
         if self.charging_timer > 0 and self.charging_timer <= speed_multiplier and self.target:  # Fire when charging completes this frame
             damage_dealt = self.fire_lightning_chain(enemies)
             if damage_dealt > 0:
-                self.add_damage_dealt(damage_dealt)
+                self.report_damage(damage_dealt)
             
             # Generate currency immediately when firing
             self.generate_firing_currency()
@@ -292,7 +293,7 @@ class LightningTower(Tower):
         if self.charging_timer > 0 and self.charging_timer <= speed_multiplier and self.target:  # Fire when charging completes this frame
             damage_dealt = self.fire_lightning_chain(enemies)
             if damage_dealt > 0:
-                self.add_damage_dealt(damage_dealt)
+                self.report_damage(damage_dealt)
             
             # Generate currency immediately when firing
             self.generate_firing_currency()
@@ -322,35 +323,18 @@ class LightningTower(Tower):
             self.potential_chain = []
             return
         
-        range_squared = self.range * self.range
         valid_targets = []
         
-        # Use squared distance for initial filtering (avoids sqrt)
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
+        # Range query and chain potential use the per-tick spatial index when available
+        for enemy, distance_squared in self.get_enemies_in_range(enemies):
+            if self.can_target_enemy(enemy):
                 # Only calculate actual distance for valid targets
                 actual_distance = math.sqrt(distance_squared)
                 
-                # Count nearby enemies for chain potential (using squared distance)
-                nearby_count = 0
-                chain_range_squared = self.chain_range * self.chain_range
-                for other_enemy in enemies:
-                    if self.can_target_enemy(other_enemy) and other_enemy != enemy:
-                        other_dx = enemy.x - other_enemy.x
-                        other_dy = enemy.y - other_enemy.y
-                        other_distance_squared = other_dx * other_dx + other_dy * other_dy
-                        if other_distance_squared <= chain_range_squared:
-                            nearby_count += 1
+                # Count nearby enemies for chain potential (shared by all towers this tick)
+                nearby_count = self.count_neighbors(enemy, enemies, self.chain_range)
                 
                 valid_targets.append((enemy, actual_distance, nearby_count))
-                
-                # Early termination for performance
-                if len(valid_targets) >= 10:
-                    break
         
         if valid_targets:
             # Target enemy with most chain potential
@@ -371,6 +355,7 @@ class LightningTower(Tower):
     
     def draw(self, screen, selected: bool = False):
         """Draw lightning tower with enhanced effects"""
+        rng = get_cosmetic_rng()
         # Draw range circle only when selected
         if selected:
             pygame.draw.circle(screen, (200, 200, 200), (int(self.x), int(self.y)), int(self.range), 1)
@@ -416,10 +401,10 @@ class LightningTower(Tower):
         self.draw_spark_effects(screen)
         
         # Draw electrical sparks around tower
-        if random.random() < 0.2 or self.charging_timer > 0:  # More frequent when charging
+        if rng.random() < 0.2 or self.charging_timer > 0:  # More frequent when charging
             for _ in range(2 if self.charging_timer > 0 else 1):
-                spark_x = self.x + random.randint(-10, 10)
-                spark_y = self.y + random.randint(-10, 10)
+                spark_x = self.x + rng.randint(-10, 10)
+                spark_y = self.y + rng.randint(-10, 10)
                 pygame.draw.circle(screen, (255, 255, 255), (int(spark_x), int(spark_y)), 1)
         
         # Draw upgrade indicator if available
@@ -520,6 +505,7 @@ class LightningTower(Tower):
     
     def draw_lightning_bolt(self, screen, start_pos, end_pos, thickness=3):
         """Draw a jagged lightning bolt between two points"""
+        rng = get_cosmetic_rng()
         distance = math.sqrt((end_pos[0] - start_pos[0])**2 + (end_pos[1] - start_pos[1])**2)
         segments = max(3, int(distance / 20))  # More segments for longer bolts
         points = [start_pos]
@@ -531,7 +517,7 @@ class LightningTower(Tower):
         for i in range(1, segments):
             # Random deviation based on distance from endpoints
             max_deviation = min(20, distance / 10)
-            deviation = random.randint(-int(max_deviation), int(max_deviation))
+            deviation = rng.randint(-int(max_deviation), int(max_deviation))
             
             # Perpendicular offset
             perpendicular_angle = math.atan2(dy, dx) + math.pi / 2
@@ -560,7 +546,7 @@ class LightningTower(Tower):
             branch_point = points[len(points) // 2]
             branch_length = 15
             for _ in range(2):
-                branch_angle = random.uniform(0, 2 * math.pi)
+                branch_angle = rng.uniform(0, 2 * math.pi)
                 branch_end = (
                     int(branch_point[0] + math.cos(branch_angle) * branch_length),
                     int(branch_point[1] + math.sin(branch_angle) * branch_length)
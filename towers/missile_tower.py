@@ -1,9 +1,14 @@
 from .tower import Tower
 import pygame
 import math
+from game_systems.area_effects import get_area_effects, DamageProfile
+from game_systems.homing import locked_target, RETARGET_INTERVAL
+from game_systems.rng import get_cosmetic_rng, cosmetics_enabled
 
 class MissileTower(Tower):
     """Long-range tower that fires slow homing missiles with AOE damage"""
+    __slots__ = ('explosion_radius', 'explosion_damage', 'missile_count', 'charging', 'charge_timer',
+                 'charge_duration')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'missile')
@@ -28,14 +33,6 @@ class MissileTower(Tower):
         self.charge_timer = 0
         self.charge_duration = 120  # 2 second charge time
         
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-        return True
-    
     def acquire_target(self, enemies):
         """Find target - prioritize enemies with most health"""
         valid_targets = []
@@ -136,16 +133,11 @@ class MissileTower(Tower):
             self.target = None
             return
         
-        range_squared = self.range * self.range
         valid_targets = []
         
-        # Use squared distance for initial filtering (avoids sqrt)
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
+        # Range query uses the per-tick spatial index when available
+        for enemy, distance_squared in self.get_enemies_in_range(enemies):
+            if self.can_target_enemy(enemy):
                 # Only calculate actual distance for valid targets
                 actual_distance = math.sqrt(distance_squared)
                 valid_targets.append((enemy, actual_distance))
@@ -247,6 +239,12 @@ class MissileTower(Tower):
 
 class HomingMissile:
     """Homing missile projectile with AOE damage"""
+    __slots__ = ('x', 'y', 'speed', 'damage', 'explosion_radius', 'explosion_damage', 'color',
+                 'homing_strength', 'target_x', 'target_y', 'dx', 'dy', 'active', 'should_remove',
+                 'trail_positions', 'exploding', 'explosion_timer', 'explosion_duration',
+                 'explosion_particles', 'source_tower_id', 'target_enemy', 'retarget_timer', 'retarget_interval')
+    
+    update_protocol = 'enemies'  # update_with_speed(enemies, speed) - see game_systems.dispatch
     
     def __init__(self, x, y, target_x, target_y, speed, damage, explosion_radius, explosion_damage):
         self.x = x
@@ -261,6 +259,9 @@ class HomingMissile:
         self.homing_strength = 0.08  # How strongly it homes
         self.target_x = target_x
         self.target_y = target_y
+        self.target_enemy = None  # Locked target, see game_systems.homing
+        self.retarget_timer = 0
+        self.retarget_interval = RETARGET_INTERVAL
         
         # Calculate initial direction
         dx = target_x - x
@@ -294,17 +295,9 @@ class HomingMissile:
         if not self.active:
             return
             
-        # Find closest enemy to home towards
-        closest_enemy = None
-        closest_distance = float('inf')
+        # Home towards the locked target
+        closest_enemy = locked_target(self, enemies, self.dx, self.dy, 1)
         
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_enemy = enemy
-        
-        # Update target if we found a closer enemy
         if closest_enemy:
             self.target_x = closest_enemy.x
             self.target_y = closest_enemy.y
@@ -354,17 +347,9 @@ class HomingMissile:
         if not self.active:
             return
             
-        # Find closest enemy to home towards
-        closest_enemy = None
-        closest_distance = float('inf')
+        # Home towards the locked target
+        closest_enemy = locked_target(self, enemies, self.dx, self.dy, speed_multiplier)
         
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_enemy = enemy
-        
-        # Update target if we found a closer enemy
         if closest_enemy:
             self.target_x = closest_enemy.x
             self.target_y = closest_enemy.y
@@ -403,22 +388,19 @@ class HomingMissile:
             self.explode(enemies)
     
     def explode(self, enemies):
-        """Create explosion and damage nearby enemies"""
-        # Damage all enemies in explosion radius
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance <= self.explosion_radius:
-                # Direct hit gets full damage, splash gets reduced damage
-                if distance < 15:  # Direct hit
-                    enemy.take_damage(self.damage, 'missile')
-                else:  # Splash damage
-                    enemy.take_damage(self.explosion_damage, 'missile')
+        """Create explosion and damage nearby enemies, returns (enemies hit, damage) or None if queued"""
+        # Direct hit (within 15) gets full damage, splash gets reduced damage
+        outcome = get_area_effects().explode(
+            enemies, self.x, self.y, self.explosion_radius,
+            DamageProfile(self.damage, 'missile', inner_radius=15, outer_damage=self.explosion_damage),
+            tower_id=getattr(self, 'source_tower_id', None))
         
         # Start explosion animation
         self.active = False
         self.exploding = True
         self.explosion_timer = 0
         self.create_explosion_particles()
+        return outcome
     
     def draw(self, screen):
         """Draw missile with trail or explosion"""
@@ -491,41 +473,31 @@ class HomingMissile:
         for enemy in enemies:
             distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
             if distance <= 8:  # Close enough for collision
-                # Calculate total damage dealt in explosion
-                total_damage = 0
-                for enemy_in_range in enemies:
-                    explosion_distance = math.sqrt((enemy_in_range.x - self.x)**2 + (enemy_in_range.y - self.y)**2)
-                    if explosion_distance <= self.explosion_radius:
-                        if explosion_distance < 15:  # Direct hit
-                            damage_dealt = enemy_in_range.take_damage(self.damage, 'missile')
-                        else:  # Splash damage
-                            damage_dealt = enemy_in_range.take_damage(self.explosion_damage, 'missile')
-                        total_damage += damage_dealt
-                
-                # Start explosion animation instead of immediate removal
-                self.active = False
-                self.exploding = True
-                self.explosion_timer = 0
-                self.create_explosion_particles()
-                
-                return {'hit': True, 'damage': total_damage, 'tower_id': getattr(self, 'source_tower_id', None)}
+                # Explode and start the explosion animation instead of immediate removal
+                outcome = self.explode(enemies)
+                if outcome is None:
+                    # Queued - the area-effect service credits the tower when it resolves
+                    return {'hit': False, 'damage': 0, 'tower_id': None}
+                return {'hit': True, 'damage': outcome[1], 'tower_id': getattr(self, 'source_tower_id', None)}
         
         return {'hit': False, 'damage': 0, 'tower_id': None}
 
     def create_explosion_particles(self):
         """Create explosion particle effects"""
-        import random
+        if not cosmetics_enabled():
+            return
+        rng = get_cosmetic_rng()
         for _ in range(20):  # Create 20 explosion particles
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 8)
             particle = {
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
-                'life': random.randint(8, 15),
+                'life': rng.randint(8, 15),
                 'max_life': 15,
-                'size': random.randint(2, 6),
-                'color': random.choice([(255, 100, 0), (255, 150, 0), (255, 200, 0), (255, 255, 0)])
+                'size': rng.randint(2, 6),
+                'color': rng.choice([(255, 100, 0), (255, 150, 0), (255, 200, 0), (255, 255, 0)])
             }
             self.explosion_particles.append(particle) 
\ No newline at end of file
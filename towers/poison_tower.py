@@ -1,9 +1,12 @@
 from .tower import Tower
+from game_systems.status_effects import get_status_effects
+from enemies.immunities import POISON
 import pygame
 import math
 
 class PoisonTower(Tower):
     """Tower that applies poison damage over time, counters regenerating enemies"""
+    __slots__ = ('poison_damage', 'poison_duration', 'splash_radius')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'poison')
@@ -23,38 +26,6 @@ class PoisonTower(Tower):
         self.can_target_flying = False
         self.can_target_invisible = False
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        if hasattr(enemy, 'flying') and enemy.flying and not self.can_target_flying:
-            return False
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-        return True
-    
-    def acquire_target(self, enemies):
-        """Find target using targeting restrictions"""
-        valid_targets = []
-        
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance <= self.range and self.can_target_enemy(enemy):
-                valid_targets.append((enemy, distance))
-        
-        if not valid_targets:
-            self.target = None
-            return
-        
-        # Target closest to end of path
-        self.target = max(valid_targets, key=lambda x: x[0].get_distance_from_start())[0]
-        
-        # Calculate angle to target
-        if self.target:
-            dx = self.target.x - self.x
-            dy = self.target.y - self.y
-            self.angle = math.atan2(dy, dx)
-        
     def shoot(self, projectiles):
         """Shoot poison projectile"""
         if self.target:
@@ -108,38 +79,6 @@ class PoisonTower(Tower):
         self.draw_upgrade_indicator(screen)
 
 
-    def acquire_target_optimized(self, enemies):
-        """Optimized targeting with restrictions"""
-        if not enemies:
-            self.target = None
-            return
-        
-        range_squared = self.range * self.range
-        valid_targets = []
-        
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
-                actual_distance = math.sqrt(distance_squared)
-                valid_targets.append((enemy, actual_distance))
-                if len(valid_targets) >= 10:
-                    break
-        
-        if not valid_targets:
-            self.target = None
-            return
-        
-        # Target closest to end of path (default strategy)
-        self.target = max(valid_targets, key=lambda x: x[0].get_distance_from_start())[0]
-        
-        if self.target:
-            dx = self.target.x - self.x
-            dy = self.target.y - self.y
-            self.angle = math.atan2(dy, dx)
-    
     def update_with_speed_optimized(self, enemies, projectiles, speed_multiplier: float):
         """Update with speed multiplier and targeting restrictions"""
         self.acquire_target_optimized(enemies)
@@ -152,6 +91,10 @@ class PoisonTower(Tower):
             self.fire_timer -= speed_multiplier
 class PoisonProjectile:
     """Poison projectile that applies poison effect"""
+    __slots__ = ('x', 'y', 'speed', 'damage', 'color', 'poison_damage', 'poison_duration', 'splash_radius',
+                 'dx', 'dy', 'active', 'should_remove', 'source_tower_id')
+    
+    update_protocol = 'plain'  # update() - see game_systems.dispatch
     
     def __init__(self, x, y, target_x, target_y, speed, damage):
         self.x = x
@@ -211,14 +154,8 @@ class PoisonProjectile:
                 total_damage += damage_dealt
                 enemies_hit += 1
                 
-                # Apply poison effect
-                if not hasattr(enemy, 'poison_timer'):
-                    enemy.poison_timer = 0
-                    enemy.poison_damage_timer = 0
-                    
-                enemy.poison_timer = self.poison_duration
-                enemy.poison_damage = self.poison_damage
-                enemy.poison_damage_timer = 0  # Reset timer for fresh poison application
+                # Apply poison effect (toxic enemies are immune)
+                get_status_effects().apply(enemy, POISON, self.poison_duration, self.poison_damage)
                 
                 # Stop regeneration for regenerating enemies
                 if hasattr(enemy, 'last_damage_time'):
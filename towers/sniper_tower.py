@@ -4,6 +4,8 @@ from .tower import Tower
 
 class SniperTower(Tower):
     """High-range, high-damage tower with slow fire rate"""
+    __slots__ = ()
+
     def __init__(self, x: int, y: int):
         super().__init__(x, y, 'sniper')
         self.range = 200
@@ -20,16 +22,6 @@ class SniperTower(Tower):
         # Finalize initialization to update base stats
         self.finalize_initialization()
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        if hasattr(enemy, 'flying') and enemy.flying and not self.can_target_flying:
-            return False
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-        return True
-    
     def acquire_target(self, enemies: List):
         """Sniper targets the enemy with the most health"""
         valid_targets = []
@@ -73,19 +65,12 @@ class SniperTower(Tower):
             self.target = None
             return
         
-        range_squared = self.range * self.range
         valid_targets = []
         
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
+        for enemy, distance_squared in self.get_enemies_in_range(enemies):
+            if self.can_target_enemy(enemy):
                 actual_distance = math.sqrt(distance_squared)
                 valid_targets.append((enemy, actual_distance))
-                if len(valid_targets) >= 10:
-                    break
         
         if not valid_targets:
             self.target = None
@@ -4,6 +4,7 @@ import math
 
 class SplashTower(Tower):
     """Water-based tower that applies wet status - can only be placed in water"""
+    __slots__ = ('wet_duration', 'splash_radius', 'lightning_damage_multiplier', 'water_only')
     
     def __init__(self, x, y):
         super().__init__(x, y, 'splash')
@@ -26,16 +27,6 @@ class SplashTower(Tower):
         # Placement restriction
         self.water_only = True
     
-    def can_target_enemy(self, enemy):
-        """Check if this tower can target a specific enemy"""
-        if hasattr(enemy, 'flying') and enemy.flying and not self.can_target_flying:
-            return False
-        # Can target invisible enemies if they've been detected by a detector tower
-        if hasattr(enemy, 'invisible') and enemy.invisible and not self.can_target_invisible:
-            if not hasattr(enemy, 'detected_by_detector') or not enemy.detected_by_detector:
-                return False
-        return True
-    
     def acquire_target(self, enemies):
         """Find target using targeting restrictions"""
         valid_targets = []
@@ -104,38 +95,6 @@ class SplashTower(Tower):
         # Draw upgrade indicator if available
         self.draw_upgrade_indicator(screen) 
 
-    def acquire_target_optimized(self, enemies):
-        """Optimized targeting with restrictions"""
-        if not enemies:
-            self.target = None
-            return
-        
-        range_squared = self.range * self.range
-        valid_targets = []
-        
-        for enemy in enemies:
-            dx = enemy.x - self.x
-            dy = enemy.y - self.y
-            distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared and self.can_target_enemy(enemy):
-                actual_distance = math.sqrt(distance_squared)
-                valid_targets.append((enemy, actual_distance))
-                if len(valid_targets) >= 10:
-                    break
-        
-        if not valid_targets:
-            self.target = None
-            return
-        
-        # Target closest to end of path (default strategy)
-        self.target = max(valid_targets, key=lambda x: x[0].get_distance_from_start())[0]
-        
-        if self.target:
-            dx = self.target.x - self.x
-            dy = self.target.y - self.y
-            self.angle = math.atan2(dy, dx)
-    
     def update_with_speed_optimized(self, enemies, projectiles, speed_multiplier: float):
         """Update with speed multiplier and targeting restrictions"""
         self.acquire_target_optimized(enemies)
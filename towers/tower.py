@@ -1,19 +1,33 @@
 import pygame
 import math
-import uuid
+import itertools
 from typing import List, Optional, Dict
 from config.game_config import get_balance_config
 from game_systems.tower_upgrade_system import UpgradeType
+from game_systems.events import get_event_bus
+from game_systems.spatial_grid import targetable_with
+
+# Towers get a real ID from the TowerRegistry when placed; until then they
+# hold a unique negative one so currency for loose towers never collides
+_unplaced_tower_ids = itertools.count(-1, -1)
+
 
 class Tower:
     """Base class for all towers"""
+    __slots__ = ('x', 'y', 'tower_type', 'tower_id', 'grid_x', 'grid_y', 'base_range', 'base_damage',
+                 'base_fire_rate', 'projectile_speed', 'size', 'color', 'range', 'damage', 'fire_rate',
+                 'terrain_effects_applied', 'terrain_type', '_initialization_complete', 'upgrades',
+                 'fire_timer', 'target', 'angle', 'total_damage_dealt', 'map_reference',
+                 'upgrade_system_reference', 'spatial_index', 'targeting_matrix', 'can_target_flying',
+                 'can_target_invisible')
+
     def __init__(self, x: int, y: int, tower_type: str = 'basic'):
         self.x = x
         self.y = y
         self.tower_type = tower_type
         
-        # Unique identifier for currency tracking
-        self.tower_id = str(uuid.uuid4())
+        # Unique identifier for currency tracking (replaced by TowerRegistry on placement)
+        self.tower_id = next(_unplaced_tower_ids)
         
         # Grid position (will be set by tower manager)
         self.grid_x = 0
@@ -57,6 +71,12 @@ class Tower:
         # Reference to game systems (set by tower manager)
         self.map_reference = None
         self.upgrade_system_reference = None
+        self.spatial_index = None
+        self.targeting_matrix = None
+
+        # Targeting restrictions (subclasses narrow these; invisible enemies still count once detected)
+        self.can_target_flying = True
+        self.can_target_invisible = True
         
     def set_grid_position(self, grid_x: int, grid_y: int):
         """Set the grid position and apply terrain effects"""
@@ -92,6 +112,14 @@ class Tower:
         """Set reference to upgrade system for currency generation"""
         self.upgrade_system_reference = upgrade_system
     
+    def set_spatial_index_reference(self, spatial_index):
+        """Set reference to the per-tick enemy spatial index used for range queries"""
+        self.spatial_index = spatial_index
+    
+    def set_targeting_matrix_reference(self, targeting_matrix):
+        """Set reference to the per-tick tower x enemy targeting matrix"""
+        self.targeting_matrix = targeting_matrix
+    
     def apply_terrain_effects(self):
         """Apply terrain-specific effects to this tower"""
         if not self.map_reference or self.terrain_effects_applied:
@@ -189,19 +217,25 @@ class Tower:
     
     def acquire_target(self, enemies: List):
         """Find the best target based on tower's targeting strategy"""
-        valid_targets = []
-        
-        for enemy in enemies:
-            distance = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if distance <= self.range:
-                valid_targets.append((enemy, distance))
-        
-        if not valid_targets:
-            self.target = None
-            return
-        
         # Default targeting: closest to end of path
-        self.target = max(valid_targets, key=lambda x: x[0].get_distance_from_start())[0]
+        self.acquire_furthest_target(enemies)
+    
+    def can_target_enemy(self, enemy) -> bool:
+        """Check if this tower can target a specific enemy under its targeting flags"""
+        return targetable_with(enemy, self.can_target_flying, self.can_target_invisible)
+    
+    def acquire_furthest_target(self, enemies: List):
+        """Target the enemy in range that is furthest along the path"""
+        matrix = self.targeting_matrix
+        if matrix is not None and matrix.covers(self, enemies):
+            # Masked argmax over this tower's row of the per-tick matrix
+            self.target = matrix.furthest_target(self)
+        else:
+            valid_targets = [enemy for enemy, _ in self.get_enemies_in_range(enemies) if self.can_target_enemy(enemy)]
+            if valid_targets:
+                self.target = max(valid_targets, key=lambda enemy: enemy.get_distance_from_start())
+            else:
+                self.target = None
         
         # Calculate angle to target
         if self.target:
@@ -209,43 +243,55 @@ class Tower:
             dy = self.target.y - self.y
             self.angle = math.atan2(dy, dx)
     
-    def acquire_target_optimized(self, enemies: List):
-        """Optimized targeting using squared distance to avoid sqrt operations"""
-        if not enemies:
-            self.target = None
-            return
-        
-        range_squared = self.range * self.range
-        valid_targets = []
-        
-        # Use squared distance for initial filtering (avoids sqrt)
+    def get_enemies_in_range(self, enemies: List, radius: Optional[float] = None) -> List:
+        """Get (enemy, squared distance) pairs within radius (tower range by default), in list order"""
+        if radius is None:
+            radius = self.range
+        
+        matrix = self.targeting_matrix
+        if matrix is not None and matrix.covers(self, enemies):
+            in_range = matrix.query_range(self, radius)
+            if in_range is not None:
+                return in_range
+        
+        if self.spatial_index is not None and self.spatial_index.covers(enemies):
+            return self.spatial_index.query_radius(self.x, self.y, radius)
+        
+        # No index for this enemy list - fall back to a linear scan
+        radius_squared = radius * radius
+        in_range = []
         for enemy in enemies:
             dx = enemy.x - self.x
             dy = enemy.y - self.y
             distance_squared = dx * dx + dy * dy
-            
-            if distance_squared <= range_squared:
-                # Only calculate actual distance for valid targets
-                actual_distance = math.sqrt(distance_squared)
-                valid_targets.append((enemy, actual_distance))
-                
-                # Early termination: if we have enough targets, we can stop
-                # This helps when there are many enemies but we only need a few candidates
-                if len(valid_targets) >= 10:  # Reasonable limit for targeting
-                    break
-        
-        if not valid_targets:
+            if distance_squared <= radius_squared:
+                in_range.append((enemy, distance_squared))
+        return in_range
+    
+    def count_neighbors(self, enemy, enemies: List, radius: float) -> int:
+        """Count the other enemies this tower could target within radius of an enemy (splash/chain potential)"""
+        if self.spatial_index is not None and self.spatial_index.covers(enemies):
+            # Shared per-tick count for every tower with the same radius and targeting flags
+            return self.spatial_index.neighbor_count(enemy, radius, self.can_target_flying,
+                                                     self.can_target_invisible)
+        
+        radius_squared = radius * radius
+        count = 0
+        for other_enemy in enemies:
+            if other_enemy is not enemy and self.can_target_enemy(other_enemy):
+                dx = enemy.x - other_enemy.x
+                dy = enemy.y - other_enemy.y
+                if dx * dx + dy * dy <= radius_squared:
+                    count += 1
+        return count
+    
+    def acquire_target_optimized(self, enemies: List):
+        """Optimized targeting using the per-tick targeting matrix or spatial index"""
+        if not enemies:
             self.target = None
             return
         
-        # Default targeting: closest to end of path
-        self.target = max(valid_targets, key=lambda x: x[0].get_distance_from_start())[0]
-        
-        # Calculate angle to target
-        if self.target:
-            dx = self.target.x - self.x
-            dy = self.target.y - self.y
-            self.angle = math.atan2(dy, dx)
+        self.acquire_furthest_target(enemies)
     
     def generate_firing_currency(self):
         """Generate currency immediately when tower fires a projectile"""
@@ -278,6 +324,11 @@ class Tower:
         if damage > 0:
             self.total_damage_dealt += damage
     
+    def report_damage(self, damage: int):
+        """Report damage dealt directly (not through projectiles), credited when the tick's events are dispatched"""
+        if damage > 0:
+            get_event_bus().damage(self, damage)
+    
     def reset_stats_to_base(self):
         """Reset stats to base values before applying upgrades and terrain effects"""
         self.range = self.base_range